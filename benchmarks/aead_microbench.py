@@ -0,0 +1,163 @@
+"""Per-packet microbenchmark for the AEAD framing layer.
+
+Compares the legacy framing path (full ``struct.pack`` of every header field
+plus ``_build_nonce`` byte concatenation on each packet) against the
+precompiled header prefix and reusable nonce buffer used by ``core.aead``.
+Reports nanoseconds per packet for header/nonce construction alone, plus the
+full ``Sender.encrypt`` / ``Receiver.decrypt`` cost, for every AEAD token
+available in this runtime.
+
+Usage:
+    python -m benchmarks.aead_microbench --packets 20000 --payload-bytes 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.aead import (  # noqa: E402
+    HEADER_STRUCT,
+    AeadIds,
+    Receiver,
+    Sender,
+    _build_nonce,
+    _canonicalize_aead_token,
+    _instantiate_aead,
+)
+from core.config import CONFIG  # noqa: E402
+from core.suites import get_suite, header_ids_for_suite  # noqa: E402
+
+AEAD_TOKENS = ("aesgcm", "chacha20poly1305", "ascon128")
+
+
+def _per_packet_ns(fn: Callable[[int], object], packets: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for seq in range(packets):
+            fn(seq)
+        elapsed = time.perf_counter_ns() - start
+        best = min(best, elapsed / packets)
+    return round(best, 1)
+
+
+def _legacy_framing(sender: Sender) -> Callable[[int], object]:
+    ids = sender.ids
+
+    def frame(seq: int) -> object:
+        header = struct.pack(
+            HEADER_STRUCT,
+            sender.version,
+            ids.kem_id,
+            ids.kem_param,
+            ids.sig_id,
+            ids.sig_param,
+            sender.session_id,
+            seq,
+            sender.epoch,
+        )
+        return header, _build_nonce(sender.epoch, seq, sender._nonce_len)
+
+    return frame
+
+
+def bench_token(token: str, *, packets: int, payload_bytes: int, repeats: int) -> Dict[str, object]:
+    suite = get_suite(f"cs-mlkem768-{token}-mldsa65")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = os.urandom(8)
+    payload = os.urandom(payload_bytes)
+
+    def make_pair():
+        sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, aead_token=token)
+        receiver = Receiver(
+            CONFIG["WIRE_VERSION"], ids, session_id, 0, key, CONFIG["REPLAY_WINDOW"], aead_token=token
+        )
+        return sender, receiver
+
+    sender, _ = make_pair()
+    legacy_frame_ns = _per_packet_ns(_legacy_framing(sender), packets, repeats)
+
+    def current_frame(seq: int) -> object:
+        iv = sender._nonce_buf
+        iv[0] = sender.epoch
+        struct.pack_into("!Q", iv, 4, seq)
+        return sender.pack_header(seq), iv
+
+    current_frame_ns = _per_packet_ns(current_frame, packets, repeats)
+
+    best_enc = best_dec = float("inf")
+    for _ in range(repeats):
+        tx, rx = make_pair()
+        start = time.perf_counter_ns()
+        wires = [tx.encrypt(payload) for _seq in range(packets)]
+        mid = time.perf_counter_ns()
+        for wire in wires:
+            rx.decrypt(wire)
+        end = time.perf_counter_ns()
+        best_enc = min(best_enc, (mid - start) / packets)
+        best_dec = min(best_dec, (end - mid) / packets)
+
+    return {
+        "aead_token": token,
+        "payload_bytes": payload_bytes,
+        "framing_ns_before": legacy_frame_ns,
+        "framing_ns_after": current_frame_ns,
+        "encrypt_ns": round(best_enc, 1),
+        "decrypt_ns": round(best_dec, 1),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="AEAD framing per-packet microbenchmark")
+    parser.add_argument("--packets", type=int, default=20000, help="Packets per timed repetition")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Plaintext size per packet")
+    parser.add_argument("--repeats", type=int, default=5, help="Repetitions (best run is reported)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    rows: List[Dict[str, object]] = []
+    for token in AEAD_TOKENS:
+        try:
+            cipher, _nonce_len = _instantiate_aead(_canonicalize_aead_token(token), b"\x00" * 32)
+        except NotImplementedError as exc:
+            rows.append({"aead_token": token, "skipped": str(exc)})
+            continue
+        # ASCON reports which engine served it; the pure-Python one gets fewer packets.
+        backend = getattr(cipher, "backend", None)
+        packets = args.packets if backend != "python" else max(1, args.packets // 20)
+        row = bench_token(token, packets=packets, payload_bytes=args.payload_bytes, repeats=args.repeats)
+        if backend:
+            row["backend"] = backend
+        rows.append(row)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    print(f"{'token':<18}{'frame before':>14}{'frame after':>13}{'encrypt':>10}{'decrypt':>10}  (ns/packet)")
+    for row in rows:
+        if "skipped" in row:
+            print(f"{row['aead_token']:<18}skipped: {row['skipped']}")
+            continue
+        label = f"{row['aead_token']}/{row['backend']}" if "backend" in row else row["aead_token"]
+        print(
+            f"{label:<18}{row['framing_ns_before']:>14}{row['framing_ns_after']:>13}"
+            f"{row['encrypt_ns']:>10}{row['decrypt_ns']:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
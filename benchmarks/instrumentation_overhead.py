@@ -0,0 +1,126 @@
+"""Per-packet cost of the proxy's AEAD timing instrumentation levels.
+
+Replays the data-plane accounting used by ``core.async_proxy.run_proxy`` around
+``Sender.encrypt`` / ``Receiver.decrypt`` (timing decision, ``perf_counter_ns``
+pair, ``ProxyCounters.record_*`` with histogram update) at each
+``INSTRUMENTATION_LEVEL`` and reports nanoseconds per packet plus the overhead
+relative to "off".
+
+Usage:
+    python -m benchmarks.instrumentation_overhead --packets 20000 --sample-every 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.aead import AeadIds, Receiver, Sender  # noqa: E402
+from core.async_proxy import ProxyCounters, _timing_sampler  # noqa: E402
+from core.config import CONFIG  # noqa: E402
+from core.suites import get_suite, header_ids_for_suite  # noqa: E402
+
+LEVELS = ("off", "sampled", "full")
+
+
+def _run_level(level: str, *, token: str, packets: int, payload: bytes, sample_every: int) -> Dict[str, float]:
+    suite = get_suite(f"cs-mlkem768-{token}-mldsa65")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = os.urandom(8)
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, aead_token=token)
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, CONFIG["REPLAY_WINDOW"], aead_token=token)
+    every = sample_every if level == "sampled" else 1
+    counters = ProxyCounters(level, every)
+    encrypt_timing = _timing_sampler(level, every)
+    decrypt_timing = _timing_sampler(level, every)
+
+    wires: List[bytes] = []
+    start = time.perf_counter_ns()
+    for _ in range(packets):
+        counters.count("ptx_in")
+        encrypt_start_ns = time.perf_counter_ns() if next(encrypt_timing) else 0
+        wire = sender.encrypt(payload)
+        if encrypt_start_ns:
+            counters.record_encrypt(time.perf_counter_ns() - encrypt_start_ns, len(payload), len(wire))
+        wires.append(wire)
+    mid = time.perf_counter_ns()
+    for wire in wires:
+        counters.count("enc_in")
+        decrypt_start_ns = time.perf_counter_ns() if next(decrypt_timing) else 0
+        plaintext = receiver.decrypt(wire)
+        if decrypt_start_ns:
+            counters.record_decrypt_ok(time.perf_counter_ns() - decrypt_start_ns, len(wire), len(plaintext))
+    end = time.perf_counter_ns()
+
+    return {"encrypt_ns": (mid - start) / packets, "decrypt_ns": (end - mid) / packets}
+
+
+def bench(token: str, *, packets: int, payload_bytes: int, repeats: int, sample_every: int) -> List[Dict[str, object]]:
+    payload = os.urandom(payload_bytes)
+    best: Dict[str, Dict[str, float]] = {}
+    for _ in range(repeats):
+        # Interleave levels so frequency scaling and cache state hit each one alike.
+        for level in LEVELS:
+            result = _run_level(level, token=token, packets=packets, payload=payload, sample_every=sample_every)
+            current = best.setdefault(level, {"encrypt_ns": float("inf"), "decrypt_ns": float("inf")})
+            for name, value in result.items():
+                current[name] = min(current[name], value)
+
+    base = best["off"]["encrypt_ns"] + best["off"]["decrypt_ns"]
+    rows: List[Dict[str, object]] = []
+    for level in LEVELS:
+        total = best[level]["encrypt_ns"] + best[level]["decrypt_ns"]
+        rows.append(
+            {
+                "aead_token": token,
+                "level": level,
+                "sample_every": sample_every if level == "sampled" else 1,
+                "encrypt_ns": round(best[level]["encrypt_ns"], 1),
+                "decrypt_ns": round(best[level]["decrypt_ns"], 1),
+                "overhead_ns": round(total - base, 1),
+            }
+        )
+    return rows
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Proxy instrumentation level overhead benchmark")
+    parser.add_argument("--packets", type=int, default=20000, help="Packets per timed repetition")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Plaintext size per packet")
+    parser.add_argument("--repeats", type=int, default=5, help="Repetitions (best run is reported)")
+    parser.add_argument("--sample-every", type=int, default=int(CONFIG.get("INSTRUMENTATION_SAMPLE_EVERY", 64)))
+    parser.add_argument("--aead", default="aesgcm", help="AEAD token (aesgcm, chacha20poly1305, ascon128)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    rows = bench(
+        args.aead,
+        packets=args.packets,
+        payload_bytes=args.payload_bytes,
+        repeats=args.repeats,
+        sample_every=max(1, args.sample_every),
+    )
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    print(f"{'level':<14}{'encrypt':>10}{'decrypt':>10}{'overhead':>10}  (ns/packet, {args.aead})")
+    for row in rows:
+        label = row["level"] if row["level"] != "sampled" else f"sampled/{row['sample_every']}"
+        print(f"{label:<14}{row['encrypt_ns']:>10}{row['decrypt_ns']:>10}{row['overhead_ns']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
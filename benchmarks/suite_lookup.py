@@ -0,0 +1,85 @@
+"""Cost of resolving a suite dict back to its suite_id across the whole registry.
+
+Compares the linear ``dict(s) == suite`` scan over ``core.suites.SUITES`` that
+the handshake used to run with the ``suite_id_for`` reverse index, looking up
+every registered suite, and reports nanoseconds per lookup.
+
+Usage:
+    python -m benchmarks.suite_lookup --rounds 200 --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.suites import SUITES, get_suite, suite_id_for  # noqa: E402
+
+
+def _linear_scan(suite: Dict[str, object]) -> Optional[str]:
+    return next((sid for sid, s in SUITES.items() if dict(s) == suite), None)
+
+
+METHODS: Dict[str, Callable[[Dict[str, object]], Optional[str]]] = {
+    "linear_scan": _linear_scan,
+    "suite_id_for": suite_id_for,
+}
+
+
+def bench(*, rounds: int, repeats: int) -> List[Dict[str, object]]:
+    suites = [get_suite(suite_id) for suite_id in SUITES]
+    for method in METHODS.values():
+        # Both methods must resolve every suite, or the timing means nothing.
+        assert [method(suite) for suite in suites] == [suite["suite_id"] for suite in suites]
+
+    best: Dict[str, float] = {}
+    for _ in range(repeats):
+        for name, method in METHODS.items():
+            start = time.perf_counter_ns()
+            for _ in range(rounds):
+                for suite in suites:
+                    method(suite)
+            per_lookup = (time.perf_counter_ns() - start) / (rounds * len(suites))
+            best[name] = min(best.get(name, float("inf")), per_lookup)
+
+    base = best["linear_scan"]
+    return [
+        {
+            "method": name,
+            "registry_size": len(suites),
+            "ns_per_lookup": round(value, 1),
+            "speedup_vs_scan": round(base / value, 1) if value else None,
+        }
+        for name, value in best.items()
+    ]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Suite dict -> suite_id lookup benchmark")
+    parser.add_argument("--rounds", type=int, default=200, help="Passes over the registry per repetition")
+    parser.add_argument("--repeats", type=int, default=5, help="Repetitions (best run is reported)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    rows = bench(rounds=args.rounds, repeats=args.repeats)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        for row in rows:
+            print(
+                f"{row['method']:>13}: {row['ns_per_lookup']:>10.1f} ns/lookup "
+                f"(x{row['speedup_vs_scan']} vs scan, {row['registry_size']} suites)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
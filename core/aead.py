@@ -6,8 +6,10 @@ deterministic 96-bit counter IVs, sliding replay window, and epoch support for r
 """
 
 import struct
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 try:
@@ -16,11 +18,7 @@ except ImportError:  # pragma: no cover - ChaCha unavailable on very old crypto
     ChaCha20Poly1305 = None
 from cryptography.exceptions import InvalidTag
 
-try:  # Optional dependency installed in gcs-env for PQC evaluation
-    import ascon  # type: ignore
-except ImportError:  # pragma: no cover - ASCON not installed
-    ascon = None
-
+from .ascon_aead import ascon_cipher
 from .config import CONFIG
 from .suites import header_ids_for_suite
 
@@ -49,29 +47,40 @@ class SequenceOverflow(Exception):
 # Constants
 HEADER_STRUCT = "!BBBBB8sQB"
 HEADER_LEN = 22
+# Precompiled layouts: the first 13 header bytes (version, IDs, session_id) are
+# constant per session, so only seq||epoch is packed per packet.
+_HEADER = struct.Struct(HEADER_STRUCT)
+_HEADER_PREFIX_LEN = 13
+_SEQ_EPOCH = struct.Struct("!QB")
+# Offsets of session_id (8 bytes) and epoch within the header, for routing by session.
+_SESSION_OFFSET = 5
+_EPOCH_OFFSET = 21
+_SEQ = struct.Struct("!Q")
+_SEQ_OFFSET = 13
+# Every AEAD in use (AES-GCM, ChaCha20-Poly1305, Ascon-128) appends a 16-byte tag.
+_TAG_LEN = 16
+# seq occupies the low 8 bytes of the 11-byte nonce seq field (bytes 4..11).
+_NONCE_SEQ = struct.Struct("!Q")
+_NONCE_SEQ_OFFSET = 4
+# ``Receiver.try_decrypt`` status codes; ``DECRYPT_REASONS[status]`` is the
+# matching ``last_error_reason`` string (None for success).
+DECRYPT_OK = 0
+DECRYPT_HEADER = 1
+DECRYPT_SESSION = 2
+DECRYPT_REPLAY = 3
+DECRYPT_AUTH = 4
+DECRYPT_OTHER = 5
+# Only from ``screen``: seq implausibly far beyond the replay window's high-water mark.
+DECRYPT_SEQ = 6
+DECRYPT_REASONS = (None, "header", "session", "replay", "auth", "other", "seq")
+# Payload/wire inputs may be any contiguous byte buffer so socket receive rings
+# can hand memoryview slices straight to the AEAD without intermediate copies.
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
 # IV is still logically 12 bytes (1 epoch + 11 seq bytes) but is NO LONGER transmitted on wire.
 # Wire format: header(22) || ciphertext+tag
 IV_LEN = 0  # length of IV bytes present on wire (0 after optimization)
 
 
-class _AsconCipher:
-    """Wrapper to present ASCON-128 with the cryptography AEAD interface."""
-
-    __slots__ = ("_key",)
-
-    def __init__(self, key: bytes):
-        self._key = key
-
-    def encrypt(self, nonce: bytes, data: bytes, aad: bytes) -> bytes:
-        return ascon.encrypt(self._key, nonce, aad, data)  # type: ignore[arg-type]
-
-    def decrypt(self, nonce: bytes, data: bytes, aad: bytes) -> bytes:
-        plaintext = ascon.decrypt(self._key, nonce, aad, data)  # type: ignore[arg-type]
-        if plaintext is None:
-            raise InvalidTag("ascon authentication failed")
-        return plaintext
-
-
 def _canonicalize_aead_token(token: str) -> str:
     candidate = token.lower()
     if candidate not in {"aesgcm", "chacha20poly1305", "ascon128"}:
@@ -97,11 +106,14 @@ def _instantiate_aead(token: str, key: bytes) -> Tuple[object, int]:
         return ChaCha20Poly1305(key), 12
 
     if normalized == "ascon128":
-        if ascon is None:
-            raise NotImplementedError("ascon module not installed")
         if len(key) < 16:
             raise NotImplementedError("ASCON-128 requires at least 16 bytes of key material")
-        return _AsconCipher(key[:16]), 16
+        cipher = ascon_cipher(
+            key[:16],
+            CONFIG.get("ASCON_VARIANT", "Ascon-128"),
+            CONFIG.get("ASCON_BACKEND", "auto"),
+        )
+        return cipher, 16
 
     raise NotImplementedError(f"unsupported AEAD token: {token}")
 
@@ -115,6 +127,55 @@ def _build_nonce(epoch: int, seq: int, nonce_len: int) -> bytes:
     raise NotImplementedError("nonce length must be >= 12 bytes")
 
 
+def _nonce_buffer(nonce_len: int) -> bytearray:
+    """Allocate a reusable nonce buffer laid out as epoch(1) || seq(11) || zero pad."""
+    if nonce_len < 12:
+        raise NotImplementedError("nonce length must be >= 12 bytes")
+    return bytearray(nonce_len)
+
+
+def _warm_up_cipher(cipher, nonce_len: int) -> None:
+    """Run one throwaway encrypt/decrypt so lazy backend setup happens off the hot path.
+
+    The nonce sets the top byte of the 11-byte seq field, which wire nonces never
+    use (seq is a uint64 written at offset 4), so it cannot collide with a packet
+    nonce; the output is discarded.
+    """
+    nonce = bytearray(nonce_len)
+    nonce[1] = 0xFF
+    aad = bytes(HEADER_LEN)
+    sealed = cipher.encrypt(nonce, b"\x00", aad)
+    cipher.decrypt(nonce, sealed, aad)
+
+
+def _header_prefix(version: int, ids: "AeadIds", session_id: bytes) -> bytes:
+    """Return the constant 13-byte header prefix (version, crypto IDs, session_id)."""
+    return _HEADER.pack(
+        version, ids.kem_id, ids.kem_param, ids.sig_id, ids.sig_param, session_id, 0, 0
+    )[:_HEADER_PREFIX_LEN]
+
+
+@dataclass
+class BatchResult:
+    """Per-packet outcome of ``Sender.encrypt_many`` / ``Receiver.decrypt_many``.
+
+    ``outputs[i]`` holds the wire bytes (encrypt) or plaintext (decrypt) for
+    input ``i``, or None when that packet failed; ``errors[i]`` then carries the
+    failure reason using the same vocabulary as ``Receiver.last_error_reason``.
+    """
+
+    outputs: List[Optional[bytes]] = field(default_factory=list)
+    errors: List[Optional[str]] = field(default_factory=list)
+    first_seq: int = 0
+
+    @property
+    def ok_count(self) -> int:
+        return sum(1 for reason in self.errors if reason is None)
+
+    def __len__(self) -> int:
+        return len(self.outputs)
+
+
 @dataclass(frozen=True)
 class AeadIds:
     kem_id: int
@@ -160,6 +221,8 @@ class Sender:
 
         self._aead_token = _canonicalize_aead_token(self.aead_token)
         self._cipher, self._nonce_len = _instantiate_aead(self._aead_token, self.key_send)
+        self._header_prefix = _header_prefix(self.version, self.ids, self.session_id)
+        self._nonce_buf = _nonce_buffer(self._nonce_len)
 
     @property
     def seq(self):
@@ -170,18 +233,8 @@ class Sender:
         """Pack header with given sequence number."""
         if not isinstance(seq, int) or seq < 0:
             raise NotImplementedError("seq must be non-negative int")
-        
-        return struct.pack(
-            HEADER_STRUCT,
-            self.version,
-            self.ids.kem_id,
-            self.ids.kem_param, 
-            self.ids.sig_id,
-            self.ids.sig_param,
-            self.session_id,
-            seq,
-            self.epoch
-        )
+
+        return self._header_prefix + _SEQ_EPOCH.pack(seq, self.epoch)
 
     def encrypt(self, plaintext: bytes) -> bytes:
         """Encrypt plaintext returning: header || ciphertext + tag.
@@ -189,18 +242,22 @@ class Sender:
         Deterministic IV (epoch||seq) is derived locally and NOT sent on wire to
         reduce overhead (saves 12 bytes per packet). Receiver reconstructs it.
         """
-        if not isinstance(plaintext, bytes):
-            raise NotImplementedError("plaintext must be bytes")
+        if not isinstance(plaintext, _BUFFER_TYPES):
+            raise NotImplementedError("plaintext must be bytes-like")
         
         # Check for sequence overflow - header uses uint64, so check that limit
         # Bug #6 fix: Allow full uint64 range (0 to 2^64-1)
         if self._seq >= 2**64:
             raise SequenceOverflow("packet_seq overflow; rekey/epoch bump required")
         
-        # Pack header with current sequence
-        header = self.pack_header(self._seq)
+        # Pack header with current sequence (constant prefix + seq||epoch)
+        seq = self._seq
+        epoch = self.epoch
+        header = self._header_prefix + _SEQ_EPOCH.pack(seq, epoch)
 
-        iv = _build_nonce(self.epoch, self._seq, self._nonce_len)
+        iv = self._nonce_buf
+        iv[0] = epoch & 0xFF
+        _NONCE_SEQ.pack_into(iv, _NONCE_SEQ_OFFSET, seq)
 
         try:
             ciphertext = self._cipher.encrypt(iv, plaintext, header)
@@ -213,6 +270,53 @@ class Sender:
         # Return optimized wire format: header || ciphertext+tag (IV omitted)
         return header + ciphertext
 
+    def encrypt_many(self, plaintexts: Sequence[bytes]) -> BatchResult:
+        """Encrypt a burst of plaintexts under one contiguous sequence range.
+
+        The range ``[seq, seq + len(plaintexts))`` is reserved up front, so a
+        packet that fails to encrypt burns its sequence number instead of
+        shifting later packets (no IV is ever reused). Per-packet failures are
+        reported in ``BatchResult.errors`` ("type" or "aead") rather than raised;
+        exhausting the sequence space still raises ``SequenceOverflow``.
+        """
+        count = len(plaintexts)
+        start = self._seq
+        if start + count > 2**64:
+            raise SequenceOverflow("packet_seq overflow; rekey/epoch bump required")
+        self._seq = start + count
+
+        result = BatchResult(first_seq=start)
+        outputs = result.outputs
+        errors = result.errors
+        pack_seq_epoch = _SEQ_EPOCH.pack
+        pack_nonce_seq = _NONCE_SEQ.pack_into
+        encrypt = self._cipher.encrypt
+        prefix = self._header_prefix
+        epoch = self.epoch
+        iv = self._nonce_buf
+        iv[0] = epoch & 0xFF
+
+        for seq, plaintext in enumerate(plaintexts, start):
+            if not isinstance(plaintext, _BUFFER_TYPES):
+                outputs.append(None)
+                errors.append("type")
+                continue
+            header = prefix + pack_seq_epoch(seq, epoch)
+            pack_nonce_seq(iv, _NONCE_SEQ_OFFSET, seq)
+            try:
+                ciphertext = encrypt(iv, plaintext, header)
+            except Exception:
+                outputs.append(None)
+                errors.append("aead")
+                continue
+            outputs.append(header + ciphertext)
+            errors.append(None)
+        return result
+
+    def warm_up(self) -> None:
+        """Exercise the AEAD once without consuming a sequence number."""
+        _warm_up_cipher(self._cipher, self._nonce_len)
+
     def bump_epoch(self) -> None:
         """Increase epoch and reset sequence.
 
@@ -236,7 +340,8 @@ class Receiver:
     strict_mode: bool = False  # True = raise exceptions, False = return None
     aead_token: str = "aesgcm"
     _high: int = -1
-    _mask: int = 0
+    # Plain receivers serve one session; GraceReceiver sets this per packet.
+    from_previous_session = False
 
     def __post_init__(self):
         if not isinstance(self.version, int) or self.version != CONFIG["WIRE_VERSION"]:
@@ -260,46 +365,101 @@ class Receiver:
         if not isinstance(self._high, int):
             raise NotImplementedError("_high must be int")
         
-        if not isinstance(self._mask, int) or self._mask < 0:
-            raise NotImplementedError("_mask must be non-negative int")
 
+        # Replay window as a ring of 64-bit words (RFC 6479 style). One spare word
+        # beyond ceil(window/64) lets the ring advance by clearing whole words, and a
+        # power-of-two word count turns the ring index into a mask.
+        words = 2
+        while words < (self.window + 63) // 64 + 1:
+            words <<= 1
+        self._replay_word_mask = words - 1
+        self._replay_words = array("Q", bytes(8 * words))
+        self._replay_zero = array("Q", bytes(8 * words))
         self._aead_token = _canonicalize_aead_token(self.aead_token)
         self._cipher, self._nonce_len = _instantiate_aead(self._aead_token, self.key_recv)
+        self._nonce_buf = _nonce_buffer(self._nonce_len)
+        self._prefix = _header_prefix(self.version, self.ids, self.session_id)
         self._last_error: Optional[str] = None
 
-    def _check_replay(self, seq: int) -> None:
-        """Check if sequence number should be accepted (anti-replay)."""
-        if seq > self._high:
-            # Future packet - shift window forward
-            shift = seq - self._high
-            if shift >= self.window:
-                # Window completely shifts
-                self._mask = 1  # Only mark the current position
+    def _replay_accept(self, seq: int) -> bool:
+        """Record ``seq`` in the replay window; False if it is a duplicate or too old.
+
+        Accepts exactly the sequences ``_check_replay`` does: anything above the
+        highest seen, or unseen and within ``window`` of it. Advancing clears
+        only the words the window slides over, so in-order traffic costs O(1)
+        amortised regardless of ``window``.
+        """
+        words = self._replay_words
+        word_mask = self._replay_word_mask
+        high = self._high
+        if seq > high:
+            new_word = seq >> 6
+            gap = new_word - (high >> 6)
+            if gap == 0:
+                words[new_word & word_mask] |= 1 << (seq & 63)
+            elif gap == 1:
+                # In-order traffic crossing into the next word: start it fresh.
+                words[new_word & word_mask] = 1 << (seq & 63)
             else:
-                # Partial shift
-                self._mask = (self._mask << shift) | 1
-                # Mask to window size to prevent overflow
-                self._mask &= (1 << self.window) - 1
+                if gap > word_mask:
+                    words[:] = self._replay_zero
+                else:
+                    for word in range(new_word - gap + 1, new_word):
+                        words[word & word_mask] = 0
+                words[new_word & word_mask] = 1 << (seq & 63)
             self._high = seq
-        elif seq > self._high - self.window:
-            # Within window - check if already seen
-            offset = self._high - seq
-            bit_pos = offset
-            if self._mask & (1 << bit_pos):
-                raise ReplayError(f"duplicate packet seq={seq}")
-            # Mark as seen
-            self._mask |= (1 << bit_pos)
-        else:
-            # Too old - outside window
+            return True
+        if seq <= high - self.window:
+            return False
+        index = (seq >> 6) & word_mask
+        bit = 1 << (seq & 63)
+        if words[index] & bit:
+            return False
+        words[index] |= bit
+        return True
+
+    def _replay_fresh(self, seq: int) -> bool:
+        """True if ``_replay_accept(seq)`` would accept, without recording it."""
+        high = self._high
+        if seq > high:
+            return True
+        if seq <= high - self.window:
+            return False
+        return not self._replay_words[(seq >> 6) & self._replay_word_mask] & (1 << (seq & 63))
+
+    def _check_replay(self, seq: int) -> None:
+        """Check if sequence number should be accepted (anti-replay)."""
+        if not self._replay_accept(seq):
+            self._raise_replay(seq)
+
+    def _check_fresh(self, seq: int) -> None:
+        """Like ``_check_replay`` but only checks; ``_replay_accept`` records later."""
+        if not self._replay_fresh(seq):
+            self._raise_replay(seq)
+
+    def _raise_replay(self, seq: int) -> None:
+        if seq <= self._high - self.window:
             raise ReplayError(f"packet too old seq={seq}, high={self._high}, window={self.window}")
+        raise ReplayError(f"duplicate packet seq={seq}")
+
+    def check_replay_many(self, seqs: Sequence[int]) -> List[bool]:
+        """Run the anti-replay check over ``seqs`` in order; True where accepted.
+
+        Equivalent to calling ``_check_replay`` on each sequence but without
+        raising, so a burst can be screened before any decryption work.
+        """
+        accept = self._replay_accept
+        return [accept(seq) for seq in seqs]
 
     def decrypt(self, wire: bytes) -> bytes:
         """Validate header, perform anti-replay, reconstruct IV, decrypt.
 
-        Returns plaintext bytes or None (silent mode) on failure.
+        Returns plaintext bytes or None (silent mode) on failure. The sequence
+        number is recorded in the replay window only once the packet
+        authenticates, so forged packets cannot burn sequence numbers.
         """
-        if not isinstance(wire, bytes):
-            raise NotImplementedError("wire must be bytes")
+        if not isinstance(wire, _BUFFER_TYPES):
+            raise NotImplementedError("wire must be bytes-like")
         
         if len(wire) < HEADER_LEN:
             raise NotImplementedError("wire too short for header")
@@ -309,7 +469,7 @@ class Receiver:
         
         # Unpack and validate header
         try:
-            fields = struct.unpack(HEADER_STRUCT, header)
+            fields = _HEADER.unpack(header)
             version, kem_id, kem_param, sig_id, sig_param, session_id, seq, epoch = fields
         except struct.error as e:
             raise NotImplementedError(f"header unpack failed: {e}")
@@ -335,9 +495,9 @@ class Receiver:
             self._last_error = "session"
             return None  # Wrong epoch - always fail silently for rekeying
         
-        # Check replay protection
+        # Check replay protection (recorded after authentication)
         try:
-            self._check_replay(seq)
+            self._check_fresh(seq)
         except ReplayError:
             self._last_error = "replay"
             if self.strict_mode:
@@ -345,7 +505,9 @@ class Receiver:
             return None
         
         # Reconstruct deterministic IV instead of reading from wire
-        iv = _build_nonce(epoch, seq, self._nonce_len)
+        iv = self._nonce_buf
+        iv[0] = epoch & 0xFF
+        _NONCE_SEQ.pack_into(iv, _NONCE_SEQ_OFFSET, seq)
         ciphertext = wire[HEADER_LEN:]
         
         # Decrypt with header as AAD
@@ -358,13 +520,137 @@ class Receiver:
             return None
         except Exception as e:
             raise NotImplementedError(f"AEAD decryption failed: {e}")
+        self._replay_accept(seq)
         self._last_error = None
         return plaintext
 
+    def try_decrypt(self, wire) -> Tuple[int, Optional[bytes]]:
+        """Non-raising ``decrypt`` for the data plane: return ``(status, plaintext)``.
+
+        ``status`` is ``DECRYPT_OK`` or one of the ``DECRYPT_*`` drop codes, and
+        plaintext is None unless it is ``DECRYPT_OK``. Garbage is rejected before
+        any AEAD work: wire length, then one slice compare of the 13-byte
+        version/IDs/session prefix, then the epoch byte; only seq is unpacked.
+        The sequence number is recorded in the replay window only once the
+        packet authenticates, so forged packets cannot slide the window.
+        Ignores ``strict_mode``. ``last_error_reason()`` is updated as by ``decrypt``.
+        """
+        if len(wire) < HEADER_LEN:
+            status = DECRYPT_HEADER
+        elif wire[:_HEADER_PREFIX_LEN] != self._prefix:
+            # Only a rejected packet pays to tell the two reasons apart.
+            prefix = self._prefix
+            status = DECRYPT_HEADER if wire[:_SESSION_OFFSET] != prefix[:_SESSION_OFFSET] else DECRYPT_SESSION
+        elif wire[_EPOCH_OFFSET] != self.epoch:
+            status = DECRYPT_SESSION
+        elif len(wire) < HEADER_LEN + _TAG_LEN:
+            status = DECRYPT_AUTH  # no room for a tag: cannot authenticate
+        else:
+            (seq,) = _SEQ.unpack_from(wire, _SEQ_OFFSET)
+            if not self._replay_fresh(seq):
+                status = DECRYPT_REPLAY
+            else:
+                iv = self._nonce_buf
+                iv[0] = self.epoch & 0xFF
+                _NONCE_SEQ.pack_into(iv, _NONCE_SEQ_OFFSET, seq)
+                try:
+                    plaintext = self._cipher.decrypt(iv, wire[HEADER_LEN:], wire[:HEADER_LEN])
+                except InvalidTag:
+                    status = DECRYPT_AUTH
+                except Exception:
+                    status = DECRYPT_OTHER
+                else:
+                    self._replay_accept(seq)
+                    self._last_error = None
+                    return DECRYPT_OK, plaintext
+        self._last_error = DECRYPT_REASONS[status]
+        return status, None
+
+    def screen(self, wire, max_seq_ahead: int) -> int:
+        """Classify ``wire`` from its header alone, with no AEAD work and no state change.
+
+        Returns ``DECRYPT_OK`` when the packet could be valid, otherwise the
+        ``DECRYPT_*`` code ``try_decrypt`` would give it, or ``DECRYPT_SEQ`` when
+        its seq is more than ``max_seq_ahead`` beyond the highest one accepted.
+        """
+        if len(wire) < HEADER_LEN:
+            return DECRYPT_HEADER
+        if wire[:_HEADER_PREFIX_LEN] != self._prefix:
+            return DECRYPT_HEADER if wire[:_SESSION_OFFSET] != self._prefix[:_SESSION_OFFSET] else DECRYPT_SESSION
+        if wire[_EPOCH_OFFSET] != self.epoch:
+            return DECRYPT_SESSION
+        if len(wire) < HEADER_LEN + _TAG_LEN:
+            return DECRYPT_AUTH
+        (seq,) = _SEQ.unpack_from(wire, _SEQ_OFFSET)
+        if seq - self._high > max_seq_ahead:
+            return DECRYPT_SEQ
+        if not self._replay_fresh(seq):
+            return DECRYPT_REPLAY
+        return DECRYPT_OK
+
+    def decrypt_many(self, wires: Sequence[bytes]) -> BatchResult:
+        """Validate and decrypt a burst of wire packets in one call.
+
+        Never raises for per-packet failures, regardless of ``strict_mode``:
+        each rejected packet yields a None output and one of "header",
+        "session", "replay", "auth" or "other" in ``BatchResult.errors``.
+        As in ``decrypt``, only authenticated packets enter the replay window.
+        ``last_error_reason()`` reflects the final packet of the batch.
+        """
+        result = BatchResult()
+        outputs = result.outputs
+        errors = result.errors
+        unpack = _HEADER.unpack
+        pack_nonce_seq = _NONCE_SEQ.pack_into
+        decrypt = self._cipher.decrypt
+        replay_fresh = self._replay_fresh
+        replay_accept = self._replay_accept
+        iv = self._nonce_buf
+        iv[0] = self.epoch & 0xFF
+        expected_version = self.version
+        expected_ids = (self.ids.kem_id, self.ids.kem_param, self.ids.sig_id, self.ids.sig_param)
+        expected_session = self.session_id
+        expected_epoch = self.epoch
+
+        reason: Optional[str] = None
+        for wire in wires:
+            plaintext: Optional[bytes] = None
+            if not isinstance(wire, _BUFFER_TYPES) or len(wire) < HEADER_LEN:
+                reason = "header"
+            else:
+                header = wire[:HEADER_LEN]
+                version, kem_id, kem_param, sig_id, sig_param, session_id, seq, epoch = unpack(header)
+                if version != expected_version or (kem_id, kem_param, sig_id, sig_param) != expected_ids:
+                    reason = "header"
+                elif session_id != expected_session or epoch != expected_epoch:
+                    reason = "session"
+                elif not replay_fresh(seq):
+                    reason = "replay"
+                else:
+                    pack_nonce_seq(iv, _NONCE_SEQ_OFFSET, seq)
+                    try:
+                        plaintext = decrypt(iv, wire[HEADER_LEN:], header)
+                        replay_accept(seq)
+                        reason = None
+                    except InvalidTag:
+                        reason = "auth"
+                    except Exception:
+                        reason = "other"
+            outputs.append(plaintext)
+            errors.append(reason)
+
+        if wires:
+            self._last_error = reason
+        return result
+
+    def warm_up(self) -> None:
+        """Exercise the AEAD once without touching replay state."""
+        _warm_up_cipher(self._cipher, self._nonce_len)
+
     def reset_replay(self) -> None:
         """Clear replay protection state."""
         self._high = -1
-        self._mask = 0
+        self._replay_words[:] = self._replay_zero
 
     def bump_epoch(self) -> None:
         """Increase epoch and reset replay state.
@@ -378,4 +664,194 @@ class Receiver:
         self.reset_replay()
 
     def last_error_reason(self) -> Optional[str]:
-        return getattr(self, "_last_error", None)
\ No newline at end of file
+        return getattr(self, "_last_error", None)
+
+
+class GraceReceiver:
+    """Receiver for the current session that still accepts the previous one for a while.
+
+    After a rekey, packets sealed under the old session may still be in flight.
+    ``decrypt`` routes each packet by its header (session_id, epoch): packets for
+    the previous session go to the previous ``Receiver`` until ``grace_seconds``
+    elapse or it has accepted ``grace_packets`` packets, whichever comes first;
+    everything else goes to ``current``. Routing is a fixed-size slice compare.
+    Once the grace period ends the previous receiver (and its key) is released
+    and old-session packets are dropped by ``current`` as a session mismatch.
+
+    ``ids``, ``session_id`` and ``epoch`` describe the current session, so the
+    object can stand in for a ``Receiver`` on the proxy data plane. Not thread
+    safe: use from the single thread that services the encrypted socket.
+    """
+
+    def __init__(
+        self,
+        current: Receiver,
+        previous: Receiver,
+        *,
+        grace_seconds: float,
+        grace_packets: int,
+        clock=time.monotonic,
+    ):
+        self.current = current
+        self.previous: Optional[Receiver] = previous
+        self.previous_accepted = 0
+        # True when the last decrypted packet belonged to the previous session.
+        self.from_previous_session = False
+        self._previous_session = previous.session_id
+        self._previous_epoch = previous.epoch
+        self._deadline = clock() + grace_seconds
+        self._budget = grace_packets
+        self._clock = clock
+        self._last = current
+
+    @property
+    def ids(self) -> AeadIds:
+        return self.current.ids
+
+    @property
+    def session_id(self) -> bytes:
+        return self.current.session_id
+
+    @property
+    def epoch(self) -> int:
+        return self.current.epoch
+
+    def _matches_previous(self, wire) -> bool:
+        return not (
+            len(wire) < HEADER_LEN
+            or wire[_EPOCH_OFFSET] != self._previous_epoch
+            or wire[_SESSION_OFFSET:_SESSION_OFFSET + 8] != self._previous_session
+        )
+
+    def _grace_open(self) -> bool:
+        return self._budget > 0 and self._clock() < self._deadline
+
+    def _routes_to_previous(self, wire) -> bool:
+        if not self._matches_previous(wire):
+            return False
+        if not self._grace_open():
+            self.release_previous()
+            return False
+        return True
+
+    def decrypt(self, wire: bytes) -> Optional[bytes]:
+        previous = self.previous
+        if previous is not None and self._routes_to_previous(wire):
+            self._last = previous
+            plaintext = previous.decrypt(wire)
+            if plaintext is not None:
+                self._budget -= 1
+                self.previous_accepted += 1
+            self.from_previous_session = plaintext is not None
+            return plaintext
+        self._last = self.current
+        self.from_previous_session = False
+        return self.current.decrypt(wire)
+
+    def try_decrypt(self, wire) -> Tuple[int, Optional[bytes]]:
+        """``Receiver.try_decrypt`` with the same routing as ``decrypt``."""
+        previous = self.previous
+        if previous is not None and self._routes_to_previous(wire):
+            self._last = previous
+            status, plaintext = previous.try_decrypt(wire)
+            if not status:
+                self._budget -= 1
+                self.previous_accepted += 1
+            self.from_previous_session = not status
+            return status, plaintext
+        self._last = self.current
+        self.from_previous_session = False
+        return self.current.try_decrypt(wire)
+
+    def decrypt_many(self, wires: Sequence[bytes]) -> BatchResult:
+        """``Receiver.decrypt_many`` with the same routing as ``decrypt``.
+
+        Outside the grace period this is one batch call on ``current``; during it
+        each packet is routed as by ``try_decrypt`` and ``previous_accepted``
+        counts those taken by the previous session.
+        """
+        if self.previous is None:
+            self._last = self.current
+            self.from_previous_session = False
+            return self.current.decrypt_many(wires)
+        result = BatchResult()
+        try_decrypt = self.try_decrypt
+        for wire in wires:
+            status, plaintext = try_decrypt(wire)
+            result.outputs.append(plaintext)
+            result.errors.append(DECRYPT_REASONS[status])
+        return result
+
+    def screen(self, wire, max_seq_ahead: int) -> int:
+        """``Receiver.screen`` against whichever session ``decrypt`` would route to.
+
+        Never releases the previous session: only ``decrypt``/``try_decrypt`` end
+        the grace period, so screening stays free of side effects.
+        """
+        previous = self.previous
+        if previous is not None and self._matches_previous(wire) and self._grace_open():
+            return previous.screen(wire, max_seq_ahead)
+        return self.current.screen(wire, max_seq_ahead)
+
+    def release_previous(self) -> None:
+        """End the grace period now."""
+        self.previous = None
+        self._last = self.current
+
+    def last_error_reason(self) -> Optional[str]:
+        return self._last.last_error_reason()
+
+
+class PreAuthFilter:
+    """Cheap pre-authentication stage that sheds forged or stale datagrams.
+
+    ``check`` runs the receiver's header-only ``screen`` so packets with the
+    wrong header, session or epoch, replays, and sequence numbers implausibly
+    far ahead of the replay window never reach the cipher. A legitimate sender
+    that really did jump ahead (long outage) would be locked out forever, so
+    one in every ``probe_every`` "too far ahead" packets is let through to
+    ``try_decrypt``: if it authenticates, the window catches up. Forged probes
+    fail authentication without moving the window.
+
+    ``screen`` itself is stateless; the only state here is ``_ahead``, the count
+    of "too far ahead" verdicts since the last probe. It never touches the
+    receiver and only decides which far-ahead packet is probed, so keep one
+    filter per receive path (it is not thread safe, like the receiver).
+    """
+
+    def __init__(self, *, max_seq_ahead: int = 1 << 20, probe_every: int = 64) -> None:
+        if max_seq_ahead < 1 or probe_every < 1:
+            raise NotImplementedError("max_seq_ahead and probe_every must be >= 1")
+        self.max_seq_ahead = max_seq_ahead
+        self.probe_every = probe_every
+        self._ahead = 0
+
+    def check(self, receiver, wire) -> int:
+        """Return ``DECRYPT_OK`` to pass ``wire`` on, else the reason to shed it."""
+        status = receiver.screen(wire, self.max_seq_ahead)
+        if status == DECRYPT_SEQ:
+            self._ahead += 1
+            if self._ahead >= self.probe_every:
+                self._ahead = 0
+                return DECRYPT_OK
+        return status
+
+    def check_many(self, receiver, wires: Sequence[bytes]) -> List[int]:
+        """``check`` over a receive burst (e.g. one recvmmsg batch), in order."""
+        check = self.check
+        return [check(receiver, wire) for wire in wires]
+
+
+def chain_receiver(new: Receiver, active, *, grace_seconds: float, grace_packets: int):
+    """Return the receiver to install when ``new`` replaces ``active`` on rekey.
+
+    ``active`` may itself be a ``GraceReceiver``; only its current session is
+    carried over, so at most two sessions are ever accepted. A non-positive
+    ``grace_seconds`` or ``grace_packets`` disables the grace period.
+    """
+    previous = active.current if isinstance(active, GraceReceiver) else active
+    if previous is None or grace_seconds <= 0 or grace_packets <= 0:
+        return new
+    if previous.session_id == new.session_id and previous.epoch == new.epoch:
+        return new
+    return GraceReceiver(new, previous, grace_seconds=grace_seconds, grace_packets=grace_packets)
\ No newline at end of file
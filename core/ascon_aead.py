@@ -0,0 +1,401 @@
+"""
+In-tree ASCON AEAD engine for the ``ascon128`` suites.
+
+The reference implementations (``pyascon`` bundled in this repo and the PyPI
+``ascon`` package) keep the state in a list, rebuild words by summing shifted
+bytes and run every S-box/linear-layer step through list indexing, which puts
+ascon suites orders of magnitude behind AES-GCM. This engine computes the same
+function with:
+
+* the 320-bit state held in five local 64-bit ints, using the bitsliced round
+  of the ascon-c reference code (five ANDNOTs, fused rotations);
+* round constants precomputed per round count;
+* whole messages unpacked and packed with one ``struct`` call per direction
+  rather than per-byte conversions;
+* the key words, IV and padding for a key derived once per cipher instance.
+
+Two variants are supported:
+
+* ``"Ascon-128"``: Ascon v1.2 (CAESAR / NIST LWC finalist), 8-byte rate,
+  6 intermediate rounds, big-endian words. Byte-for-byte compatible with
+  ``ascon.encrypt``/``ascon.decrypt``, which older builds used for ``ascon128``.
+* ``"Ascon-AEAD128"``: NIST SP 800-232, 16-byte rate, 8 intermediate rounds,
+  little-endian words. Compatible with the bundled ``pyascon`` reference.
+
+When ``native/libascon_aead.so`` has been built from ``native/ascon_aead.c``
+(or ``ASCON_NATIVE_LIB`` names a build elsewhere) it is loaded via ctypes and
+``ascon_cipher(..., backend="auto")`` prefers it; otherwise the pure-Python
+engine is used, so ascon suites never depend on an optional module.
+
+Both backends expose the ``cryptography`` AEAD interface (``encrypt(nonce,
+data, aad)``, ``decrypt`` raising ``InvalidTag``) so ``core.aead`` can use them
+wherever it uses ``AESGCM``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import hmac
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from cryptography.exceptions import InvalidTag
+
+KEY_LEN = 16
+NONCE_LEN = 16
+TAG_LEN = 16
+
+ASCON_128 = "Ascon-128"
+ASCON_AEAD128 = "Ascon-AEAD128"
+ASCON_VARIANTS = (ASCON_128, ASCON_AEAD128)
+ASCON_BACKENDS = ("auto", "native", "python")
+
+_M = 0xFFFFFFFFFFFFFFFF
+_DUP = (1 << 64) | 1
+
+
+def _round_constants(rounds: int) -> Tuple[int, ...]:
+    return tuple(0xF0 - r * 0x10 + r for r in range(12 - rounds, 12))
+
+
+_RC12 = _round_constants(12)
+_RC8 = _round_constants(8)
+_RC6 = _round_constants(6)
+
+
+def _permute(x0: int, x1: int, x2: int, x3: int, x4: int, constants: Tuple[int, ...]) -> Tuple[int, int, int, int, int]:
+    """Apply the ASCON permutation for ``len(constants)`` rounds."""
+    for c in constants:
+        x2 ^= c
+        # Substitution layer (bitsliced 5-bit S-box).
+        x0 ^= x4
+        x4 ^= x3
+        x2 ^= x1
+        t0 = x0 ^ (~x1 & x2)
+        t1 = x1 ^ (~x2 & x3)
+        t2 = x2 ^ (~x3 & x4)
+        t3 = x3 ^ (~x4 & x0)
+        t4 = x4 ^ (~x0 & x1)
+        t1 ^= t0
+        t0 ^= t4
+        t3 ^= t2
+        # Linear diffusion layer. Multiplying by _DUP places a copy of the word
+        # above itself, so each rotate-right is one shift of the 128-bit value;
+        # the single mask drops the upper copy. t2 is complemented here to
+        # finish the S-box.
+        u = t0 * _DUP
+        x0 = (t0 ^ (u >> 19) ^ (u >> 28)) & _M
+        u = t1 * _DUP
+        x1 = (t1 ^ (u >> 61) ^ (u >> 39)) & _M
+        u = t2 * _DUP
+        x2 = (t2 ^ (u >> 1) ^ (u >> 6)) & _M ^ _M
+        u = t3 * _DUP
+        x3 = (t3 ^ (u >> 10) ^ (u >> 17)) & _M
+        u = t4 * _DUP
+        x4 = (t4 ^ (u >> 7) ^ (u >> 41)) & _M
+    return x0, x1, x2, x3, x4
+
+
+def _check_key(key, variant: str) -> None:
+    if variant not in ASCON_VARIANTS:
+        raise NotImplementedError(f"unknown ASCON variant: {variant}")
+    if len(key) != KEY_LEN:
+        raise NotImplementedError(f"{variant} requires a {KEY_LEN}-byte key")
+
+
+_WORD_STRUCTS: Dict[Tuple[str, int], struct.Struct] = {}
+
+
+def _words(order: str, count: int) -> struct.Struct:
+    layout = _WORD_STRUCTS.get((order, count))
+    if layout is None:
+        layout = _WORD_STRUCTS.setdefault((order, count), struct.Struct(f"{order}{count}Q"))
+    return layout
+
+
+class AsconAead:
+    """ASCON authenticated encryption with a 16-byte key, nonce and tag (pure Python)."""
+
+    backend = "python"
+    __slots__ = ("variant", "_k0", "_k1", "_iv", "_order", "_rate", "_rc", "_pad", "_dsep")
+
+    def __init__(self, key: bytes, variant: str = ASCON_128):
+        _check_key(key, variant)
+        self.variant = variant
+        if variant == ASCON_128:
+            # IV = k || r || a || b || 0*, key words big-endian.
+            self._order = ">"
+            self._rate = 8
+            self._rc = _RC6
+            self._iv = 0x80400C0600000000
+            self._pad = b"\x80"
+            self._dsep = 1
+        else:
+            # SP 800-232: version 1, (b << 4) + a, tag bits, rate bytes; little-endian.
+            self._order = "<"
+            self._rate = 16
+            self._rc = _RC8
+            self._iv = int.from_bytes(bytes((1, 0, (8 << 4) + 12)) + (128).to_bytes(2, "little") + bytes((16, 0, 0)), "little")
+            self._pad = b"\x01"
+            self._dsep = 1 << 63
+        self._k0, self._k1 = _words(self._order, 2).unpack(bytes(key))
+
+    # -- sponge phases -------------------------------------------------
+
+    def _initialize(self, nonce, aad) -> Tuple[int, int, int, int, int]:
+        if len(nonce) != NONCE_LEN:
+            raise NotImplementedError(f"ASCON requires a {NONCE_LEN}-byte nonce")
+        k0, k1 = self._k0, self._k1
+        n0, n1 = _words(self._order, 2).unpack(nonce)
+        x0, x1, x2, x3, x4 = _permute(self._iv, k0, k1, n0, n1, _RC12)
+        x3 ^= k0
+        x4 ^= k1
+
+        if len(aad):
+            rc = self._rc
+            padded = self._padded(aad)
+            words = _words(self._order, len(padded) // 8).unpack(padded)
+            if self._rate == 8:
+                for word in words:
+                    x0, x1, x2, x3, x4 = _permute(x0 ^ word, x1, x2, x3, x4, rc)
+            else:
+                for index in range(0, len(words), 2):
+                    x0, x1, x2, x3, x4 = _permute(x0 ^ words[index], x1 ^ words[index + 1], x2, x3, x4, rc)
+        x4 ^= self._dsep
+        return x0, x1, x2, x3, x4
+
+    def _finalize(self, x0: int, x1: int, x2: int, x3: int, x4: int) -> bytes:
+        k0, k1 = self._k0, self._k1
+        if self._rate == 8:
+            x1 ^= k0
+            x2 ^= k1
+        else:
+            x2 ^= k0
+            x3 ^= k1
+        x0, x1, x2, x3, x4 = _permute(x0, x1, x2, x3, x4, _RC12)
+        return _words(self._order, 2).pack(x3 ^ k0, x4 ^ k1)
+
+    def _padded(self, data) -> bytes:
+        rate = self._rate
+        return bytes(data) + self._pad + bytes(rate - 1 - len(data) % rate)
+
+    # -- cryptography-style AEAD interface -------------------------------
+
+    def encrypt(self, nonce, data, aad) -> bytes:
+        """Return ``ciphertext || tag`` for ``data`` bound to ``aad``."""
+        x0, x1, x2, x3, x4 = self._initialize(nonce, aad)
+        rc = self._rc
+        length = len(data)
+        padded = self._padded(data)
+        layout = _words(self._order, len(padded) // 8)
+        words = layout.unpack(padded)
+        out = []
+        append = out.append
+        if self._rate == 8:
+            last = len(words) - 1
+            for index in range(last):
+                x0 ^= words[index]
+                append(x0)
+                x0, x1, x2, x3, x4 = _permute(x0, x1, x2, x3, x4, rc)
+            x0 ^= words[last]
+            append(x0)
+        else:
+            last = len(words) - 2
+            for index in range(0, last, 2):
+                x0 ^= words[index]
+                x1 ^= words[index + 1]
+                append(x0)
+                append(x1)
+                x0, x1, x2, x3, x4 = _permute(x0, x1, x2, x3, x4, rc)
+            x0 ^= words[last]
+            x1 ^= words[last + 1]
+            append(x0)
+            append(x1)
+        # The final (padding) block contributes only the message tail.
+        return layout.pack(*out)[:length] + self._finalize(x0, x1, x2, x3, x4)
+
+    def decrypt(self, nonce, data, aad) -> bytes:
+        """Return the plaintext, raising ``InvalidTag`` when authentication fails."""
+        length = len(data) - TAG_LEN
+        if length < 0:
+            raise InvalidTag("ascon ciphertext shorter than tag")
+        x0, x1, x2, x3, x4 = self._initialize(nonce, aad)
+        rc = self._rc
+        rate = self._rate
+        order = self._order
+        full = length - length % rate
+        body = bytes(data[:full])
+        words = _words(order, full // 8).unpack(body)
+        out = []
+        append = out.append
+        if rate == 8:
+            for word in words:
+                append(x0 ^ word)
+                x0, x1, x2, x3, x4 = _permute(word, x1, x2, x3, x4, rc)
+        else:
+            for index in range(0, len(words), 2):
+                c0 = words[index]
+                c1 = words[index + 1]
+                append(x0 ^ c0)
+                append(x1 ^ c1)
+                x0, x1, x2, x3, x4 = _permute(c0, c1, x2, x3, x4, rc)
+        plaintext = _words(order, len(out)).pack(*out)
+
+        # Last partial block: recover the tail, then absorb it padded exactly
+        # as encryption did so the state lines up for finalization.
+        tail = bytes(data[full:length])
+        pair = _words(order, 2)
+        if rate == 8:
+            stream = _words(order, 1).pack(x0)
+            tail_plain = bytes(a ^ b for a, b in zip(tail, stream))
+            (p0,) = _words(order, 1).unpack(self._padded(tail_plain))
+            x0 ^= p0
+        else:
+            stream = pair.pack(x0, x1)
+            tail_plain = bytes(a ^ b for a, b in zip(tail, stream))
+            p0, p1 = pair.unpack(self._padded(tail_plain))
+            x0 ^= p0
+            x1 ^= p1
+
+        tag = self._finalize(x0, x1, x2, x3, x4)
+        if not hmac.compare_digest(tag, bytes(data[length:])):
+            raise InvalidTag("ascon authentication failed")
+        return plaintext + tail_plain
+
+
+# -- optional native backend ---------------------------------------------
+
+_NATIVE_VARIANT_CODES = {ASCON_128: 0, ASCON_AEAD128: 1}
+_DEFAULT_NATIVE_LIB = Path(__file__).resolve().parent / "native" / "libascon_aead.so"
+
+
+def _load_native():
+    path = os.environ.get("ASCON_NATIVE_LIB") or str(_DEFAULT_NATIVE_LIB)
+    try:
+        lib = ctypes.CDLL(path)
+        encrypt = lib.ascon_aead_encrypt
+        decrypt = lib.ascon_aead_decrypt
+    except (OSError, AttributeError):
+        return None, None
+    argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+        ctypes.c_size_t,
+        ctypes.c_char_p,
+        ctypes.c_size_t,
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+    ]
+    for func in (encrypt, decrypt):
+        func.argtypes = argtypes
+        func.restype = ctypes.c_int
+    return encrypt, decrypt
+
+
+_native_encrypt, _native_decrypt = _load_native()
+
+
+def native_available() -> bool:
+    """Return True when the compiled ``libascon_aead`` backend was loaded."""
+    return _native_encrypt is not None and _native_decrypt is not None
+
+
+class _NativeAsconAead:
+    """ctypes wrapper over ``native/ascon_aead.c`` with the same interface as ``AsconAead``."""
+
+    backend = "native"
+    __slots__ = ("variant", "_key", "_code")
+
+    def __init__(self, key: bytes, variant: str = ASCON_128):
+        _check_key(key, variant)
+        self.variant = variant
+        self._key = bytes(key)
+        self._code = _NATIVE_VARIANT_CODES[variant]
+
+    def encrypt(self, nonce, data, aad) -> bytes:
+        if len(nonce) != NONCE_LEN:
+            raise NotImplementedError(f"ASCON requires a {NONCE_LEN}-byte nonce")
+        data = data if type(data) is bytes else bytes(data)
+        aad = aad if type(aad) is bytes else bytes(aad)
+        out = ctypes.create_string_buffer(len(data) + TAG_LEN)
+        _native_encrypt(self._code, out, data, len(data), aad, len(aad), bytes(nonce), self._key)
+        return out.raw
+
+    def decrypt(self, nonce, data, aad) -> bytes:
+        if len(nonce) != NONCE_LEN:
+            raise NotImplementedError(f"ASCON requires a {NONCE_LEN}-byte nonce")
+        if len(data) < TAG_LEN:
+            raise InvalidTag("ascon ciphertext shorter than tag")
+        data = data if type(data) is bytes else bytes(data)
+        aad = aad if type(aad) is bytes else bytes(aad)
+        out = ctypes.create_string_buffer(len(data) - TAG_LEN)
+        if _native_decrypt(self._code, out, data, len(data), aad, len(aad), bytes(nonce), self._key) != 0:
+            raise InvalidTag("ascon authentication failed")
+        return out.raw
+
+
+AsconCipher = Union[AsconAead, _NativeAsconAead]
+
+
+def _resolve_backend(backend: str) -> str:
+    if backend == "auto":
+        return "native" if native_available() else "python"
+    if backend == "native" and not native_available():
+        raise NotImplementedError("native ASCON backend not built (core/native/libascon_aead.so)")
+    if backend not in ("native", "python"):
+        raise NotImplementedError(f"unknown ASCON backend: {backend}")
+    return backend
+
+
+def ascon_cipher(key: bytes, variant: str = ASCON_128, backend: str = "auto") -> AsconCipher:
+    """Return an ASCON AEAD for ``key``; "auto" prefers the native backend when built."""
+    if _resolve_backend(backend) == "native":
+        return _NativeAsconAead(key, variant)
+    return AsconAead(key, variant)
+
+
+def ascon_encrypt(
+    key: bytes,
+    nonce: bytes,
+    associateddata: bytes,
+    plaintext: bytes,
+    variant: str = ASCON_128,
+    backend: str = "auto",
+) -> bytes:
+    """One-shot encryption with the reference-implementation argument order."""
+    return ascon_cipher(key, variant, backend).encrypt(nonce, plaintext, associateddata)
+
+
+def ascon_decrypt(
+    key: bytes,
+    nonce: bytes,
+    associateddata: bytes,
+    ciphertext: bytes,
+    variant: str = ASCON_128,
+    backend: str = "auto",
+) -> Optional[bytes]:
+    """One-shot decryption; returns None on authentication failure like the references."""
+    try:
+        return ascon_cipher(key, variant, backend).decrypt(nonce, ciphertext, associateddata)
+    except InvalidTag:
+        return None
+
+
+__all__ = [
+    "ASCON_128",
+    "ASCON_AEAD128",
+    "ASCON_BACKENDS",
+    "ASCON_VARIANTS",
+    "AsconAead",
+    "AsconCipher",
+    "KEY_LEN",
+    "NONCE_LEN",
+    "TAG_LEN",
+    "ascon_cipher",
+    "ascon_decrypt",
+    "ascon_encrypt",
+    "native_available",
+]
@@ -6,16 +6,20 @@ Responsibilities:
 2. Bridge plaintext UDP <-> encrypted UDP (AEAD framing) both directions.
 3. Enforce replay window and per-direction sequence via `core.aead`.
 
-Note: This module uses the low-level `selectors` stdlib facility—not `asyncio`—to
-remain dependency-light and fully deterministic for test harnesses. The filename
-is retained for backward compatibility; a future refactor may rename it to
-`selector_proxy.py` and/or introduce an asyncio variant.
+Note: The default engine uses the low-level `selectors` stdlib facility to remain
+dependency-light and fully deterministic for test harnesses. `engine="asyncio"`
+runs the data plane, control outbox, status writer and rekey scheduling on one
+asyncio loop (uvloop when installed) with event-driven control wakeups.
 """
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import hashlib
+import itertools
 import json
+import multiprocessing
 import queue
 import socket
 import selectors
@@ -23,12 +27,14 @@ import struct
 import sys
 import threading
 import time
+import warnings
 from contextlib import contextmanager
+from multiprocessing import connection as mp_connection
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from core.config import CONFIG
-from core.suites import SUITES, get_suite, header_ids_for_suite, list_suites
+from core.suites import get_suite, header_ids_for_suite, list_suites, suite_id_for
 try:
     # Optional helper (if you implemented it)
     from core.suites import header_ids_from_names  # type: ignore
@@ -36,23 +42,42 @@ except Exception:
     header_ids_from_names = None  # type: ignore
 
 from core.handshake import HandshakeVerifyError, client_drone_handshake, server_gcs_handshake
+from core.handshake_listener import HandshakeConnector, HandshakeListener
+from core.kem_pool import EphemeralKeyPool
 from core.logging_utils import get_logger
 
 from core.aead import (
-    AeadAuthError,
     AeadIds,
-    HeaderMismatch,
+    DECRYPT_AUTH,
+    DECRYPT_HEADER,
+    DECRYPT_OTHER,
+    DECRYPT_REASONS,
+    DECRYPT_REPLAY,
+    DECRYPT_SEQ,
+    DECRYPT_SESSION,
+    PreAuthFilter,
     Receiver,
-    ReplayError,
     Sender,
+    chain_receiver,
 )
+from core.latency_histogram import STANDARD_PERCENTILES, LatencyHistogram
+from core.metrics_endpoint import MetricsEndpoint, supported as metrics_endpoint_supported
+from core.status_block import COUNTER_FIELDS, StatusBlockWriter, take_export_request, block_path as status_block_path
+from core.udp_batch import BatchReceiver, BatchSender
+
+try:  # Optional faster event loop for the asyncio engine
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None  # type: ignore
 
 from core.policy_engine import (
     ControlResult,
     ControlState,
     create_control_state,
+    enqueue_json,
     handle_control,
     record_rekey_result,
+    request_prefetch,
     request_prepare,
 )
 
@@ -60,9 +85,27 @@ logger = get_logger("pqc")
 
 
 class ProxyCounters:
-    """Simple counters for proxy statistics."""
+    """Simple counters for proxy statistics.
+
+    Data-plane fields (packet counts, drop reasons, AEAD primitive timings) have
+    a single writer, the thread servicing the sockets, which updates them
+    through ``count``/``drop``/``record_*`` without taking a lock. Each update
+    bumps ``_seq`` to an odd value before touching fields and back to even
+    afterwards; ``snapshot`` retries its copy until it observes the same even
+    sequence on both sides. Control-plane fields (``rekeys_*``,
+    ``last_rekey_*``, ``handshake_metrics``) are written by rekey threads under
+    the proxy's ``counters_lock`` and must not go through these helpers.
+
+    ``instrumentation``/``sample_every`` describe how the proxy fed the
+    primitive timings: with "sampled", ``primitive_metrics`` and the latency
+    histograms cover one packet in ``sample_every``; with "off" they stay empty.
+    Packet and drop counters are exact at every level.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, instrumentation: str = "full", sample_every: int = 1) -> None:
+        self._seq = 0
+        self.instrumentation = instrumentation
+        self.sample_every = sample_every
         self.ptx_out = 0      # plaintext packets sent out to app
         self.ptx_in = 0       # plaintext packets received from app
         self.enc_out = 0      # encrypted packets sent to peer
@@ -75,10 +118,19 @@ class ProxyCounters:
         self.drop_session_epoch = 0
         self.drop_other = 0
         self.drop_src_addr = 0
+        # Subset of the drops above shed by the pre-authentication filter (no AEAD work).
+        self.shed_header = 0
+        self.shed_auth = 0  # too short to carry a tag
+        self.shed_session = 0
+        self.shed_replay = 0
+        self.shed_seq = 0
+        self.enc_in_grace = 0  # accepted under the previous session during a rekey grace period
         self.rekeys_ok = 0
         self.rekeys_fail = 0
         self.last_rekey_ms = 0
         self.last_rekey_suite: Optional[str] = None
+        # How long the last rekey held context_lock (data plane blocked) to swap sessions.
+        self.last_rekey_swap_ns = 0
         self.handshake_metrics: Dict[str, object] = {}
         self._primitive_templates = {
             "count": 0,
@@ -93,6 +145,10 @@ class ProxyCounters:
             "aead_decrypt_ok": dict(self._primitive_templates),
             "aead_decrypt_fail": dict(self._primitive_templates),
         }
+        # Log-linear duration histograms per AEAD primitive and per decrypt drop reason.
+        self.latency_histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram() for name in self._HISTOGRAM_KEYS
+        }
 
     @staticmethod
     def _ns_to_ms(value: object) -> float:
@@ -160,6 +216,11 @@ class ProxyCounters:
         summary["aead_decrypt_avg_ms"] = self._ns_to_ms(_avg_ns_for("aead_decrypt_ok"))
         summary["aead_encrypt_ms"] = summary["aead_encrypt_avg_ms"]
         summary["aead_decrypt_ms"] = summary["aead_decrypt_avg_ms"]
+        for prefix, key in (("aead_encrypt", "aead_encrypt"), ("aead_decrypt", "aead_decrypt_ok")):
+            histogram = self.latency_histograms.get(key)
+            for name, pct in STANDARD_PERCENTILES:
+                value_ns = histogram.value_at_percentile(pct) if histogram is not None else 0
+                summary[f"{prefix}_{name}_ms"] = self._ns_to_ms(value_ns)
 
         summary["rekey_ms"] = self._ns_to_ms(handshake.get("handshake_total_ns"))
 
@@ -199,12 +260,22 @@ class ProxyCounters:
             "drop_session_epoch": self.drop_session_epoch,
             "drop_other": self.drop_other,
             "drop_src_addr": self.drop_src_addr,
+            "shed_header": self.shed_header,
+            "shed_auth": self.shed_auth,
+            "shed_session": self.shed_session,
+            "shed_replay": self.shed_replay,
+            "shed_seq": self.shed_seq,
+            "enc_in_grace": self.enc_in_grace,
             "rekeys_ok": self.rekeys_ok,
             "rekeys_fail": self.rekeys_fail,
             "last_rekey_ms": self.last_rekey_ms,
             "last_rekey_suite": self.last_rekey_suite or "",
+            "last_rekey_swap_ns": self.last_rekey_swap_ns,
             "handshake_metrics": self.handshake_metrics,
             "primitive_metrics": {name: _serialize(stats) for name, stats in self.primitive_metrics.items()},
+            "latency_histograms": {name: hist.to_dict() for name, hist in self.latency_histograms.items()},
+            "instrumentation": self.instrumentation,
+            "instrumentation_sample_every": self.sample_every,
         }
 
         part_b = self._part_b_metrics()
@@ -216,26 +287,151 @@ class ProxyCounters:
         return result
 
     def _update_primitive(self, key: str, duration_ns: int, in_bytes: int, out_bytes: int) -> None:
-        stats = self.primitive_metrics.setdefault(key, dict(self._primitive_templates))
-        stats["count"] = int(stats.get("count", 0) or 0) + 1
-        stats["total_ns"] = int(stats.get("total_ns", 0) or 0) + max(0, int(duration_ns))
-        current_min = stats.get("min_ns")
-        if current_min in (None, 0) or (isinstance(current_min, int) and duration_ns < current_min):
-            stats["min_ns"] = max(0, int(duration_ns))
-        current_max = stats.get("max_ns", 0) or 0
-        if duration_ns > current_max:
-            stats["max_ns"] = max(0, int(duration_ns))
-        stats["total_in_bytes"] = int(stats.get("total_in_bytes", 0) or 0) + max(0, int(in_bytes))
-        stats["total_out_bytes"] = int(stats.get("total_out_bytes", 0) or 0) + max(0, int(out_bytes))
+        # Per-packet path: callers pass ints, so avoid re-coercing every field.
+        stats = self.primitive_metrics.get(key)
+        if stats is None:
+            stats = self.primitive_metrics[key] = dict(self._primitive_templates)
+        if duration_ns < 0:
+            duration_ns = 0
+        stats["count"] += 1
+        stats["total_ns"] += duration_ns
+        current_min = stats["min_ns"]
+        if not current_min or duration_ns < current_min:
+            stats["min_ns"] = duration_ns
+        if duration_ns > stats["max_ns"]:
+            stats["max_ns"] = duration_ns
+        stats["total_in_bytes"] += in_bytes
+        stats["total_out_bytes"] += out_bytes
+        self._histogram(key).record(duration_ns)
+
+    def _histogram(self, key: str) -> LatencyHistogram:
+        histogram = self.latency_histograms.get(key)
+        if histogram is None:
+            histogram = self.latency_histograms[key] = LatencyHistogram()
+        return histogram
 
     def record_encrypt(self, duration_ns: int, plaintext_bytes: int, ciphertext_bytes: int) -> None:
+        self._seq += 1
         self._update_primitive("aead_encrypt", duration_ns, plaintext_bytes, ciphertext_bytes)
+        self._seq += 1
 
     def record_decrypt_ok(self, duration_ns: int, ciphertext_bytes: int, plaintext_bytes: int) -> None:
+        self._seq += 1
         self._update_primitive("aead_decrypt_ok", duration_ns, ciphertext_bytes, plaintext_bytes)
-
-    def record_decrypt_fail(self, duration_ns: int, ciphertext_bytes: int) -> None:
+        self._seq += 1
+
+    def record_decrypt_fail(
+        self, duration_ns: int, ciphertext_bytes: int, drop_reason: Optional[str] = None
+    ) -> None:
+        """Record a failed decrypt; ``drop_reason`` (e.g. ``"drop_auth"``) also counts the drop."""
+        self._seq += 1
+        if drop_reason is not None:
+            self.drops += 1
+            setattr(self, drop_reason, getattr(self, drop_reason) + 1)
+            self._histogram(drop_reason).record(max(0, duration_ns))
         self._update_primitive("aead_decrypt_fail", duration_ns, ciphertext_bytes, 0)
+        self._seq += 1
+
+    def count(self, field: str, amount: int = 1) -> None:
+        """Add ``amount`` to a data-plane counter such as ``ptx_in`` (writer thread only)."""
+        self._seq += 1
+        setattr(self, field, getattr(self, field) + amount)
+        self._seq += 1
+
+    def drop(self, reason: Optional[str], amount: int = 1) -> None:
+        """Count ``amount`` drops, classified under ``reason`` (e.g. ``"drop_other"``) when given."""
+        if amount <= 0:
+            return
+        self._seq += 1
+        self.drops += amount
+        if reason is not None:
+            setattr(self, reason, getattr(self, reason) + amount)
+        self._seq += 1
+
+    def shed(self, shed_field: str, drop_reason: str, amount: int = 1) -> None:
+        """Count ``amount`` received datagrams (``enc_in``) shed by the pre-auth filter as drops."""
+        if amount <= 0:
+            return
+        self._seq += 1
+        self.enc_in += amount
+        self.drops += amount
+        setattr(self, drop_reason, getattr(self, drop_reason) + amount)
+        setattr(self, shed_field, getattr(self, shed_field) + amount)
+        self._seq += 1
+
+    def snapshot(self) -> "ProxyCounters":
+        """Return a consistent copy without blocking the data-plane writer.
+
+        Callers that also need consistent control-plane fields should hold
+        ``counters_lock`` while calling this; the writer never takes it.
+        """
+        while True:
+            start = self._seq
+            if start & 1:
+                # Writer was preempted mid-update; release the GIL so it can finish.
+                time.sleep(0)
+                continue
+            copy = ProxyCounters.__new__(ProxyCounters)
+            copy.__dict__.update(self.__dict__)
+            copy.primitive_metrics = {name: dict(stats) for name, stats in self.primitive_metrics.items()}
+            copy.latency_histograms = {name: hist.copy() for name, hist in self.latency_histograms.items()}
+            if self._seq == start:
+                copy._seq = 0
+                return copy
+
+    _HISTOGRAM_KEYS = (
+        "aead_encrypt",
+        "aead_decrypt_ok",
+        "aead_decrypt_fail",
+        "drop_replay",
+        "drop_auth",
+        "drop_header",
+        "drop_session_epoch",
+        "drop_other",
+    )
+
+    _SUMMED_FIELDS = (
+        "ptx_out",
+        "ptx_in",
+        "enc_out",
+        "enc_in",
+        "drops",
+        "drop_replay",
+        "drop_auth",
+        "drop_header",
+        "drop_session_epoch",
+        "drop_other",
+        "drop_src_addr",
+        "shed_header",
+        "shed_auth",
+        "shed_session",
+        "shed_replay",
+        "shed_seq",
+        "enc_in_grace",
+        "rekeys_ok",
+        "rekeys_fail",
+    )
+
+    def merge(self, other: "ProxyCounters") -> None:
+        """Accumulate another counter set (e.g. a data-plane worker's) into this one."""
+        for name in self._SUMMED_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        if other.last_rekey_ms > self.last_rekey_ms:
+            self.last_rekey_ms = other.last_rekey_ms
+            self.last_rekey_suite = other.last_rekey_suite
+            self.last_rekey_swap_ns = other.last_rekey_swap_ns
+        if not self.handshake_metrics and other.handshake_metrics:
+            self.handshake_metrics = dict(other.handshake_metrics)
+        for key, theirs in other.primitive_metrics.items():
+            ours = self.primitive_metrics.setdefault(key, dict(self._primitive_templates))
+            for field_name in ("count", "total_ns", "total_in_bytes", "total_out_bytes"):
+                ours[field_name] = int(ours.get(field_name, 0) or 0) + int(theirs.get(field_name, 0) or 0)
+            their_min = theirs.get("min_ns")
+            if their_min and (not ours.get("min_ns") or their_min < ours["min_ns"]):
+                ours["min_ns"] = their_min
+            ours["max_ns"] = max(int(ours.get("max_ns", 0) or 0), int(theirs.get("max_ns", 0) or 0))
+        for key, histogram in other.latency_histograms.items():
+            self._histogram(key).merge(histogram)
 
 
 def _dscp_to_tos(dscp: Optional[int]) -> Optional[int]:
@@ -310,6 +506,97 @@ class _TokenBucket:
         return False
 
 
+_RX_BUFFER_SIZE = 16384
+
+# Receiver.try_decrypt status -> drop counter.
+_DECRYPT_DROPS = {
+    DECRYPT_HEADER: "drop_header",
+    DECRYPT_SESSION: "drop_session_epoch",
+    DECRYPT_REPLAY: "drop_replay",
+    DECRYPT_AUTH: "drop_auth",
+    DECRYPT_OTHER: "drop_other",
+}
+# Same mapping keyed by the BatchResult.errors reason strings of decrypt_many.
+_BATCH_DROPS = {DECRYPT_REASONS[status]: drop for status, drop in _DECRYPT_DROPS.items()}
+# PreAuthFilter status -> (shed counter, drop counter), classified as try_decrypt
+# would; a seq too far ahead of the replay window is a replay-window drop.
+_SHED_COUNTERS = {
+    DECRYPT_HEADER: ("shed_header", "drop_header"),
+    DECRYPT_AUTH: ("shed_auth", "drop_auth"),
+    DECRYPT_SESSION: ("shed_session", "drop_session_epoch"),
+    DECRYPT_REPLAY: ("shed_replay", "drop_replay"),
+    DECRYPT_SEQ: ("shed_seq", "drop_replay"),
+}
+
+_ENGINES = ("selectors", "asyncio")
+_INSTRUMENTATION_LEVELS = ("off", "sampled", "full")
+# Sharded data plane: how often workers report counters, and how long shutdown waits.
+_SHARD_REPORT_INTERVAL_S = 0.25
+_SHARD_STOP_TIMEOUT_S = 2.0
+
+
+def _timing_sampler(level: str, sample_every: int = 1) -> Iterator[bool]:
+    """Endless per-packet answers to "time this encrypt/decrypt?" for ``level``.
+
+    The hot path only calls ``next()`` on the result. itertools objects answer
+    from C, so "off" and "full" add no Python frame and "sampled" times exactly
+    one packet in every ``sample_every``.
+    """
+    if level == "off":
+        return itertools.repeat(False)
+    if level == "sampled" and sample_every > 1:
+        return itertools.cycle((True,) + (False,) * (sample_every - 1))
+    return itertools.repeat(True)
+
+
+class _RecvRing:
+    """Ring of preallocated datagram buffers filled with ``recvfrom_into``.
+
+    ``recv`` returns a memoryview over the bytes just written, so the datagram
+    reaches the AEAD without a per-packet bytes allocation. A returned view is
+    only valid until its slot comes round again ``slots`` receives later.
+    With ``headroom`` > 0 each slot reserves leading bytes that callers can
+    fill (e.g. the packet-type byte) to frame a payload without copying it.
+    """
+
+    def __init__(self, slots: int, size: int = _RX_BUFFER_SIZE, headroom: int = 0) -> None:
+        self._headroom = headroom
+        self._slots = [memoryview(bytearray(size + headroom)) for _ in range(max(1, slots))]
+        self._rx_views = [slot[headroom:] for slot in self._slots]
+        self._next = 0
+
+    def recv(self, sock: socket.socket, prefix: Optional[int] = None) -> Tuple[memoryview, Tuple[str, int]]:
+        """Receive one datagram; with ``prefix`` set, the first headroom byte holds it."""
+        idx = self._next
+        self._next = (idx + 1) % len(self._slots)
+        nbytes, addr = sock.recvfrom_into(self._rx_views[idx])
+        if prefix is None:
+            return self._rx_views[idx][:nbytes], addr
+        slot = self._slots[idx]
+        slot[self._headroom - 1] = prefix
+        return slot[self._headroom - 1 : self._headroom + nbytes], addr
+
+
+class _DatagramBridge(asyncio.DatagramProtocol):
+    """Forward datagrams received on an asyncio transport to a plain callback."""
+
+    def __init__(self, on_datagram: Callable[[bytes, Tuple[str, int]], None], label: str) -> None:
+        self._on_datagram = on_datagram
+        self._label = label
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self._on_datagram(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        logger.debug("Datagram transport error", extra={"socket": self._label, "error": str(exc)})
+
+
+def _new_event_loop(cfg: dict) -> asyncio.AbstractEventLoop:
+    if uvloop is not None and cfg.get("ASYNCIO_UVLOOP", True):
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
 def _validate_config(cfg: dict) -> None:
     """Validate required configuration keys are present."""
     required_keys = [
@@ -323,6 +610,43 @@ def _validate_config(cfg: dict) -> None:
             raise NotImplementedError(f"CONFIG missing: {key}")
 
 
+def _open_handshake_listener(cfg: dict) -> HandshakeListener:
+    """Bind the GCS handshake port with the drone allowlist and per-IP rate limit."""
+    allowed_ips = {str(cfg["DRONE_HOST"])}
+    allowlist = cfg.get("DRONE_HOST_ALLOWLIST", []) or []
+    if isinstance(allowlist, (list, tuple, set)):
+        for entry in allowlist:
+            allowed_ips.add(str(entry))
+    else:
+        allowed_ips.add(str(allowlist))
+    gate = _TokenBucket(
+        cfg.get("HANDSHAKE_RL_BURST", 5),
+        cfg.get("HANDSHAKE_RL_REFILL_PER_SEC", 1),
+    )
+    return HandshakeListener(("0.0.0.0", cfg["TCP_HANDSHAKE_PORT"]), allowed_ips, gate)
+
+
+def _open_metrics_endpoint(
+    path: Optional[str], cfg: dict, role: str, sample: Callable[[Set[str]], Dict[str, object]]
+) -> Optional[MetricsEndpoint]:
+    """Start the live metrics socket, or return None when disabled or unavailable."""
+    if not path:
+        return None
+    if not metrics_endpoint_supported():
+        logger.warning("METRICS_SOCKET needs Unix domain sockets; endpoint disabled", extra={"role": role})
+        return None
+    try:
+        return MetricsEndpoint(
+            Path(path).expanduser(), sample, interval_s=float(cfg.get("METRICS_INTERVAL_S", 0.25))
+        )
+    except OSError as exc:
+        logger.warning(
+            "Metrics endpoint unavailable",
+            extra={"role": role, "error": str(exc), "path": str(path)},
+        )
+        return None
+
+
 def _perform_handshake(
     role: str,
     suite: dict,
@@ -331,6 +655,9 @@ def _perform_handshake(
     cfg: dict,
     stop_after_seconds: Optional[float] = None,
     ready_event: Optional[threading.Event] = None,
+    key_pool: Optional[EphemeralKeyPool] = None,
+    listener: Optional[HandshakeListener] = None,
+    connector: Optional[HandshakeConnector] = None,
 ) -> Tuple[
     bytes,
     bytes,
@@ -342,7 +669,11 @@ def _perform_handshake(
     Tuple[str, int],
     Dict[str, object],
 ]:
-    """Perform TCP handshake and return keys, session details, and authenticated peer address."""
+    """Perform TCP handshake and return keys, session details, and authenticated peer address.
+
+    The GCS takes its connection from `listener` when given (otherwise a listener
+    is opened for this handshake only); the drone connects through `connector`.
+    """
     try:
         io_timeout = float(stop_after_seconds) if stop_after_seconds else float(cfg.get("REKEY_HANDSHAKE_TIMEOUT", 20.0))
     except (TypeError, ValueError):
@@ -354,23 +685,18 @@ def _perform_handshake(
         if gcs_sig_secret is None:
             raise NotImplementedError("GCS signature secret not provided")
 
-        server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        server_sock.bind(("0.0.0.0", cfg["TCP_HANDSHAKE_PORT"]))
-        server_sock.listen(32)
+        owns_listener = listener is None
+        if listener is None:
+            listener = _open_handshake_listener(cfg)
 
         if ready_event:
             ready_event.set()
 
         timeout = stop_after_seconds if stop_after_seconds is not None else 30.0
+        started = time.monotonic()
         deadline: Optional[float] = None
         if stop_after_seconds is not None:
-            deadline = time.monotonic() + stop_after_seconds
-
-        gate = _TokenBucket(
-            cfg.get("HANDSHAKE_RL_BURST", 5),
-            cfg.get("HANDSHAKE_RL_REFILL_PER_SEC", 1),
-        )
+            deadline = started + stop_after_seconds
 
         try:
             try:
@@ -379,50 +705,31 @@ def _perform_handshake(
                         remaining = deadline - time.monotonic()
                         if remaining <= 0:
                             raise socket.timeout
-                        server_sock.settimeout(max(0.01, remaining))
+                        conn, addr, queued_at = listener.accept(max(0.01, remaining))
                     else:
-                        server_sock.settimeout(timeout)
+                        conn, addr, queued_at = listener.accept(timeout)
 
-                    conn, addr = server_sock.accept()
                     try:
                         ip, _port = addr
-                        allowed_ips = {str(cfg["DRONE_HOST"])}
-                        allowlist = cfg.get("DRONE_HOST_ALLOWLIST", []) or []
-                        if isinstance(allowlist, (list, tuple, set)):
-                            for entry in allowlist:
-                                allowed_ips.add(str(entry))
-                        else:
-                            allowed_ips.add(str(allowlist))
-                        if ip not in allowed_ips:
-                            logger.warning(
-                                "Rejected handshake from unauthorized IP",
-                                extra={"role": role, "expected": sorted(allowed_ips), "received": ip},
-                            )
-                            conn.close()
-                            continue
-
-                        if not gate.allow(ip):
-                            try:
-                                conn.settimeout(0.2)
-                                conn.sendall(b"\x00")
-                            except Exception:
-                                pass
-                            finally:
-                                conn.close()
-                            logger.warning(
-                                "Handshake rate-limit drop",
-                                extra={"role": role, "ip": ip},
-                            )
-                            continue
-
                         try:
-                            result = server_gcs_handshake(conn, suite, gcs_sig_secret, timeout=io_timeout)
+                            result = server_gcs_handshake(
+                                conn, suite, gcs_sig_secret, timeout=io_timeout, key_pool=key_pool
+                            )
                         except HandshakeVerifyError:
                             logger.warning(
                                 "Rejected drone handshake with failed authentication",
                                 extra={"role": role, "expected": cfg["DRONE_HOST"], "received": ip},
                             )
                             continue
+                        except ConnectionError as exc:
+                            if queued_at >= started:
+                                raise
+                            # A pre-opened connection the drone abandoned while it waited in the queue.
+                            logger.info(
+                                "Discarded stale handshake connection",
+                                extra={"role": role, "ip": ip, "error": str(exc)},
+                            )
+                            continue
                         # Support either 5-tuple or 7-tuple
                         metrics_payload: Dict[str, object] = {}
                         if len(result) >= 7:
@@ -454,15 +761,17 @@ def _perform_handshake(
             except socket.timeout:
                 raise NotImplementedError("No drone connection received within timeout")
         finally:
-            server_sock.close()
+            if owns_listener:
+                listener.close()
 
     elif role == "drone":
         if gcs_sig_public is None:
             raise NotImplementedError("GCS signature public key not provided")
 
-        client_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if connector is None:
+            connector = HandshakeConnector((cfg["GCS_HOST"], cfg["TCP_HANDSHAKE_PORT"]))
+        client_sock = connector.connect()
         try:
-            client_sock.connect((cfg["GCS_HOST"], cfg["TCP_HANDSHAKE_PORT"]))
             peer_ip, _peer_port = client_sock.getpeername()
             result = client_drone_handshake(client_sock, suite, gcs_sig_public, timeout=io_timeout)
             metrics_payload: Dict[str, object] = {}
@@ -489,6 +798,7 @@ def _perform_handshake(
             )
         finally:
             client_sock.close()
+            connector.replenish()
     else:
         raise ValueError(f"Invalid role: {role}")
 
@@ -606,6 +916,9 @@ def _build_sender_receiver(
             cfg["REPLAY_WINDOW"],
             aead_token=aead_token,
         )
+    # Pay lazy cipher setup here, before callers publish the pair to the data plane.
+    sender.warm_up()
+    receiver.warm_up()
     return sender, receiver
 
 
@@ -631,7 +944,7 @@ def _launch_manual_console(control_state: ControlState, *, quiet: bool) -> Tuple
 
     def operator_loop() -> None:
         if not quiet:
-            print("Manual control ready. Type a suite ID, 'list', 'status', or 'quit'.")
+            print("Manual control ready. Type a suite ID, 'prefetch <suite>', 'list', 'status', or 'quit'.")
         while not stop_event.is_set():
             try:
                 line = input("rekey> ")
@@ -659,6 +972,16 @@ def _launch_manual_console(control_state: ControlState, *, quiet: bool) -> Tuple
                 if not quiet:
                     print(summary)
                 continue
+            if lowered.startswith("prefetch "):
+                try:
+                    target_suite = get_suite(line.split(None, 1)[1].strip())
+                    request_prefetch(control_state, target_suite["suite_id"])
+                    if not quiet:
+                        print(f"prefetch hint sent for {target_suite['suite_id']}")
+                except Exception as exc:
+                    if not quiet:
+                        print(f"Invalid suite: {exc}")
+                continue
             try:
                 target_suite = get_suite(line)
                 rid = request_prepare(control_state, target_suite["suite_id"])
@@ -692,27 +1015,55 @@ def run_proxy(
     quiet: bool = False,
     ready_event: Optional[threading.Event] = None,
     status_file: Optional[str] = None,
+    metrics_socket: Optional[str] = None,
     load_gcs_secret: Optional[Callable[[Dict[str, object]], object]] = None,
     load_gcs_public: Optional[Callable[[Dict[str, object]], bytes]] = None,
+    engine: Optional[str] = None,
 ) -> Dict[str, object]:
     """
     Start a blocking proxy process for `role` in {"drone","gcs"}.
 
     Performs the TCP handshake, bridges plaintext/encrypted UDP, and processes
     in-band control messages for rekey negotiation. Returns counters on clean exit.
+    `engine` selects "selectors" (default) or "asyncio"; None reads PROXY_ENGINE.
+    `metrics_socket` is a Unix socket path for live metrics subscribers
+    (core.metrics_endpoint); None reads METRICS_SOCKET.
     """
     if role not in {"drone", "gcs"}:
         raise ValueError(f"Invalid role: {role}")
+    engine = engine or cfg.get("PROXY_ENGINE", "selectors")
+    if engine not in _ENGINES:
+        raise ValueError(f"Invalid engine: {engine}")
+    instrumentation = cfg.get("INSTRUMENTATION_LEVEL", "full")
+    if instrumentation not in _INSTRUMENTATION_LEVELS:
+        raise ValueError(f"Invalid instrumentation level: {instrumentation}")
+    sample_every = int(cfg.get("INSTRUMENTATION_SAMPLE_EVERY", 64)) if instrumentation == "sampled" else 1
 
     _validate_config(cfg)
 
     cfg = dict(cfg)
     cfg["SUITE_AEAD_TOKEN"] = suite.get("aead_token", "aesgcm")
 
-    counters = ProxyCounters()
+    counters = ProxyCounters(instrumentation, sample_every)
     counters_lock = threading.Lock()
     start_time = time.time()
 
+    # Sharded data plane: worker processes keyed by direction, plus the latest
+    # counter snapshot each one reported (merged into the parent's view).
+    shards: Optional[Dict[str, Dict[str, object]]] = None
+    shard_counters: Dict[str, ProxyCounters] = {}
+
+    def _merged_counters() -> ProxyCounters:
+        """Return a consistent copy of the parent counters plus every worker snapshot.
+
+        Call under counters_lock so control-plane fields are stable; the
+        data-plane fields are copied through the lock-free ``snapshot``.
+        """
+        total = counters.snapshot()
+        for snapshot in shard_counters.values():
+            total.merge(snapshot)
+        return total
+
     status_path: Optional[Path] = None
     if status_file:
         status_path = Path(status_file).expanduser()
@@ -736,9 +1087,74 @@ def run_proxy(
             raise NotImplementedError("GCS signature public key not provided (provide peer key or loader)")
         gcs_sig_public = load_gcs_public(suite)
 
-    handshake_result = _perform_handshake(
-        role, suite, gcs_sig_secret, gcs_sig_public, cfg, stop_after_seconds, ready_event
-    )
+    suite_id = suite.get("suite_id")
+    if not suite_id:
+        suite_id = suite_id_for(suite) or "unknown"
+
+    def _sample_metrics(topics: Set[str]) -> Dict[str, object]:
+        with counters_lock:
+            snapshot = _merged_counters()
+        data: Dict[str, object] = {}
+        if "counters" in topics:
+            scalars: Dict[str, object] = {name: getattr(snapshot, name) for name in COUNTER_FIELDS}
+            scalars["suite"] = snapshot.last_rekey_suite or suite_id
+            scalars["last_rekey_suite"] = snapshot.last_rekey_suite or ""
+            data["counters"] = scalars
+        if "histograms" in topics:
+            data["histograms"] = {
+                name: dict(hist.percentiles(), count=hist.total_count)
+                for name, hist in snapshot.latency_histograms.items()
+            }
+        return data
+
+    # Opened before the handshake so subscribers already see handshake_ok.
+    metrics_endpoint = _open_metrics_endpoint(metrics_socket or cfg.get("METRICS_SOCKET"), cfg, role, _sample_metrics)
+
+    def publish_event(payload: Dict[str, object]) -> None:
+        if metrics_endpoint is not None:
+            metrics_endpoint.publish_event(payload)
+
+    # GCS only: ephemeral KEM keypairs generated ahead of each ServerHello.
+    key_pool: Optional[EphemeralKeyPool] = None
+    pool_settings = cfg.get("KEM_POOL") or {}
+    if role == "gcs" and pool_settings.get("enabled", False):
+        key_pool = EphemeralKeyPool(pool_settings)
+        key_pool.prefetch(suite["suite_id"])
+
+    # The handshake endpoint outlives individual handshakes so rekeys skip the
+    # bind/listen (GCS) and, with HANDSHAKE_PREOPEN, the TCP connect (drone).
+    listener: Optional[HandshakeListener] = None
+    connector: Optional[HandshakeConnector] = None
+    try:
+        if role == "gcs" and cfg.get("HANDSHAKE_PERSISTENT_LISTENER", True):
+            listener = _open_handshake_listener(cfg)
+        elif role == "drone":
+            connector = HandshakeConnector(
+                (cfg["GCS_HOST"], cfg["TCP_HANDSHAKE_PORT"]),
+                preopen=bool(cfg.get("HANDSHAKE_PREOPEN", False)),
+            )
+        handshake_result = _perform_handshake(
+            role,
+            suite,
+            gcs_sig_secret,
+            gcs_sig_public,
+            cfg,
+            stop_after_seconds,
+            ready_event,
+            key_pool,
+            listener=listener,
+            connector=connector,
+        )
+    except BaseException:
+        if key_pool is not None:
+            key_pool.close()
+        if listener is not None:
+            listener.close()
+        if connector is not None:
+            connector.close()
+        if metrics_endpoint is not None:
+            metrics_endpoint.close()
+        raise
 
     if len(handshake_result) >= 9:
         (
@@ -765,13 +1181,6 @@ def run_proxy(
         ) = handshake_result
         handshake_metrics = {}
 
-    suite_id = suite.get("suite_id")
-    if not suite_id:
-        try:
-            suite_id = next((sid for sid, s in SUITES.items() if dict(s) == suite), "unknown")
-        except Exception:
-            suite_id = "unknown"
-
     status_payload = {
         "status": "handshake_ok",
         "suite": suite_id,
@@ -780,6 +1189,7 @@ def run_proxy(
     if handshake_metrics:
         status_payload["handshake_metrics"] = handshake_metrics
     write_status(status_payload)
+    publish_event(status_payload)
 
     sess_display = (
         session_id.hex()
@@ -799,33 +1209,55 @@ def run_proxy(
         },
     )
 
-    # Periodically persist counters to the status file while the proxy runs.
-    # This allows external automation (scheduler) to observe enc_in/enc_out
-    # during long-running experiments without waiting for process exit.
+    # Periodically persist counters while the proxy runs so external automation
+    # (scheduler) can observe enc_in/enc_out during long-running experiments
+    # without waiting for process exit. With STATUS_BLOCK the scalar counters are
+    # updated in place in an mmap'd block and the full JSON is only written when a
+    # reader asks for it (core.status_block.request_json_export).
     stop_status_writer = threading.Event()
+    status_block: Optional[StatusBlockWriter] = None
+    if status_path is not None and cfg.get("STATUS_BLOCK", True):
+        try:
+            status_block = StatusBlockWriter(status_block_path(status_path))
+        except OSError as exc:
+            logger.warning(
+                "Status block unavailable; writing status JSON every tick",
+                extra={"role": role, "error": str(exc)},
+            )
+
+    def _write_running_status() -> None:
+        if status_path is None:
+            return
+        try:
+            with counters_lock:
+                snapshot = _merged_counters()
+            if status_block is not None:
+                status_block.publish(vars(snapshot), suite=suite_id)
+                if not take_export_request(status_path):
+                    return
+            write_status({
+                "status": "running",
+                "suite": suite_id,
+                "counters": snapshot.to_dict(),
+                "ts_ns": time.time_ns(),
+            })
+        except Exception:
+            logger.debug("status writer failed", extra={"role": role})
 
     def _status_writer() -> None:
         while not stop_status_writer.is_set():
-            try:
-                with counters_lock:
-                    payload = {
-                        "status": "running",
-                        "suite": suite_id,
-                        "counters": counters.to_dict(),
-                        "ts_ns": time.time_ns(),
-                    }
-                write_status(payload)
-            except Exception:
-                logger.debug("status writer failed", extra={"role": role})
+            _write_running_status()
             # sleep with event to allow quick shutdown
             stop_status_writer.wait(1.0)
 
     status_thread: Optional[threading.Thread] = None
-    try:
-        status_thread = threading.Thread(target=_status_writer, daemon=True)
-        status_thread.start()
-    except Exception:
-        status_thread = None
+    if engine != "asyncio":
+        # The asyncio engine runs the status writer as a task on its loop instead.
+        try:
+            status_thread = threading.Thread(target=_status_writer, daemon=True)
+            status_thread.start()
+        except Exception:
+            status_thread = None
 
     aead_ids = _compute_aead_ids(suite, kem_name, sig_name)
     sender, receiver = _build_sender_receiver(role, aead_ids, session_id, k_d2g, k_g2d, cfg)
@@ -854,6 +1286,75 @@ def run_proxy(
     if manual_control and role == "gcs":
         manual_stop, manual_threads = _launch_manual_console(control_state, quiet=quiet)
 
+    def _with_grace(new_receiver: Receiver, active_receiver) -> object:
+        # Make-before-break: keep accepting the outgoing session's in-flight packets.
+        return chain_receiver(
+            new_receiver,
+            active_receiver,
+            grace_seconds=float(cfg.get("REKEY_GRACE_SECONDS", 0.0)),
+            grace_packets=int(cfg.get("REKEY_GRACE_PACKETS", 0)),
+        )
+
+    def _start_rekey_thread(job: Callable[[], None]) -> None:
+        threading.Thread(target=job, daemon=True).start()
+
+    # Prefetch hints warm the key loader's own cache (run_proxy's _SuiteKeyCache)
+    # for the signing secret (gcs) or GCS public key (drone), so the matching
+    # rekey finds it loaded. One worker at a time serves the latest hint; hints
+    # arriving while it loads replace each other instead of piling up threads.
+    key_loader = load_gcs_secret if role == "gcs" else load_gcs_public
+    prefetch_lock = threading.Lock()
+    prefetch_state: Dict[str, object] = {"pending": None, "worker": None}
+
+    def _prefetch_worker() -> None:
+        while True:
+            with prefetch_lock:
+                target_suite_id = prefetch_state["pending"]
+                prefetch_state["pending"] = None
+                if target_suite_id is None:
+                    prefetch_state["worker"] = None
+                    return
+            try:
+                key_loader(get_suite(target_suite_id))  # type: ignore[misc]
+            except Exception as exc:
+                # The rekey itself retries the load and reports the failure.
+                logger.info(
+                    "Prefetch hint ignored",
+                    extra={"role": role, "suite_id": target_suite_id, "error": str(exc)},
+                )
+
+    def _prefetch_suite(target_suite_id: str) -> None:
+        # Hints are advisory and may come from the peer: never let one raise into
+        # the data plane.
+        if key_pool is not None:
+            try:
+                key_pool.prefetch(target_suite_id)
+            except Exception as exc:
+                logger.info(
+                    "Prefetch hint ignored",
+                    extra={"role": role, "suite_id": target_suite_id, "error": str(exc)},
+                )
+        if key_loader is None:
+            return
+        # Off the data plane and independent of rekey_runner: hints also arrive
+        # from the manual console thread.
+        with prefetch_lock:
+            prefetch_state["pending"] = target_suite_id
+            if prefetch_state["worker"] is not None:
+                return
+            worker = threading.Thread(target=_prefetch_worker, name="key-prefetch", daemon=True)
+            prefetch_state["worker"] = worker
+        worker.start()
+
+    control_state.on_prefetch = _prefetch_suite
+    if metrics_endpoint is not None:
+        control_state.on_rekey_result = lambda status: publish_event(
+            dict(status, status="rekey_ok" if status.get("result") == "ok" else "rekey_fail")
+        )
+
+    # Where rekey handshakes run; the asyncio engine swaps in its executor.
+    rekey_runner: Callable[[Callable[[], None]], object] = _start_rekey_thread
+
     def _launch_rekey(target_suite_id: str, rid: str) -> None:
         with rekey_guard:
             if rid in active_rekeys:
@@ -865,8 +1366,11 @@ def run_proxy(
             extra={"role": role, "suite_id": target_suite_id, "rid": rid},
         )
 
+        if key_pool is not None:
+            key_pool.prefetch(target_suite_id)
+
         def worker() -> None:
-            nonlocal gcs_sig_public
+            nonlocal gcs_sig_public, active_context
             try:
                 new_suite = get_suite(target_suite_id)
                 new_secret = None
@@ -974,7 +1478,17 @@ def run_proxy(
                 public_key = new_public if new_public is not None else gcs_sig_public
                 if role == "drone" and public_key is None:
                     raise NotImplementedError("GCS public key not available for rekey")
-                rk_result = _perform_handshake(role, new_suite, base_secret, public_key, cfg, timeout)
+                rk_result = _perform_handshake(
+                    role,
+                    new_suite,
+                    base_secret,
+                    public_key,
+                    cfg,
+                    timeout,
+                    key_pool=key_pool,
+                    listener=listener,
+                    connector=connector,
+                )
                 if len(rk_result) >= 9:
                     (
                         new_k_d2g,
@@ -1007,25 +1521,34 @@ def run_proxy(
                 new_sender, new_receiver = _build_sender_receiver(
                     role, new_ids, new_session_id, new_k_d2g, new_k_g2d, cfg
                 )
+                # Everything is built and warmed before the lock; the swap only
+                # rebinds references, so that is all the data plane waits for.
+                new_context = dict(
+                    active_context,
+                    sender=new_sender,
+                    receiver=_with_grace(new_receiver, active_context["receiver"]),
+                    session_id=new_session_id,
+                    aead_ids=new_ids,
+                    suite=new_suite["suite_id"],
+                    suite_dict=new_suite,
+                    peer_addr=new_peer_addr,
+                )
 
                 with context_lock:
-                    active_context.update(
-                        {
-                            "sender": new_sender,
-                            "receiver": new_receiver,
-                            "session_id": new_session_id,
-                            "aead_ids": new_ids,
-                            "suite": new_suite["suite_id"],
-                            "suite_dict": new_suite,
-                            "peer_addr": new_peer_addr,
-                        }
-                    )
+                    swap_start_ns = time.perf_counter_ns()
+                    active_context = new_context
                     sockets["encrypted_peer"] = new_peer_addr
+                    swap_ns = time.perf_counter_ns() - swap_start_ns
+                if shards is not None:
+                    _publish_shard_context(
+                        new_ids, new_session_id, new_k_d2g, new_k_g2d, new_peer_addr, cfg["SUITE_AEAD_TOKEN"]
+                    )
 
                 with counters_lock:
                     counters.rekeys_ok += 1
                     counters.last_rekey_ms = int(time.time() * 1000)
                     counters.last_rekey_suite = new_suite["suite_id"]
+                    counters.last_rekey_swap_ns = swap_ns
                     counters.handshake_metrics = dict(new_handshake_metrics) if new_handshake_metrics else {}
                 if role == "drone" and new_public is not None:
                     gcs_sig_public = new_public
@@ -1034,6 +1557,7 @@ def run_proxy(
                     "status": "rekey_ok",
                     "new_suite": new_suite["suite_id"],
                     "session_id": new_session_id.hex(),
+                    "swap_block_ns": swap_ns,
                 }
                 if new_handshake_metrics:
                     status_payload["handshake_metrics"] = new_handshake_metrics
@@ -1068,14 +1592,55 @@ def run_proxy(
                 with rekey_guard:
                     active_rekeys.discard(rid)
 
-        threading.Thread(target=worker, daemon=True).start()
+        rekey_runner(worker)
 
     with _setup_sockets(role, cfg, encrypted_peer=peer_addr) as sockets:
         selector = selectors.DefaultSelector()
         selector.register(sockets["encrypted"], selectors.EVENT_READ, data="encrypted")
         selector.register(sockets["plaintext_in"], selectors.EVENT_READ, data="plaintext_in")
 
+        packet_type_enabled = bool(cfg.get("ENABLE_PACKET_TYPE"))
+        # Forwarded data plaintexts carry a validated 0x01 type byte when packet typing is on.
+        data_skip = 1 if packet_type_enabled else 0
+        plaintext_prefix = 0x01 if packet_type_enabled else None
+        empty_payload_len = 1 if packet_type_enabled else 0
+
+        batch_io = bool(cfg.get("UDP_BATCH_ENABLED", False))
+        zero_copy_rx = bool(cfg.get("RX_ZERO_COPY", True))
+        if batch_io:
+            batch_size = int(cfg.get("UDP_BATCH_SIZE", 32))
+            encrypted_batch_rx = BatchReceiver(batch_size)
+            plaintext_batch_rx = BatchReceiver(batch_size, headroom=1)
+            encrypted_batch_tx = BatchSender(batch_size)
+            plaintext_batch_tx = BatchSender(batch_size)
+            logger.info(
+                "UDP batch I/O enabled",
+                extra={"role": role, "batch_size": batch_size, "backend": encrypted_batch_rx.backend},
+            )
+        elif zero_copy_rx:
+            ring_slots = int(cfg.get("RX_RING_SLOTS", 8))
+            encrypted_ring = _RecvRing(ring_slots)
+            # One byte of headroom lets the packet-type prefix be written in place.
+            plaintext_ring = _RecvRing(ring_slots, headroom=1)
+
+        # Per-packet timing decisions; separate iterators because the encrypt and
+        # decrypt sides may run on different threads (sharded data plane).
+        encrypt_timing = _timing_sampler(instrumentation, sample_every)
+        decrypt_timing = _timing_sampler(instrumentation, sample_every)
+
+        # Header-only screen that sheds forged or stale datagrams before any AEAD work.
+        preauth: Optional[PreAuthFilter] = None
+        if cfg.get("PREAUTH_FILTER", True):
+            preauth = PreAuthFilter(
+                max_seq_ahead=int(cfg.get("PREAUTH_MAX_SEQ_AHEAD", 1 << 20)),
+                probe_every=int(cfg.get("PREAUTH_PROBE_EVERY", 64)),
+            )
+
         def send_control(payload: dict) -> None:
+            if shards is not None:
+                # The uplink worker owns the live Sender (and its sequence space).
+                _shard_send("uplink", ("control", payload))
+                return
             body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
             frame = b"\x02" + body
             with context_lock:
@@ -1083,284 +1648,642 @@ def run_proxy(
             try:
                 wire = current_sender.encrypt(frame)
             except Exception as exc:
-                counters.drops += 1
-                counters.drop_other += 1
+                counters.drop("drop_other")
                 logger.warning("Failed to encrypt control payload", extra={"role": role, "error": str(exc)})
                 return
             try:
                 sockets["encrypted"].sendto(wire, sockets["encrypted_peer"])
-                counters.enc_out += 1
+                counters.count("enc_out")
             except socket.error as exc:
-                counters.drops += 1
-                counters.drop_other += 1
+                counters.drop("drop_other")
                 logger.warning("Failed to send control payload", extra={"role": role, "error": str(exc)})
 
-        try:
-            while True:
-                if stop_after_seconds is not None and (time.time() - start_time) >= stop_after_seconds:
-                    break
+        def _encrypt_outbound(payload_out) -> Optional[bytes]:
+            """Encrypt one framed app payload; returns wire bytes or None when dropped."""
+            with context_lock:
+                current_sender = active_context["sender"]
+            encrypt_start_ns = time.perf_counter_ns() if next(encrypt_timing) else 0
+            try:
+                wire = current_sender.encrypt(payload_out)
+            except Exception as exc:
+                counters.drop("drop_other")
+                logger.warning(
+                    "Encrypt failed",
+                    extra={
+                        "role": role,
+                        "error": str(exc),
+                        "payload_len": len(payload_out),
+                    },
+                )
+                return None
+            if encrypt_start_ns:
+                counters.record_encrypt(time.perf_counter_ns() - encrypt_start_ns, len(payload_out), len(wire))
+            return wire
+
+        def _encrypt_outbound_many(payloads) -> List[bytes]:
+            """Encrypt a drained burst of framed app payloads with one ``encrypt_many`` call.
+
+            Returns the wire datagrams that encrypted. A sampled burst records one
+            ``aead_encrypt`` timing: the per-packet average over the burst.
+            """
+            with context_lock:
+                current_sender = active_context["sender"]
+            encrypt_start_ns = time.perf_counter_ns() if next(encrypt_timing) else 0
+            try:
+                result = current_sender.encrypt_many(payloads)
+            except Exception as exc:
+                counters.drop("drop_other", len(payloads))
+                logger.warning(
+                    "Encrypt failed",
+                    extra={"role": role, "error": str(exc), "batch_len": len(payloads)},
+                )
+                return []
+            wires = [wire for wire in result.outputs if wire is not None]
+            if len(wires) != len(payloads):
+                counters.drop("drop_other", len(payloads) - len(wires))
+            if encrypt_start_ns and wires:
+                count = len(payloads)
+                counters.record_encrypt(
+                    (time.perf_counter_ns() - encrypt_start_ns) // count,
+                    sum(len(payload) for payload in payloads) // count,
+                    sum(len(wire) for wire in wires) // len(wires),
+                )
+            return wires
+
+        def _record_decrypt_drop(
+            start_ns: int, cipher_len: int, drop_reason: str, end_ns: Optional[int] = None
+        ) -> None:
+            """Count a decrypt drop; time it only when this packet was sampled (``start_ns`` != 0)."""
+            if start_ns:
+                elapsed_ns = (end_ns if end_ns is not None else time.perf_counter_ns()) - start_ns
+                counters.record_decrypt_fail(elapsed_ns, cipher_len, drop_reason)
+            else:
+                counters.drop(drop_reason)
+
+        def _dispatch_control(control_json: dict) -> None:
+            result = handle_control(control_json, role, control_state)
+            for note in result.notes:
+                if note.startswith("prepare_fail"):
+                    with counters_lock:
+                        counters.rekeys_fail += 1
+            for payload in result.send:
+                enqueue_json(control_state, payload)
+            if result.prefetch:
+                _prefetch_suite(result.prefetch)
+            if result.start_handshake:
+                suite_next, rid = result.start_handshake
+                _launch_rekey(suite_next, rid)
+
+        # Downlink workers replace this with a forwarder to the parent process.
+        control_sink: Callable[[dict], None] = _dispatch_control
+
+        def _from_peer(addr: Tuple[str, int], expected_peer, strict_match: bool) -> bool:
+            """Source-address check; counts and logs a ``drop_src_addr`` on mismatch."""
+            if expected_peer is None:
+                return True
+            src_ip, src_port = addr
+            exp_ip, exp_port = expected_peer  # type: ignore[misc]
+            if strict_match:
+                mismatch = src_ip != exp_ip or src_port != exp_port
+            else:
+                mismatch = src_ip != exp_ip
+            if mismatch:
+                counters.drop("drop_src_addr")
+                logger.debug(
+                    "Dropped encrypted packet from unauthorized source",
+                    extra={"role": role, "expected": expected_peer, "received": addr},
+                )
+                return False
+            return True
+
+        def _admit_batch(packets):
+            """Source-check a receive burst, then run it through the pre-auth filter.
+
+            Returns the survivors for ``_decrypt_batch``.
+            """
+            with context_lock:
+                current_receiver = active_context["receiver"]
+                expected_peer = active_context.get("peer_addr")
+                strict_match = bool(active_context.get("peer_match_strict", True))
+            packets = [(wire, addr) for wire, addr in packets if _from_peer(addr, expected_peer, strict_match)]
+            if preauth is None or not packets:
+                return packets
+            statuses = preauth.check_many(current_receiver, [wire for wire, _addr in packets])
+            shed: Dict[int, int] = {}
+            survivors = []
+            for packet, status in zip(packets, statuses):
+                if status:
+                    shed[status] = shed.get(status, 0) + 1
+                else:
+                    survivors.append(packet)
+            for status, amount in shed.items():
+                counters.shed(*_SHED_COUNTERS[status], amount)
+            return survivors
+
+        def _decrypt_inbound(wire, addr: Tuple[str, int]) -> Optional[bytes]:
+            """Authenticate and decrypt one encrypted datagram.
+
+            Returns the data plaintext (still carrying its type byte when packet
+            typing is enabled) to forward to the local app, or None when the
+            packet was dropped or consumed as a control message.
+            """
+            with context_lock:
+                current_receiver = active_context["receiver"]
+                expected_peer = active_context.get("peer_addr")
+                strict_match = bool(active_context.get("peer_match_strict", True))
+
+            if not _from_peer(addr, expected_peer, strict_match):
+                return None
+            if preauth is not None:
+                status = preauth.check(current_receiver, wire)
+                if status:
+                    counters.shed(*_SHED_COUNTERS[status])
+                    return None
+
+            counters.count("enc_in")
+
+            cipher_len = len(wire)
+            decrypt_start_ns = time.perf_counter_ns() if next(decrypt_timing) else 0
+            status, plaintext = current_receiver.try_decrypt(wire)
+            if status:
+                _record_decrypt_drop(decrypt_start_ns, cipher_len, _DECRYPT_DROPS[status])
+                if status == DECRYPT_OTHER:
+                    logger.warning(
+                        "Decrypt failed (other)",
+                        extra={"role": role, "reason": "aead_error", "wire_len": cipher_len},
+                    )
+                return None
+
+            if decrypt_start_ns:
+                counters.record_decrypt_ok(time.perf_counter_ns() - decrypt_start_ns, cipher_len, len(plaintext))
+            if current_receiver.from_previous_session:
+                counters.count("enc_in_grace")
+            return _deliver(plaintext)
+
+        def _decrypt_batch(packets) -> List[bytes]:
+            """Decrypt an admitted receive burst with one ``decrypt_many`` call.
+
+            Returns the data plaintexts to forward, as ``_decrypt_inbound`` would
+            for each datagram. A sampled burst records one decrypt timing: the
+            per-packet average over the burst.
+            """
+            with context_lock:
+                current_receiver = active_context["receiver"]
+            wires = [wire for wire, _addr in packets]
+            counters.count("enc_in", len(wires))
+            grace_before = getattr(current_receiver, "previous_accepted", 0)
+            decrypt_start_ns = time.perf_counter_ns() if next(decrypt_timing) else 0
+            result = current_receiver.decrypt_many(wires)
+            elapsed_ns = (time.perf_counter_ns() - decrypt_start_ns) // len(wires) if decrypt_start_ns else 0
+            grace = getattr(current_receiver, "previous_accepted", 0) - grace_before
+            if grace:
+                counters.count("enc_in_grace", grace)
+
+            outs: List[bytes] = []
+            timed = False
+            for wire, plaintext, reason in zip(wires, result.outputs, result.errors):
+                if reason is not None:
+                    if elapsed_ns and not timed:
+                        timed = True
+                        counters.record_decrypt_fail(elapsed_ns, len(wire), _BATCH_DROPS[reason])
+                    else:
+                        counters.drop(_BATCH_DROPS[reason])
+                    if reason == "other":
+                        logger.warning(
+                            "Decrypt failed (other)",
+                            extra={"role": role, "reason": "aead_error", "wire_len": len(wire)},
+                        )
+                    continue
+                if elapsed_ns and not timed:
+                    timed = True
+                    counters.record_decrypt_ok(elapsed_ns, len(wire), len(plaintext))
+                out = _deliver(plaintext)
+                if out is not None:
+                    outs.append(out)
+            return outs
+
+        def _deliver(plaintext: bytes) -> Optional[bytes]:
+            """Dispatch a control frame, or return a data plaintext to forward."""
+            if plaintext and plaintext[0] == 0x02:
+                try:
+                    control_json = json.loads(plaintext[1:].decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    counters.drop("drop_other")
+                    return None
+                control_sink(control_json)
+                return None
+
+            if packet_type_enabled and plaintext and plaintext[0] != 0x01:
+                counters.drop("drop_other")
+                return None
+            return plaintext
+
+        def _service_plaintext_in(sock: socket.socket) -> None:
+            """Drain app datagrams from ``sock``, encrypt and forward them to the peer."""
+            if batch_io:
+                try:
+                    packets = plaintext_batch_rx.recv(sock, plaintext_prefix)
+                except socket.error:
+                    return
+                payloads = [payload_out for payload_out, _addr in packets if len(payload_out) != empty_payload_len]
+                if not payloads:
+                    return
+                counters.count("ptx_in", len(payloads))
+                wires = _encrypt_outbound_many(payloads)
+                if wires:
+                    try:
+                        sent = encrypted_batch_tx.send(sockets["encrypted"], wires, sockets["encrypted_peer"])
+                    except socket.error:
+                        sent = 0
+                    counters.count("enc_out", sent)
+                    counters.drop(None, len(wires) - sent)
+                return
+
+            try:
+                if zero_copy_rx:
+                    payload_out, _addr = plaintext_ring.recv(sock, plaintext_prefix)
+                    if len(payload_out) == empty_payload_len:
+                        return
+                else:
+                    payload, _addr = sock.recvfrom(_RX_BUFFER_SIZE)
+                    if not payload:
+                        return
+                    payload_out = (b"\x01" + payload) if packet_type_enabled else payload
+                counters.count("ptx_in")
+
+                wire = _encrypt_outbound(payload_out)
+                if wire is None:
+                    return
+
+                try:
+                    sockets["encrypted"].sendto(wire, sockets["encrypted_peer"])
+                    counters.count("enc_out")
+                except socket.error:
+                    counters.drop(None)
+            except socket.error:
+                return
+
+        def _service_encrypted(sock: socket.socket) -> None:
+            """Drain peer datagrams from ``sock``, decrypt and forward data to the app."""
+            if batch_io:
+                try:
+                    packets = encrypted_batch_rx.recv(sock)
+                except socket.error:
+                    return
+                packets = _admit_batch([(wire, addr) for wire, addr in packets if wire])
+                outs = _decrypt_batch(packets) if packets else []
+                if outs:
+                    try:
+                        sent = plaintext_batch_tx.send(
+                            sockets["plaintext_out"], outs, sockets["plaintext_peer"], skip=data_skip
+                        )
+                    except socket.error:
+                        sent = 0
+                    counters.count("ptx_out", sent)
+                    counters.drop("drop_other", len(outs) - sent)
+                return
+
+            try:
+                if zero_copy_rx:
+                    wire, addr = encrypted_ring.recv(sock)
+                else:
+                    wire, addr = sock.recvfrom(_RX_BUFFER_SIZE)
+                if not wire:
+                    return
+
+                plaintext = _decrypt_inbound(wire, addr)
+                if plaintext is None:
+                    return
+
+                # Strip the type byte with a view rather than a copy.
+                out_bytes = memoryview(plaintext)[data_skip:] if data_skip else plaintext
+                try:
+                    sockets["plaintext_out"].sendto(out_bytes, sockets["plaintext_peer"])
+                    counters.count("ptx_out")
+                except socket.error:
+                    counters.drop("drop_other")
+            except socket.error:
+                return
+
+        def _shard_send(name: str, message: Tuple[str, object]) -> None:
+            shard = shards[name]  # type: ignore[index]
+            with shard["lock"]:  # type: ignore[attr-defined]
+                try:
+                    shard["conn"].send(message)  # type: ignore[attr-defined]
+                except (OSError, ValueError) as exc:
+                    logger.warning(
+                        "Data-plane worker unreachable",
+                        extra={"role": role, "worker": name, "error": str(exc)},
+                    )
 
+        def _publish_shard_context(
+            ids: AeadIds,
+            new_session_id: bytes,
+            new_k_d2g: bytes,
+            new_k_g2d: bytes,
+            new_peer_addr: Tuple[str, int],
+            aead_token: str,
+        ) -> None:
+            # Cipher objects are not picklable; ship key material and rebuild in each worker.
+            spec = {
+                "aead_ids": (ids.kem_id, ids.kem_param, ids.sig_id, ids.sig_param),
+                "session_id": new_session_id,
+                "k_d2g": new_k_d2g,
+                "k_g2d": new_k_g2d,
+                "peer_addr": new_peer_addr,
+                "aead_token": aead_token,
+            }
+            for name in list(shards or {}):
+                _shard_send(name, ("context", spec))
+
+        def _install_shard_context(spec: Dict[str, object]) -> None:
+            nonlocal active_context
+            worker_cfg = {"SUITE_AEAD_TOKEN": spec["aead_token"], "REPLAY_WINDOW": cfg["REPLAY_WINDOW"]}
+            new_ids = AeadIds(*spec["aead_ids"])  # type: ignore[misc]
+            new_sender, new_receiver = _build_sender_receiver(
+                role, new_ids, spec["session_id"], spec["k_d2g"], spec["k_g2d"], worker_cfg  # type: ignore[arg-type]
+            )
+            new_context = dict(
+                active_context,
+                sender=new_sender,
+                receiver=_with_grace(new_receiver, active_context["receiver"]),
+                session_id=spec["session_id"],
+                aead_ids=new_ids,
+                peer_addr=spec["peer_addr"],
+            )
+            with context_lock:
+                active_context = new_context
+                sockets["encrypted_peer"] = spec["peer_addr"]
+
+        def _shard_worker(direction: str, conn) -> None:
+            """Entry point of a forked data-plane worker (uplink or downlink)."""
+            nonlocal counters, counters_lock, context_lock, control_sink, shards
+            # Only the forking thread survives fork(): start from fresh locks and
+            # zeroed counters so the parent can merge per-worker snapshots.
+            counters = ProxyCounters(instrumentation, sample_every)
+            counters_lock = threading.Lock()
+            context_lock = threading.RLock()
+            shards = None
+            if direction == "downlink":
+                control_sink = lambda control_json: conn.send(("control", direction, control_json))
+                data_sock, service = sockets["encrypted"], _service_encrypted
+            else:
+                data_sock, service = sockets["plaintext_in"], _service_plaintext_in
+
+            worker_selector = selectors.DefaultSelector()
+            worker_selector.register(data_sock, selectors.EVENT_READ, data="data")
+            worker_selector.register(conn, selectors.EVENT_READ, data="command")
+            next_report = time.monotonic() + _SHARD_REPORT_INTERVAL_S
+            try:
                 while True:
+                    for key, _mask in worker_selector.select(timeout=_SHARD_REPORT_INTERVAL_S):
+                        if key.data == "data":
+                            service(data_sock)
+                            continue
+                        try:
+                            kind, body = conn.recv()
+                        except (EOFError, OSError):
+                            return
+                        if kind == "stop":
+                            return
+                        if kind == "context":
+                            _install_shard_context(body)
+                        elif kind == "control":
+                            send_control(body)
+                    now = time.monotonic()
+                    if now >= next_report:
+                        conn.send(("counters", direction, counters))
+                        next_report = now + _SHARD_REPORT_INTERVAL_S
+            except KeyboardInterrupt:
+                pass
+            finally:
+                try:
+                    conn.send(("counters", direction, counters))
+                    conn.send(("exited", direction, None))
+                except Exception:
+                    pass
+                worker_selector.close()
+
+        def _start_shards() -> Optional[Dict[str, Dict[str, object]]]:
+            if "fork" not in multiprocessing.get_all_start_methods():
+                logger.warning(
+                    "Sharded data plane needs fork(); continuing single-process",
+                    extra={"role": role},
+                )
+                return None
+            ctx = multiprocessing.get_context("fork")
+            started: Dict[str, Dict[str, object]] = {}
+            for direction in ("uplink", "downlink"):
+                parent_conn, child_conn = ctx.Pipe()
+                proc = ctx.Process(
+                    target=_shard_worker,
+                    args=(direction, child_conn),
+                    name=f"pqc-{role}-{direction}",
+                    daemon=True,
+                )
+                with warnings.catch_warnings():
+                    # Children rebuild every lock they touch, so the multi-threaded
+                    # fork() deprecation warning does not apply here.
+                    warnings.simplefilter("ignore", DeprecationWarning)
+                    proc.start()
+                child_conn.close()
+                started[direction] = {"process": proc, "conn": parent_conn, "lock": threading.Lock()}
+            logger.info(
+                "Sharded data plane started",
+                extra={"role": role, "workers": {name: shard["process"].pid for name, shard in started.items()}},
+            )
+            return started
+
+        def _pump_shards(timeout: float) -> bool:
+            """Handle worker reports for up to ``timeout`` seconds; False once a worker is gone."""
+            conns = {shard["conn"]: name for name, shard in shards.items()}  # type: ignore[union-attr]
+            for conn in mp_connection.wait(list(conns), timeout):
+                try:
+                    kind, name, body = conn.recv()  # type: ignore[union-attr]
+                except (EOFError, OSError):
+                    kind, name, body = "exited", conns[conn], None
+                if kind == "counters":
+                    with counters_lock:
+                        shard_counters[name] = body  # type: ignore[assignment]
+                elif kind == "control":
+                    _dispatch_control(body)  # type: ignore[arg-type]
+                elif kind == "exited":
+                    logger.error("Data-plane worker exited", extra={"role": role, "worker": name})
+                    return False
+            return True
+
+        def _stop_shards() -> None:
+            for name in shards:  # type: ignore[union-attr]
+                _shard_send(name, ("stop", None))
+            deadline = time.monotonic() + _SHARD_STOP_TIMEOUT_S
+            for name, shard in shards.items():  # type: ignore[union-attr]
+                conn = shard["conn"]
+                while conn.poll(max(0.0, deadline - time.monotonic())):  # type: ignore[attr-defined]
                     try:
-                        control_payload = control_state.outbox.get_nowait()
-                    except queue.Empty:
+                        kind, worker_name, body = conn.recv()  # type: ignore[attr-defined]
+                    except (EOFError, OSError):
+                        break
+                    if kind == "counters":
+                        with counters_lock:
+                            shard_counters[worker_name] = body  # type: ignore[assignment]
+                    elif kind == "exited":
                         break
-                    send_control(control_payload)
+                proc = shard["process"]
+                proc.join(timeout=max(0.1, deadline - time.monotonic()))  # type: ignore[attr-defined]
+                if proc.is_alive():  # type: ignore[attr-defined]
+                    proc.terminate()  # type: ignore[attr-defined]
+                    proc.join(timeout=0.5)  # type: ignore[attr-defined]
+                conn.close()  # type: ignore[attr-defined]
+
+        async def _asyncio_main() -> None:
+            nonlocal rekey_runner
+            loop = asyncio.get_running_loop()
+            outbox_ready = asyncio.Event()
+            rekey_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="pqc-rekey")
+            rekey_runner = lambda job: loop.run_in_executor(rekey_pool, job)
+            # Thread-safe: manual console and rekey workers enqueue from other threads.
+            control_state.wakeup = lambda: loop.call_soon_threadsafe(outbox_ready.set)
+
+            def on_plaintext(data: bytes, _addr: Tuple[str, int]) -> None:
+                if not data:
+                    return
+                counters.count("ptx_in")
+                wire = _encrypt_outbound((b"\x01" + data) if packet_type_enabled else data)
+                if wire is None:
+                    return
+                encrypted_transport.sendto(wire, sockets["encrypted_peer"])
+                counters.count("enc_out")
 
-                events = selector.select(timeout=0.1)
-                for key, _mask in events:
-                    sock = key.fileobj
-                    data_type = key.data
+            def on_encrypted(data: bytes, addr: Tuple[str, int]) -> None:
+                if not data:
+                    return
+                plaintext = _decrypt_inbound(data, addr)
+                if plaintext is None:
+                    return
+                plaintext_out_transport.sendto(
+                    memoryview(plaintext)[data_skip:] if data_skip else plaintext, sockets["plaintext_peer"]
+                )
+                counters.count("ptx_out")
 
-                    if data_type == "plaintext_in":
+            async def control_pump() -> None:
+                while True:
+                    await outbox_ready.wait()
+                    outbox_ready.clear()
+                    while True:
                         try:
-                            payload, _addr = sock.recvfrom(16384)
-                            if not payload:
-                                continue
-                            with counters_lock:
-                                counters.ptx_in += 1
-
-                            payload_out = (b"\x01" + payload) if cfg.get("ENABLE_PACKET_TYPE") else payload
-                            with context_lock:
-                                current_sender = active_context["sender"]
-                            encrypt_start_ns = time.perf_counter_ns()
-                            try:
-                                wire = current_sender.encrypt(payload_out)
-                            except Exception as exc:
-                                encrypt_elapsed_ns = time.perf_counter_ns() - encrypt_start_ns
-                                with counters_lock:
-                                    counters.drops += 1
-                                    counters.drop_other += 1
-                                logger.warning(
-                                    "Encrypt failed",
-                                    extra={
-                                        "role": role,
-                                        "error": str(exc),
-                                        "payload_len": len(payload_out),
-                                    },
-                                )
-                                continue
-                            encrypt_elapsed_ns = time.perf_counter_ns() - encrypt_start_ns
-                            ciphertext_len = len(wire)
-                            plaintext_len = len(payload_out)
-                            with counters_lock:
-                                counters.record_encrypt(encrypt_elapsed_ns, plaintext_len, ciphertext_len)
-
-                            try:
-                                sockets["encrypted"].sendto(wire, sockets["encrypted_peer"])
-                                with counters_lock:
-                                    counters.enc_out += 1
-                            except socket.error:
-                                with counters_lock:
-                                    counters.drops += 1
-                        except socket.error:
-                            continue
+                            control_payload = control_state.outbox.get_nowait()
+                        except queue.Empty:
+                            break
+                        send_control(control_payload)
+
+            async def status_pump() -> None:
+                while True:
+                    await loop.run_in_executor(None, _write_running_status)
+                    await asyncio.sleep(1.0)
 
-                    elif data_type == "encrypted":
+            # Open egress first: each reader may fire as soon as its endpoint exists.
+            plaintext_out_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramBridge(lambda _data, _addr: None, "plaintext_out"), sock=sockets["plaintext_out"]
+            )
+            encrypted_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramBridge(on_encrypted, "encrypted"), sock=sockets["encrypted"]
+            )
+            plaintext_in_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramBridge(on_plaintext, "plaintext_in"), sock=sockets["plaintext_in"]
+            )
+            tasks = [asyncio.ensure_future(control_pump()), asyncio.ensure_future(status_pump())]
+            if not control_state.outbox.empty():
+                outbox_ready.set()
+            try:
+                if stop_after_seconds is None:
+                    await asyncio.Event().wait()
+                else:
+                    await asyncio.sleep(max(0.0, stop_after_seconds - (time.time() - start_time)))
+            finally:
+                control_state.wakeup = None
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for transport in (encrypted_transport, plaintext_in_transport, plaintext_out_transport):
+                    transport.close()
+                rekey_pool.shutdown(wait=False)
+
+        def _run_asyncio_engine() -> None:
+            loop = _new_event_loop(cfg)
+            main_task = loop.create_task(_asyncio_main())
+            try:
+                loop.run_until_complete(main_task)
+            except KeyboardInterrupt:
+                main_task.cancel()
+                loop.run_until_complete(asyncio.gather(main_task, return_exceptions=True))
+                raise
+            finally:
+                loop.close()
+
+        if engine == "asyncio":
+            if cfg.get("SHARDED_DATA_PLANE", False):
+                logger.warning("SHARDED_DATA_PLANE is ignored by the asyncio engine", extra={"role": role})
+        elif cfg.get("SHARDED_DATA_PLANE", False):
+            shards = _start_shards()
+
+        try:
+            if engine == "asyncio":
+                _run_asyncio_engine()
+            else:
+                while True:
+                    if stop_after_seconds is not None and (time.time() - start_time) >= stop_after_seconds:
+                        break
+
+                    while True:
                         try:
-                            wire, addr = sock.recvfrom(16384)
-                            if not wire:
-                                continue
-
-                            with context_lock:
-                                current_receiver = active_context["receiver"]
-                                expected_peer = active_context.get("peer_addr")
-                                strict_match = bool(active_context.get("peer_match_strict", True))
-
-                            src_ip, src_port = addr
-                            if expected_peer is not None:
-                                exp_ip, exp_port = expected_peer  # type: ignore[misc]
-                                mismatch = False
-                                if strict_match:
-                                    mismatch = src_ip != exp_ip or src_port != exp_port
-                                else:
-                                    mismatch = src_ip != exp_ip
-                                if mismatch:
-                                    with counters_lock:
-                                        counters.drops += 1
-                                        counters.drop_src_addr += 1
-                                    logger.debug(
-                                        "Dropped encrypted packet from unauthorized source",
-                                        extra={"role": role, "expected": expected_peer, "received": addr},
-                                    )
-                                    continue
-
-                            with counters_lock:
-                                counters.enc_in += 1
-
-                            cipher_len = len(wire)
-                            decrypt_start_ns = time.perf_counter_ns()
-                            try:
-                                plaintext = current_receiver.decrypt(wire)
-                            except ReplayError:
-                                decrypt_elapsed_ns = time.perf_counter_ns() - decrypt_start_ns
-                                with counters_lock:
-                                    counters.drops += 1
-                                    counters.drop_replay += 1
-                                    counters.record_decrypt_fail(decrypt_elapsed_ns, cipher_len)
-                                continue
-                            except HeaderMismatch:
-                                decrypt_elapsed_ns = time.perf_counter_ns() - decrypt_start_ns
-                                with counters_lock:
-                                    counters.drops += 1
-                                    counters.drop_header += 1
-                                    counters.record_decrypt_fail(decrypt_elapsed_ns, cipher_len)
-                                continue
-                            except AeadAuthError:
-                                decrypt_elapsed_ns = time.perf_counter_ns() - decrypt_start_ns
-                                with counters_lock:
-                                    counters.drops += 1
-                                    counters.drop_auth += 1
-                                    counters.record_decrypt_fail(decrypt_elapsed_ns, cipher_len)
-                                continue
-                            except NotImplementedError as exc:
-                                decrypt_elapsed_ns = time.perf_counter_ns() - decrypt_start_ns
-                                with counters_lock:
-                                    counters.drops += 1
-                                    reason, _seq = _parse_header_fields(
-                                        CONFIG["WIRE_VERSION"], current_receiver.ids, current_receiver.session_id, wire
-                                    )
-                                    if reason in (
-                                        "version_mismatch",
-                                        "crypto_id_mismatch",
-                                        "header_too_short",
-                                        "header_unpack_error",
-                                    ):
-                                        counters.drop_header += 1
-                                    elif reason == "session_mismatch":
-                                        counters.drop_session_epoch += 1
-                                    else:
-                                        counters.drop_auth += 1
-                                    counters.record_decrypt_fail(decrypt_elapsed_ns, cipher_len)
-                                logger.warning(
-                                    "Decrypt failed (classified)",
-                                    extra={
-                                        "role": role,
-                                        "reason": reason,
-                                        "wire_len": len(wire),
-                                        "error": str(exc),
-                                    },
-                                )
-                                continue
-                            except Exception as exc:
-                                decrypt_elapsed_ns = time.perf_counter_ns() - decrypt_start_ns
-                                with counters_lock:
-                                    counters.drops += 1
-                                    counters.drop_other += 1
-                                    counters.record_decrypt_fail(decrypt_elapsed_ns, cipher_len)
-                                logger.warning(
-                                    "Decrypt failed (other)",
-                                    extra={"role": role, "error": str(exc), "wire_len": len(wire)},
-                                )
-                                continue
-
-                            decrypt_elapsed_ns = time.perf_counter_ns() - decrypt_start_ns
-                            if plaintext is None:
-                                with counters_lock:
-                                    counters.drops += 1
-                                    last_reason = current_receiver.last_error_reason()
-                                    # Bug #7 fix: Proper error classification without redundancy
-                                    if last_reason == "auth":
-                                        counters.drop_auth += 1
-                                    elif last_reason == "header":
-                                        counters.drop_header += 1
-                                    elif last_reason == "replay":
-                                        counters.drop_replay += 1
-                                    elif last_reason == "session":
-                                        counters.drop_session_epoch += 1
-                                    elif last_reason is None or last_reason == "unknown":
-                                        # Only parse header if receiver didn't classify it
-                                        reason, _seq = _parse_header_fields(
-                                            CONFIG["WIRE_VERSION"],
-                                            current_receiver.ids,
-                                            current_receiver.session_id,
-                                            wire,
-                                        )
-                                        if reason in (
-                                            "version_mismatch",
-                                            "crypto_id_mismatch",
-                                            "header_too_short",
-                                            "header_unpack_error",
-                                        ):
-                                            counters.drop_header += 1
-                                        elif reason == "session_mismatch":
-                                            counters.drop_session_epoch += 1
-                                        elif reason == "auth_fail_or_replay":
-                                            counters.drop_auth += 1
-                                        else:
-                                            counters.drop_other += 1
-                                    else:
-                                        # Unrecognized last_reason value
-                                        counters.drop_other += 1
-                                    counters.record_decrypt_fail(decrypt_elapsed_ns, cipher_len)
-                                continue
-
-                            plaintext_len = len(plaintext)
-                            with counters_lock:
-                                counters.record_decrypt_ok(decrypt_elapsed_ns, cipher_len, plaintext_len)
-
-                            try:
-                                if plaintext and plaintext[0] == 0x02:
-                                    try:
-                                        control_json = json.loads(plaintext[1:].decode("utf-8"))
-                                    except (UnicodeDecodeError, json.JSONDecodeError):
-                                        with counters_lock:
-                                            counters.drops += 1
-                                            counters.drop_other += 1
-                                        continue
-                                    result = handle_control(control_json, role, control_state)
-                                    for note in result.notes:
-                                        if note.startswith("prepare_fail"):
-                                            with counters_lock:
-                                                counters.rekeys_fail += 1
-                                    for payload in result.send:
-                                        control_state.outbox.put(payload)
-                                    if result.start_handshake:
-                                        suite_next, rid = result.start_handshake
-                                        _launch_rekey(suite_next, rid)
-                                    continue
-
-                                if cfg.get("ENABLE_PACKET_TYPE") and plaintext:
-                                    ptype = plaintext[0]
-                                    if ptype == 0x01:
-                                        out_bytes = plaintext[1:]
-                                    else:
-                                        with counters_lock:
-                                            counters.drops += 1
-                                            counters.drop_other += 1
-                                        continue
-                                else:
-                                    out_bytes = plaintext
-
-                                sockets["plaintext_out"].sendto(out_bytes, sockets["plaintext_peer"])
-                                with counters_lock:
-                                    counters.ptx_out += 1
-                            except socket.error:
-                                with counters_lock:
-                                    counters.drops += 1
-                                    counters.drop_other += 1
-                        except socket.error:
-                            continue
+                            control_payload = control_state.outbox.get_nowait()
+                        except queue.Empty:
+                            break
+                        send_control(control_payload)
+
+                    if shards is not None:
+                        if not _pump_shards(0.1):
+                            break
+                        continue
+
+                    events = selector.select(timeout=0.1)
+                    for key, _mask in events:
+                        if key.data == "plaintext_in":
+                            _service_plaintext_in(key.fileobj)
+                        elif key.data == "encrypted":
+                            _service_encrypted(key.fileobj)
         except KeyboardInterrupt:
             pass
         finally:
             selector.close()
+            if shards is not None:
+                _stop_shards()
             if manual_stop:
                 manual_stop.set()
                 for thread in manual_threads:
                     thread.join(timeout=0.5)
+            if key_pool is not None:
+                key_pool.close()
+            if listener is not None:
+                listener.close()
+            if connector is not None:
+                connector.close()
 
         # Final status write and stop the status writer thread if running
         try:
             with counters_lock:
-                write_status({
-                    "status": "stopped",
-                    "suite": suite_id,
-                    "counters": counters.to_dict(),
-                    "ts_ns": time.time_ns(),
-                })
+                final_counters = _merged_counters()
+            write_status({
+                "status": "stopped",
+                "suite": suite_id,
+                "counters": final_counters.to_dict(),
+                "ts_ns": time.time_ns(),
+            })
         except Exception:
-            pass
+            final_counters = None
+        if metrics_endpoint is not None:
+            publish_event({"status": "stopped", "suite": suite_id, "ts_ns": time.time_ns()})
+            metrics_endpoint.close()
 
         if 'stop_status_writer' in locals() and stop_status_writer is not None:
             try:
@@ -1372,5 +2295,12 @@ def run_proxy(
                 status_thread.join(timeout=1.0)
             except Exception:
                 pass
+        if status_block is not None:
+            try:
+                if final_counters is not None:
+                    status_block.publish(vars(final_counters), suite=suite_id)
+            finally:
+                status_block.close()
 
-        return counters.to_dict()
+        with counters_lock:
+            return _merged_counters().to_dict()
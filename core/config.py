@@ -50,6 +50,19 @@ CONFIG = {
     # Model: token bucket; BURST tokens max, refilling at REFILL_PER_SEC tokens/sec.
     "HANDSHAKE_RL_BURST": 5,
     "HANDSHAKE_RL_REFILL_PER_SEC": 1,
+    # GCS keeps the handshake port bound for the proxy lifetime (allowlist and rate
+    # limit persist across rekeys). HANDSHAKE_PREOPEN makes the drone keep one TCP
+    # connection open ahead of the next rekey.
+    "HANDSHAKE_PERSISTENT_LISTENER": True,
+    "HANDSHAKE_PREOPEN": False,
+
+    # Per-suite signing keys loaded by core/run_proxy for rekeys are kept in an LRU of
+    # MATRIX_KEY_CACHE_SIZE suites; a cached key's file is re-stat'ed at most every
+    # MATRIX_KEY_REVALIDATE_S seconds and reloaded if its mtime changed.
+    # MATRIX_KEY_PRELOAD loads every suite under secrets/matrix/ in the background at startup.
+    "MATRIX_KEY_CACHE_SIZE": 64,
+    "MATRIX_KEY_REVALIDATE_S": 30.0,
+    "MATRIX_KEY_PRELOAD": True,
 
     # Mark encrypted UDP with DSCP EF (46) to prioritize on WMM-enabled APs.
     # Set to None to disable. Implementation multiplies by 4 to form TOS.
@@ -67,6 +80,83 @@ CONFIG = {
     # Log real session IDs only when explicitly enabled (default False masks them to hashes).
     "LOG_SESSION_ID": False,
 
+    # Receive datagrams into a ring of preallocated buffers via recvfrom_into and hand
+    # memoryview slices to the AEAD (no per-packet bytes allocation on the receive side).
+    # Set False to fall back to plain recvfrom().
+    "RX_ZERO_COPY": True,
+    # Number of 16 KiB buffers in each receive ring (one ring per proxy socket).
+    "RX_RING_SLOTS": 8,
+
+    # Batched UDP I/O: drain up to UDP_BATCH_SIZE datagrams per syscall and flush the
+    # resulting ciphertexts/plaintexts with one batched send. Uses recvmmsg/sendmmsg on
+    # Linux and a non-blocking recvfrom_into/sendto loop elsewhere. Off by default.
+    "UDP_BATCH_ENABLED": False,
+    "UDP_BATCH_SIZE": 32,
+
+    # Multi-core data plane: after the handshake, run the uplink (plaintext->encrypted)
+    # and downlink (encrypted->plaintext) pipelines in two forked worker processes.
+    # The parent keeps the control plane/rekey, pushes new session keys to both workers
+    # and merges their counters. Requires fork(); otherwise runs single-process.
+    "SHARDED_DATA_PLANE": False,
+
+    # Proxy engine: "selectors" (default blocking loop) or "asyncio" (DatagramProtocol
+    # data plane, event-driven control outbox, status writer and rekey scheduling on one
+    # loop). The asyncio engine uses uvloop when installed unless ASYNCIO_UVLOOP is False.
+    "PROXY_ENGINE": "selectors",
+    "ASYNCIO_UVLOOP": True,
+
+    # Per-packet AEAD timing: "full" times every encrypt/decrypt, "sampled" times one
+    # packet in INSTRUMENTATION_SAMPLE_EVERY, "off" skips the perf_counter_ns calls and
+    # primitive/histogram bookkeeping. Packet and drop counters stay exact at all levels.
+    "INSTRUMENTATION_LEVEL": "full",
+    "INSTRUMENTATION_SAMPLE_EVERY": 64,
+
+    # Live counters for --status-file go to an mmap'd block (<status_file>.counters,
+    # see core/status_block.py) instead of rewriting the status JSON every second;
+    # the full JSON is written on request and on handshake/rekey/stop events.
+    "STATUS_BLOCK": True,
+
+    # Optional Unix domain socket path where the proxy streams counter snapshots,
+    # histogram percentiles and handshake/rekey events to local subscribers
+    # (core/metrics_endpoint.py). METRICS_INTERVAL_S is the default per-subscriber
+    # snapshot interval; subscribers may ask for a different one. None disables.
+    "METRICS_SOCKET": None,
+    "METRICS_INTERVAL_S": 0.25,
+
+    # Make-before-break rekey: after a session switch the receiver keeps accepting
+    # packets from the previous session for up to REKEY_GRACE_SECONDS or
+    # REKEY_GRACE_PACKETS accepted packets, whichever ends first (0 disables).
+    "REKEY_GRACE_SECONDS": 2.0,
+    "REKEY_GRACE_PACKETS": 4096,
+
+    # Header-only pre-authentication screen on the receive path: datagrams whose
+    # header does not match the active session/epoch, that replay, or whose seq is
+    # more than PREAUTH_MAX_SEQ_AHEAD past the replay window are shed before AEAD
+    # work. Every PREAUTH_PROBE_EVERY-th far-ahead packet in a row is still
+    # authenticated so a genuine sender that jumped ahead can resync.
+    "PREAUTH_FILTER": True,
+    "PREAUTH_MAX_SEQ_AHEAD": 1 << 20,
+    "PREAUTH_PROBE_EVERY": 64,
+
+    # GCS keeps `size` pre-generated single-use KEM keypairs per recently used suite
+    # (at most `max_suites`), so a handshake only signs the transcript. Keypairs older
+    # than `max_age_s` seconds are discarded (0 keeps them until used). `per_suite`
+    # maps suite_id -> {"size": int, "max_age_s": float} overrides; size 0 opts out.
+    "KEM_POOL": {
+        "enabled": True,
+        "size": 2,
+        "max_age_s": 300.0,
+        "max_suites": 4,
+        "per_suite": {},
+    },
+
+    # ascon128 suites: "Ascon-128" (v1.2, wire-compatible with the PyPI ascon module)
+    # or "Ascon-AEAD128" (NIST SP 800-232). Both peers must use the same variant.
+    # ASCON_BACKEND "auto" uses core/native/libascon_aead.so when it has been built
+    # (see core/native/ascon_aead.c) and the in-tree pure-Python engine otherwise.
+    "ASCON_VARIANT": "Ascon-128",
+    "ASCON_BACKEND": "auto",
+
     # --- Simple automation defaults (tools/auto/*_simple.py) ---
     "DRONE_CONTROL_HOST": "0.0.0.0",
     "DRONE_CONTROL_PORT": 48080,
@@ -311,6 +401,65 @@ def validate_config(cfg: Dict[str, Any]) -> None:
     if "ENCRYPTED_DSCP" in cfg and cfg["ENCRYPTED_DSCP"] is not None:
         if not (0 <= int(cfg["ENCRYPTED_DSCP"]) <= 63):
             raise NotImplementedError("CONFIG[ENCRYPTED_DSCP] must be 0..63 or None")
+    if "RX_RING_SLOTS" in cfg:
+        slots = cfg["RX_RING_SLOTS"]
+        if not isinstance(slots, int) or isinstance(slots, bool) or not (1 <= slots <= 4096):
+            raise NotImplementedError(f"CONFIG[RX_RING_SLOTS] must be int in 1..4096, got {slots!r}")
+    if "PROXY_ENGINE" in cfg and cfg["PROXY_ENGINE"] not in ("selectors", "asyncio"):
+        raise NotImplementedError(f"CONFIG[PROXY_ENGINE] must be 'selectors' or 'asyncio', got {cfg['PROXY_ENGINE']!r}")
+    if "INSTRUMENTATION_LEVEL" in cfg and cfg["INSTRUMENTATION_LEVEL"] not in ("off", "sampled", "full"):
+        raise NotImplementedError(
+            f"CONFIG[INSTRUMENTATION_LEVEL] must be 'off', 'sampled' or 'full', got {cfg['INSTRUMENTATION_LEVEL']!r}"
+        )
+    if "INSTRUMENTATION_SAMPLE_EVERY" in cfg:
+        every = cfg["INSTRUMENTATION_SAMPLE_EVERY"]
+        if not isinstance(every, int) or isinstance(every, bool) or every < 1:
+            raise NotImplementedError(f"CONFIG[INSTRUMENTATION_SAMPLE_EVERY] must be int >= 1, got {every!r}")
+    if "REKEY_GRACE_SECONDS" in cfg:
+        grace = cfg["REKEY_GRACE_SECONDS"]
+        if not isinstance(grace, (int, float)) or isinstance(grace, bool) or grace < 0:
+            raise NotImplementedError(f"CONFIG[REKEY_GRACE_SECONDS] must be a number >= 0, got {grace!r}")
+    if "REKEY_GRACE_PACKETS" in cfg:
+        grace_packets = cfg["REKEY_GRACE_PACKETS"]
+        if not isinstance(grace_packets, int) or isinstance(grace_packets, bool) or grace_packets < 0:
+            raise NotImplementedError(f"CONFIG[REKEY_GRACE_PACKETS] must be int >= 0, got {grace_packets!r}")
+    for key in ("PREAUTH_MAX_SEQ_AHEAD", "PREAUTH_PROBE_EVERY"):
+        if key in cfg:
+            value = cfg[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise NotImplementedError(f"CONFIG[{key}] must be int >= 1, got {value!r}")
+    if "KEM_POOL" in cfg:
+        _validate_kem_pool(cfg["KEM_POOL"])
+    if "MATRIX_KEY_CACHE_SIZE" in cfg:
+        size = cfg["MATRIX_KEY_CACHE_SIZE"]
+        if not isinstance(size, int) or isinstance(size, bool) or size < 1:
+            raise NotImplementedError(f"CONFIG[MATRIX_KEY_CACHE_SIZE] must be int >= 1, got {size!r}")
+    if "MATRIX_KEY_REVALIDATE_S" in cfg:
+        revalidate = cfg["MATRIX_KEY_REVALIDATE_S"]
+        if not isinstance(revalidate, (int, float)) or isinstance(revalidate, bool) or revalidate < 0:
+            raise NotImplementedError(f"CONFIG[MATRIX_KEY_REVALIDATE_S] must be a number >= 0, got {revalidate!r}")
+    if "METRICS_SOCKET" in cfg and cfg["METRICS_SOCKET"] is not None and not isinstance(cfg["METRICS_SOCKET"], str):
+        raise NotImplementedError(f"CONFIG[METRICS_SOCKET] must be a path string or None, got {cfg['METRICS_SOCKET']!r}")
+    if "METRICS_INTERVAL_S" in cfg:
+        interval = cfg["METRICS_INTERVAL_S"]
+        if not isinstance(interval, (int, float)) or isinstance(interval, bool) or interval <= 0:
+            raise NotImplementedError(f"CONFIG[METRICS_INTERVAL_S] must be a number > 0, got {interval!r}")
+    for flag in ("HANDSHAKE_PERSISTENT_LISTENER", "HANDSHAKE_PREOPEN", "MATRIX_KEY_PRELOAD", "STATUS_BLOCK",
+                 "PREAUTH_FILTER"):
+        if flag in cfg and not isinstance(cfg[flag], bool):
+            raise NotImplementedError(f"CONFIG[{flag}] must be bool, got {cfg[flag]!r}")
+    if "ASCON_VARIANT" in cfg and cfg["ASCON_VARIANT"] not in ("Ascon-128", "Ascon-AEAD128"):
+        raise NotImplementedError(
+            f"CONFIG[ASCON_VARIANT] must be 'Ascon-128' or 'Ascon-AEAD128', got {cfg['ASCON_VARIANT']!r}"
+        )
+    if "ASCON_BACKEND" in cfg and cfg["ASCON_BACKEND"] not in ("auto", "native", "python"):
+        raise NotImplementedError(
+            f"CONFIG[ASCON_BACKEND] must be 'auto', 'native' or 'python', got {cfg['ASCON_BACKEND']!r}"
+        )
+    if "UDP_BATCH_SIZE" in cfg:
+        batch = cfg["UDP_BATCH_SIZE"]
+        if not isinstance(batch, int) or isinstance(batch, bool) or not (1 <= batch <= 1024):
+            raise NotImplementedError(f"CONFIG[UDP_BATCH_SIZE] must be int in 1..1024, got {batch!r}")
 
     psk = cfg.get("DRONE_PSK", "")
     try:
@@ -321,6 +470,36 @@ def validate_config(cfg: Dict[str, Any]) -> None:
         raise NotImplementedError("CONFIG[DRONE_PSK] must decode to 32 bytes")
 
 
+def _validate_kem_pool(pool: Any) -> None:
+    if not isinstance(pool, dict):
+        raise NotImplementedError(f"CONFIG[KEM_POOL] must be a dict, got {pool!r}")
+    unknown = set(pool) - {"enabled", "size", "max_age_s", "max_suites", "per_suite"}
+    if unknown:
+        raise NotImplementedError(f"CONFIG[KEM_POOL] has unknown keys: {sorted(unknown)}")
+    if "enabled" in pool and not isinstance(pool["enabled"], bool):
+        raise NotImplementedError(f"CONFIG[KEM_POOL][enabled] must be bool, got {pool['enabled']!r}")
+    if "max_suites" in pool:
+        max_suites = pool["max_suites"]
+        if not isinstance(max_suites, int) or isinstance(max_suites, bool) or max_suites < 1:
+            raise NotImplementedError(f"CONFIG[KEM_POOL][max_suites] must be int >= 1, got {max_suites!r}")
+    per_suite = pool.get("per_suite", {})
+    if not isinstance(per_suite, dict):
+        raise NotImplementedError(f"CONFIG[KEM_POOL][per_suite] must be a dict, got {per_suite!r}")
+    for label, entry in [("KEM_POOL", pool)] + [(f"KEM_POOL][per_suite][{k}", v) for k, v in per_suite.items()]:
+        if not isinstance(entry, dict):
+            raise NotImplementedError(f"CONFIG[{label}] must be a dict, got {entry!r}")
+        if entry is not pool and set(entry) - {"size", "max_age_s"}:
+            raise NotImplementedError(f"CONFIG[{label}] only accepts 'size' and 'max_age_s'")
+        if "size" in entry:
+            size = entry["size"]
+            if not isinstance(size, int) or isinstance(size, bool) or not (0 <= size <= 64):
+                raise NotImplementedError(f"CONFIG[{label}][size] must be int in 0..64, got {size!r}")
+        if "max_age_s" in entry:
+            max_age = entry["max_age_s"]
+            if not isinstance(max_age, (int, float)) or isinstance(max_age, bool) or max_age < 0:
+                raise NotImplementedError(f"CONFIG[{label}][max_age_s] must be a number >= 0, got {max_age!r}")
+
+
 def _apply_env_overrides(cfg: Dict[str, Any]) -> Dict[str, Any]:
     """Apply environment variable overrides to config."""
     result = cfg.copy()
@@ -0,0 +1,214 @@
+"""
+Long-lived TCP endpoints for the PQC handshake.
+
+Every rekey used to bind, listen and accept on a fresh GCS server socket (and
+rebuild the allowlist and rate limiter), while the drone opened a new TCP
+connection. ``HandshakeListener`` keeps the GCS socket open for the life of the
+proxy: a service thread accepts connections, applies the allowlist and rate
+limit, and queues admitted connections for the handshake that needs one.
+``HandshakeConnector`` is the drone counterpart; with ``preopen`` it keeps one
+connection established ahead of the next rekey, so a suite switch starts
+straight at the ServerHello.
+"""
+
+from __future__ import annotations
+
+import queue
+import socket
+import threading
+import time
+from typing import Iterable, NamedTuple, Optional, Protocol, Tuple
+
+from core.logging_utils import get_logger
+
+logger = get_logger("pqc")
+
+# How often the service thread re-checks for shutdown while blocked in accept().
+_ACCEPT_POLL_S = 0.2
+
+
+class _Gate(Protocol):
+    def allow(self, ip: str) -> bool: ...
+
+
+class AcceptedConnection(NamedTuple):
+    conn: socket.socket
+    addr: Tuple[str, int]
+    queued_at: float  # time.monotonic() when the service thread admitted it
+
+
+class HandshakeListener:
+    """GCS handshake socket that stays bound across handshakes.
+
+    Connections from IPs outside ``allowed_ips`` are closed; those refused by
+    ``gate`` receive a single ``0x00`` byte first, as the per-handshake listener
+    did. Everything else is queued for ``accept``.
+    """
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        allowed_ips: Iterable[str],
+        gate: Optional[_Gate] = None,
+        *,
+        backlog: int = 32,
+    ) -> None:
+        self.allowed_ips = frozenset(str(ip) for ip in allowed_ips)
+        self._gate = gate
+        self._queue: "queue.Queue[AcceptedConnection]" = queue.Queue()
+        self._closed = threading.Event()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._sock.bind(address)
+            self._sock.listen(backlog)
+            self._sock.settimeout(_ACCEPT_POLL_S)
+        except Exception:
+            self._sock.close()
+            raise
+        self.address: Tuple[str, int] = self._sock.getsockname()
+        self._thread = threading.Thread(target=self._serve, name="pqc-handshake-listener", daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn, addr = self._sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                if self._closed.is_set():
+                    break
+                continue
+            ip = addr[0]
+            if ip not in self.allowed_ips:
+                logger.warning(
+                    "Rejected handshake from unauthorized IP",
+                    extra={"role": "gcs", "expected": sorted(self.allowed_ips), "received": ip},
+                )
+                conn.close()
+                continue
+            if self._gate is not None and not self._gate.allow(ip):
+                try:
+                    conn.settimeout(0.2)
+                    conn.sendall(b"\x00")
+                except Exception:
+                    pass
+                finally:
+                    conn.close()
+                logger.warning("Handshake rate-limit drop", extra={"role": "gcs", "ip": ip})
+                continue
+            self._queue.put(AcceptedConnection(conn, addr, time.monotonic()))
+
+    def accept(self, timeout: Optional[float] = None) -> AcceptedConnection:
+        """Return the next admitted connection; raise ``socket.timeout`` if none arrives."""
+
+        if self._closed.is_set():
+            raise OSError("handshake listener is closed")
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            raise socket.timeout("no handshake connection within timeout") from None
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self._sock.close()
+        except Exception:
+            pass
+        self._thread.join(timeout=_ACCEPT_POLL_S * 5)
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                pending.conn.close()
+            except Exception:
+                pass
+
+    def __enter__(self) -> "HandshakeListener":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+def _still_open(sock: socket.socket) -> bool:
+    """True unless the peer has closed or reset ``sock`` (data waiting is fine)."""
+
+    try:
+        sock.setblocking(False)
+        try:
+            return sock.recv(1, socket.MSG_PEEK) != b""
+        finally:
+            sock.setblocking(True)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+
+
+class HandshakeConnector:
+    """Drone side: hands out TCP connections to the GCS handshake port.
+
+    With ``preopen`` enabled, ``replenish`` opens the next connection in the
+    background and ``connect`` returns it if the GCS has not dropped it in the
+    meantime, falling back to a fresh connect otherwise.
+    """
+
+    def __init__(self, address: Tuple[str, int], *, preopen: bool = False) -> None:
+        self.address = address
+        self.preopen = preopen
+        self._lock = threading.Lock()
+        self._spare: Optional[socket.socket] = None
+        self._closed = False
+        self.reused = 0
+
+    def connect(self) -> socket.socket:
+        with self._lock:
+            spare, self._spare = self._spare, None
+        if spare is not None:
+            if _still_open(spare):
+                self.reused += 1
+                return spare
+            spare.close()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.address)
+        except Exception:
+            sock.close()
+            raise
+        return sock
+
+    def replenish(self) -> None:
+        """Open the spare connection for the next handshake (no-op unless ``preopen``)."""
+
+        if not self.preopen:
+            return
+        threading.Thread(target=self._open_spare, name="pqc-handshake-preopen", daemon=True).start()
+
+    def _open_spare(self) -> None:
+        with self._lock:
+            if self._closed or self._spare is not None:
+                return
+        try:
+            sock = socket.create_connection(self.address, timeout=5.0)
+            sock.settimeout(None)
+        except OSError as exc:
+            logger.debug("Handshake pre-open failed", extra={"role": "drone", "error": str(exc)})
+            return
+        with self._lock:
+            if not self._closed and self._spare is None:
+                self._spare = sock
+                return
+        sock.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            spare, self._spare = self._spare, None
+        if spare is not None:
+            spare.close()
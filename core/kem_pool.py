@@ -0,0 +1,236 @@
+"""
+Pre-generated ephemeral KEM keypairs for the GCS handshake.
+
+The GCS generates a fresh KEM keypair for every ServerHello. For the larger
+KEMs (FrodoKEM, HQC, Classic-McEliece) that keygen dominates the handshake and
+therefore the rekey blackout. ``EphemeralKeyPool`` moves it off the critical
+path: a background worker keeps a few ready keypairs per suite, and
+``build_server_hello`` pops one and only signs the transcript.
+
+Every keypair is handed out at most once, so pooling does not weaken forward
+secrecy; entries older than ``max_age_s`` are freed instead of used, and the
+least recently used suite pool is dropped once ``max_suites`` are active.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Mapping, Optional
+
+from core.logging_utils import get_logger
+from core.suites import get_suite
+from oqs.oqs import KeyEncapsulation
+
+logger = get_logger("pqc")
+
+_DEFAULTS = {"enabled": True, "size": 2, "max_age_s": 300.0, "max_suites": 4}
+
+
+@dataclass
+class PooledKeypair:
+    kem_name: str
+    kem_obj: object  # oqs.KeyEncapsulation holding the secret key
+    public_key: bytes
+    keygen_ns: int
+    created_monotonic: float
+
+
+def _free(kem_obj: object) -> None:
+    try:
+        kem_obj.free()  # type: ignore[attr-defined]
+    except Exception:
+        pass
+
+
+def generate_keypair(kem_name: str, clock=time.monotonic) -> PooledKeypair:
+    """Generate one keypair, timing keygen exactly like the inline handshake path."""
+
+    start = time.perf_counter_ns()
+    kem_obj = KeyEncapsulation(kem_name)
+    public_key = kem_obj.generate_keypair()
+    keygen_ns = time.perf_counter_ns() - start
+    return PooledKeypair(kem_name, kem_obj, public_key, keygen_ns, clock())
+
+
+class EphemeralKeyPool:
+    """Background-filled pool of single-use KEM keypairs keyed by suite_id.
+
+    ``settings`` uses the ``CONFIG["KEM_POOL"]`` layout: ``size``, ``max_age_s``
+    and ``max_suites`` globally, with ``per_suite`` overrides of ``size`` and
+    ``max_age_s`` (``size`` 0 disables pooling for that suite).
+    """
+
+    def __init__(self, settings: Optional[Mapping[str, object]] = None, *, clock=time.monotonic) -> None:
+        merged = dict(_DEFAULTS)
+        merged.update(settings or {})
+        self._size = int(merged["size"])
+        self._max_age_s = float(merged["max_age_s"])
+        self._max_suites = int(merged["max_suites"])
+        self._per_suite: Dict[str, Mapping[str, object]] = dict(merged.get("per_suite") or {})
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pools: "OrderedDict[str, Deque[PooledKeypair]]" = OrderedDict()
+        self._kem_names: Dict[str, str] = {}
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._worker = threading.Thread(target=self._run, name="pqc-kem-pool", daemon=True)
+        self._worker.start()
+
+    def target_size(self, suite_id: str) -> int:
+        return int(self._per_suite.get(suite_id, {}).get("size", self._size))
+
+    def max_age_s(self, suite_id: str) -> float:
+        return float(self._per_suite.get(suite_id, {}).get("max_age_s", self._max_age_s))
+
+    def prefetch(self, suite_id: str) -> None:
+        """Mark ``suite_id`` as active so the worker keeps keypairs ready for it."""
+
+        with self._cond:
+            self._touch(suite_id)
+            self._cond.notify()
+
+    def take(self, suite_id: str) -> Optional[PooledKeypair]:
+        """Pop the oldest fresh keypair for ``suite_id``; None means generate inline.
+
+        A miss still registers the suite so later handshakes find keypairs ready.
+        """
+
+        stale = []
+        keypair: Optional[PooledKeypair] = None
+        with self._cond:
+            pool = self._touch(suite_id)
+            if pool is not None:
+                max_age = self.max_age_s(suite_id)
+                now = self._clock()
+                while pool:
+                    candidate = pool.popleft()
+                    if max_age and now - candidate.created_monotonic > max_age:
+                        stale.append(candidate)
+                        continue
+                    keypair = candidate
+                    break
+            self.evicted += len(stale)
+            if keypair is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self._cond.notify()
+        for entry in stale:
+            _free(entry.kem_obj)
+        return keypair
+
+    def ready(self, suite_id: str) -> int:
+        with self._cond:
+            pool = self._pools.get(suite_id)
+            return len(pool) if pool is not None else 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+                "ready": {suite_id: len(pool) for suite_id, pool in self._pools.items()},
+            }
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._cond.notify_all()
+        self._worker.join(timeout=5.0)
+        for pool in pools:
+            for entry in pool:
+                _free(entry.kem_obj)
+
+    def _touch(self, suite_id: str) -> Optional[Deque[PooledKeypair]]:
+        """Move ``suite_id`` to the MRU end, creating its pool; caller holds the lock.
+
+        Returns None (a pool miss) for a disabled or unknown suite.
+        """
+
+        if self._closed or self.target_size(suite_id) <= 0:
+            return None
+        pool = self._pools.get(suite_id)
+        if pool is not None:
+            self._pools.move_to_end(suite_id)
+            return pool
+        if suite_id not in self._kem_names:
+            try:
+                self._kem_names[suite_id] = get_suite(suite_id)["kem_name"]
+            except (NotImplementedError, KeyError) as exc:
+                logger.warning(
+                    "KEM pool ignoring unknown suite; handshakes fall back to inline keygen",
+                    extra={"suite_id": suite_id, "error": str(exc)},
+                )
+                return None
+        pool = self._pools[suite_id] = deque()
+        while len(self._pools) > max(1, self._max_suites):
+            _, dropped = self._pools.popitem(last=False)
+            self.evicted += len(dropped)
+            for entry in dropped:
+                _free(entry.kem_obj)
+        return pool
+
+    def _next_job(self) -> Optional[str]:
+        """Suite that most needs a keypair (MRU first), expiring stale entries; lock held."""
+
+        now = self._clock()
+        for suite_id in reversed(self._pools):
+            pool = self._pools[suite_id]
+            max_age = self.max_age_s(suite_id)
+            while max_age and pool and now - pool[0].created_monotonic > max_age:
+                _free(pool.popleft().kem_obj)
+                self.evicted += 1
+            if len(pool) < self.target_size(suite_id):
+                return suite_id
+        return None
+
+    def _wait_timeout(self) -> Optional[float]:
+        """Seconds until the oldest pooled entry expires, or None to wait for a notify."""
+
+        now = self._clock()
+        deadlines = [
+            pool[0].created_monotonic + self.max_age_s(suite_id) - now
+            for suite_id, pool in self._pools.items()
+            if pool and self.max_age_s(suite_id)
+        ]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines)) + 0.01
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                suite_id = None
+                while not self._closed:
+                    suite_id = self._next_job()
+                    if suite_id is not None:
+                        break
+                    self._cond.wait(self._wait_timeout())
+                if self._closed:
+                    return
+                kem_name = self._kem_names[suite_id]
+            # Keygen runs without the lock so take() never waits on it.
+            try:
+                keypair = generate_keypair(kem_name, self._clock)
+            except Exception as exc:
+                logger.warning(
+                    "KEM pool keygen failed; suite falls back to inline keygen",
+                    extra={"suite_id": suite_id, "error": str(exc)},
+                )
+                with self._cond:
+                    self._pools.pop(suite_id, None)
+                continue
+            with self._cond:
+                pool = self._pools.get(suite_id)
+                if self._closed or pool is None or len(pool) >= self.target_size(suite_id):
+                    _free(keypair.kem_obj)
+                else:
+                    pool.append(keypair)
@@ -0,0 +1,163 @@
+"""
+Fixed-memory log-linear latency histogram (HDR-style) for per-packet timings.
+
+Values (nanoseconds) below ``2**SUB_BUCKET_BITS`` get one exact bucket each.
+Above that, every power-of-two range is split into ``2**SUB_BUCKET_BITS``
+equal-width sub-buckets, so any recorded value is reported within 1/16
+(6.25%) of its true magnitude. The bucket array is sized once for values up to
+``2**MAX_VALUE_BITS`` ns (~18 minutes); larger samples saturate into the last
+bucket. Recording is a handful of integer operations and one array increment,
+with no allocation, so it is cheap enough for the data-plane hot path.
+
+The serialized form (``to_dict``) lists only non-empty buckets and is what
+``ProxyCounters`` writes into the status JSON; ``from_dict`` rebuilds a
+histogram on the reader side (``tools.counter_utils``).
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+SUB_BUCKET_BITS = 4
+MAX_VALUE_BITS = 40
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_MANTISSA_MASK = _SUB_BUCKETS - 1
+_BUCKET_COUNT = _SUB_BUCKETS + (MAX_VALUE_BITS - SUB_BUCKET_BITS) * _SUB_BUCKETS
+
+# Percentiles surfaced in status JSON and reports, keyed by their field suffix.
+STANDARD_PERCENTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50", 50.0),
+    ("p90", 90.0),
+    ("p99", 99.0),
+    ("p999", 99.9),
+)
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value if value > 0 else 0
+    msb = value.bit_length() - 1
+    shift = msb - SUB_BUCKET_BITS
+    index = _SUB_BUCKETS + shift * _SUB_BUCKETS + ((value >> shift) & _MANTISSA_MASK)
+    return index if index < _BUCKET_COUNT else _BUCKET_COUNT - 1
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """Return the inclusive ``(lowest, highest)`` values mapped to ``index``."""
+    if index < _SUB_BUCKETS:
+        return index, index
+    shift, mantissa = divmod(index - _SUB_BUCKETS, _SUB_BUCKETS)
+    lowest = (_SUB_BUCKETS + mantissa) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of non-negative integer durations in nanoseconds."""
+
+    __slots__ = ("counts", "total_count")
+
+    def __init__(self) -> None:
+        self.counts = array("Q", bytes(8 * _BUCKET_COUNT))
+        self.total_count = 0
+
+    def record(self, value_ns: int) -> None:
+        # _bucket_index inlined: this runs once per timed packet.
+        if value_ns < _SUB_BUCKETS:
+            index = value_ns if value_ns > 0 else 0
+        else:
+            shift = value_ns.bit_length() - 1 - SUB_BUCKET_BITS
+            index = _SUB_BUCKETS + shift * _SUB_BUCKETS + ((value_ns >> shift) & _MANTISSA_MASK)
+            if index >= _BUCKET_COUNT:
+                index = _BUCKET_COUNT - 1
+        self.counts[index] += 1
+        self.total_count += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add every sample of ``other`` into this histogram."""
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total_count += other.total_count
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone.counts = array("Q", self.counts)
+        clone.total_count = self.total_count
+        return clone
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Return the highest value equivalent to the sample at ``percentile`` (0-100).
+
+        Returns 0 for an empty histogram.
+        """
+        if self.total_count <= 0:
+            return 0
+        percentile = min(max(float(percentile), 0.0), 100.0)
+        # Rank of the sample at this percentile, 1-based and at least 1. Rounding
+        # first keeps float noise (0.999 * 1000 -> 999.0000000000001) from
+        # pushing the rank onto the next sample.
+        target = max(1, math.ceil(round(percentile / 100.0 * self.total_count, 6)))
+        running = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            running += count
+            if running >= target:
+                return _bucket_bounds(index)[1]
+        return _bucket_bounds(_BUCKET_COUNT - 1)[1]
+
+    @property
+    def p50(self) -> int:
+        return self.value_at_percentile(50.0)
+
+    @property
+    def p90(self) -> int:
+        return self.value_at_percentile(90.0)
+
+    @property
+    def p99(self) -> int:
+        return self.value_at_percentile(99.0)
+
+    @property
+    def p999(self) -> int:
+        return self.value_at_percentile(99.9)
+
+    def percentiles(self, points: Iterable[Tuple[str, float]] = STANDARD_PERCENTILES) -> Dict[str, int]:
+        """Return ``{"<name>_ns": value}`` for each ``(name, percentile)`` in ``points``."""
+        return {f"{name}_ns": self.value_at_percentile(pct) for name, pct in points}
+
+    def to_dict(self) -> Dict[str, object]:
+        buckets: List[List[int]] = [[index, count] for index, count in enumerate(self.counts) if count]
+        payload: Dict[str, object] = {
+            "sub_bucket_bits": SUB_BUCKET_BITS,
+            "count": self.total_count,
+            "buckets": buckets,
+        }
+        payload.update(self.percentiles())
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> Optional["LatencyHistogram"]:
+        """Rebuild a histogram from ``to_dict`` output; None if the layout is unknown."""
+        if int(payload.get("sub_bucket_bits", SUB_BUCKET_BITS) or 0) != SUB_BUCKET_BITS:
+            return None
+        buckets = payload.get("buckets")
+        if not isinstance(buckets, list):
+            return None
+        histogram = cls()
+        for entry in buckets:
+            try:
+                index, count = int(entry[0]), int(entry[1])
+            except (TypeError, ValueError, IndexError):
+                continue
+            if 0 <= index < _BUCKET_COUNT and count > 0:
+                histogram.counts[index] += count
+                histogram.total_count += count
+        return histogram
+
+
+__all__ = ["LatencyHistogram", "STANDARD_PERCENTILES", "SUB_BUCKET_BITS", "MAX_VALUE_BITS"]
@@ -1,6 +1,30 @@
-import json, logging, sys, time
+"""
+JSON logging for the proxy.
+
+Loggers from ``get_logger`` do not write on the calling thread: a
+``QueueHandler`` hands each record to a bounded queue and a ``QueueListener``
+thread formats and writes it to stdout and the file from
+``configure_file_logger``. A per-message rate limit keeps a flood of identical
+warnings (e.g. "Decrypt failed (classified)" under garbage traffic) from
+reaching the queue at all; the next record that gets through carries the
+number suppressed. Records that find the queue full are dropped and counted.
+"""
+
+import atexit, copy, json, logging, multiprocessing.util, os, queue, sys, threading, time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Records buffered between the logging threads and the writer thread.
+LOG_QUEUE_SIZE = 10000
+# Per (logger, level, message) key, at most LOG_RATE_BURST records below ERROR
+# are logged every LOG_RATE_WINDOW_S seconds.
+LOG_RATE_BURST = 20
+LOG_RATE_WINDOW_S = 1.0
+
+# LogRecord attributes that are not ``extra`` fields.
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "taskName"}
+
+
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         payload = {
@@ -11,17 +35,156 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        # Allow extra fields via record.__dict__ (filtered)
+        elif record.exc_text:  # formatted by the queue handler
+            payload["exc_info"] = record.exc_text
         for k, v in record.__dict__.items():
-            if k not in ("msg", "args", "exc_info", "exc_text", "stack_info", "stack_level", "created",
-                         "msecs", "relativeCreated", "levelno", "levelname", "pathname", "filename",
-                         "module", "lineno", "funcName", "thread", "threadName", "processName", "process"):
-                try:
-                    json.dumps({k: v})
-                    payload[k] = v
-                except Exception:
-                    payload[k] = str(v)
-        return json.dumps(payload)
+            if k not in _RECORD_ATTRS:
+                payload[k] = v
+        try:
+            return json.dumps(payload, default=str)
+        except (TypeError, ValueError):  # e.g. circular or non-string keys
+            return json.dumps({k: v if _serialisable(v) else str(v) for k, v in payload.items()})
+
+
+def _serialisable(value) -> bool:
+    try:
+        json.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Pass at most ``burst`` records per message key every ``window_s`` seconds.
+
+    The key is the logger name, level and unformatted message, so one warning
+    site firing per packet is limited without hiding other messages. Records at
+    or above ``exempt_level`` always pass.
+    """
+
+    def __init__(self, burst: int = LOG_RATE_BURST, window_s: float = LOG_RATE_WINDOW_S,
+                 exempt_level: int = logging.ERROR, max_keys: int = 1024) -> None:
+        super().__init__()
+        self.burst = burst
+        self.window_s = window_s
+        self.exempt_level = exempt_level
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._keys = {}  # key -> [window_start, passed, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+        msg = record.msg if isinstance(record.msg, str) else repr(record.msg)
+        key = (record.name, record.levelno, msg)
+        now = time.monotonic()
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None:
+                if len(self._keys) >= self.max_keys:
+                    self._keys.clear()
+                state = self._keys[key] = [now, 0, 0]
+            elif now - state[0] >= self.window_s:
+                state[0] = now
+                state[1] = 0
+            if state[1] >= self.burst:
+                state[2] += 1
+                METRICS.counter("log_suppressed").inc()
+                return False
+            state[1] += 1
+            suppressed, state[2] = state[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Queue records for the writer thread; never blocks the caller."""
+
+    def __init__(self, log_queue: "queue.Queue") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (they may be mutated later) but leave the JSON
+        # formatting to the writer thread; keep exc_info as text.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        dropped = self.dropped
+        if dropped:
+            record.log_dropped = dropped
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            METRICS.counter("log_dropped").inc()
+            return
+        if dropped:
+            self.dropped -= dropped
+
+
+_QUEUES = []  # (handler, listener) pairs started by get_logger
+
+
+def _start_queue_handler(*sinks: logging.Handler) -> _NonBlockingQueueHandler:
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    handler = _NonBlockingQueueHandler(log_queue)
+    handler.addFilter(RateLimitFilter())
+    listener = QueueListener(log_queue, *sinks, respect_handler_level=True)
+    listener.start()
+    _QUEUES.append((handler, listener))
+    return handler
+
+
+def _listener_for(logger: logging.Logger):
+    for handler, listener in _QUEUES:
+        if handler in logger.handlers:
+            return listener
+    return None
+
+
+def flush_logs() -> None:
+    """Block until every queued record has been written (listeners restart)."""
+
+    for _handler, listener in _QUEUES:
+        listener.stop()
+        listener.start()
+
+
+def _stop_listeners() -> None:
+    for _handler, listener in _QUEUES:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+def _restart_listeners_in_child() -> None:
+    # fork() copies the queue's locks in whatever state they were and no writer
+    # thread: give each logger a fresh queue and thread.
+    for handler, listener in _QUEUES:
+        handler.queue = listener.queue = queue.Queue(LOG_QUEUE_SIZE)
+        listener._thread = None
+        listener.start()
+
+
+def _flush_at_worker_exit(_obj) -> None:
+    # multiprocessing workers leave through os._exit and skip atexit.
+    multiprocessing.util.Finalize(None, _stop_listeners, exitpriority=0)
+
+
+atexit.register(_stop_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_in_child)
+multiprocessing.util.register_after_fork(_stop_listeners, _flush_at_worker_exit)
+
 
 def get_logger(name: str = "pqc") -> logging.Logger:
     logger = logging.getLogger(name)
@@ -30,7 +193,7 @@ def get_logger(name: str = "pqc") -> logging.Logger:
     logger.setLevel(logging.INFO)
     h = logging.StreamHandler(sys.stdout)
     h.setFormatter(JsonFormatter())
-    logger.addHandler(h)
+    logger.addHandler(_start_queue_handler(h))
     logger.propagate = False
     return logger
 
@@ -39,15 +202,23 @@ def configure_file_logger(role: str, logger: logging.Logger | None = None) -> Pa
     """Attach a JSON file handler and return log path."""
 
     active_logger = logger or get_logger()
+    # Loggers from get_logger write through their queue listener.
+    listener = _listener_for(active_logger)
+    handlers = list(listener.handlers) if listener is not None else list(active_logger.handlers)
 
     # Drop any previous file handlers we attached to avoid duplicate writes during tests.
-    for handler in list(active_logger.handlers):
-        if getattr(handler, "_pqc_file_handler", False):
+    stale = [handler for handler in handlers if getattr(handler, "_pqc_file_handler", False)]
+    for handler in stale:
+        handlers.remove(handler)
+        if listener is None:
             active_logger.removeHandler(handler)
-            try:
-                handler.close()
-            except Exception:
-                pass
+    if listener is not None:
+        listener.handlers = tuple(handlers)
+    for handler in stale:
+        try:
+            handler.close()
+        except Exception:
+            pass
 
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
@@ -57,7 +228,10 @@ def configure_file_logger(role: str, logger: logging.Logger | None = None) -> Pa
     file_handler = logging.FileHandler(path, encoding="utf-8")
     file_handler.setFormatter(JsonFormatter())
     file_handler._pqc_file_handler = True  # type: ignore[attr-defined]
-    active_logger.addHandler(file_handler)
+    if listener is not None:
+        listener.handlers = listener.handlers + (file_handler,)
+    else:
+        active_logger.addHandler(file_handler)
 
     return path
 
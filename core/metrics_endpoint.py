@@ -0,0 +1,393 @@
+"""
+Local Unix domain socket endpoint that streams live proxy metrics.
+
+Schedulers used to learn about the proxy by polling ``--status-file`` and log
+files, so they reacted at the poll interval and the drone paid for file I/O.
+With ``METRICS_SOCKET`` (or ``--metrics-socket``) set, ``run_proxy`` serves a
+``MetricsEndpoint`` on that path instead: clients connect, optionally send a
+subscription, and receive ``!I`` length-prefixed JSON messages:
+
+* ``{"topic": "counters", "seq", "ts_ns", "data": {...}}`` - scalar counters,
+* ``{"topic": "histograms", ...}`` - percentile summaries per latency histogram,
+* ``{"topic": "events", ...}`` - ``handshake_ok``/``rekey_ok``/``rekey_fail``/
+  ``stopped`` records, pushed as soon as they happen.
+
+A subscription is one frame ``{"subscribe": [topics], "interval_s": float}``;
+it may be resent at any time to change topics or rate. Clients that send
+nothing within ``SUBSCRIBE_WINDOW_S`` of connecting get every topic at the
+endpoint's default interval. Periodic topics are sampled only when some
+subscriber is due, and a client that cannot keep up (its socket buffer stays
+full for ``send_timeout_s``) is disconnected rather than stalling the proxy.
+"""
+
+from __future__ import annotations
+
+import json
+import selectors
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, Mapping, Optional, Set, Union
+
+from core.handshake_framing import MAX_FRAME_BYTES, FrameIO
+
+PERIODIC_TOPICS = ("counters", "histograms")
+TOPICS = PERIODIC_TOPICS + ("events",)
+
+# How long a new client has to send its subscription before defaults apply.
+SUBSCRIBE_WINDOW_S = 0.05
+# Subscriptions are tiny; anything larger is a confused or hostile client.
+MAX_SUBSCRIPTION_BYTES = 64 * 1024
+
+_LEN = struct.Struct("!I")
+
+PathLike = Union[str, Path]
+Sampler = Callable[[Set[str]], Mapping[str, object]]
+
+
+def supported() -> bool:
+    """True when the platform has Unix domain sockets."""
+
+    return hasattr(socket, "AF_UNIX")
+
+
+def _encode(message: Mapping[str, object]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+class _FrameBuffer:
+    """Reassembles ``!I`` length-prefixed frames from arbitrary stream chunks.
+
+    A partial frame stays buffered until the rest arrives, so readers can
+    stop at any point (timeout, would-block) without losing stream framing.
+    """
+
+    __slots__ = ("_buf", "max_size")
+
+    def __init__(self, max_size: int) -> None:
+        self._buf = bytearray()
+        self.max_size = max_size
+
+    def feed(self, data: bytes) -> None:
+        self._buf += data
+
+    def pop(self) -> Optional[bytes]:
+        """Next complete frame body, or None; ValueError if a frame is oversized."""
+
+        buf = self._buf
+        if len(buf) < _LEN.size:
+            return None
+        (length,) = _LEN.unpack_from(buf)
+        if length > self.max_size:
+            raise ValueError(f"frame length {length} exceeds {self.max_size} bytes")
+        end = _LEN.size + length
+        if len(buf) < end:
+            return None
+        body = bytes(buf[_LEN.size:end])
+        del buf[:end]
+        return body
+
+
+class _Client:
+    __slots__ = ("sock", "io", "frames", "topics", "interval_s", "next_due")
+
+    def __init__(self, sock: socket.socket, interval_s: float) -> None:
+        self.sock = sock
+        self.io = FrameIO(sock)
+        self.frames = _FrameBuffer(MAX_SUBSCRIPTION_BYTES)
+        self.topics: Set[str] = set(TOPICS)
+        self.interval_s = interval_s
+        self.next_due = time.monotonic() + SUBSCRIBE_WINDOW_S
+
+
+class MetricsEndpoint:
+    """Serve metric snapshots and events on a Unix domain socket.
+
+    ``sample(topics)`` is called from the endpoint thread with the set of due
+    periodic topics and returns ``{topic: data}``. ``publish_event`` may be
+    called from any thread.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        sample: Sampler,
+        *,
+        interval_s: float = 0.25,
+        min_interval_s: float = 0.01,
+        max_clients: int = 8,
+        send_timeout_s: float = 0.2,
+    ) -> None:
+        if not supported():
+            raise OSError("Unix domain sockets are not available on this platform")
+        self.path = Path(path)
+        self.sample = sample
+        self.interval_s = max(float(interval_s), min_interval_s)
+        self.min_interval_s = min_interval_s
+        self.max_clients = max_clients
+        self.send_timeout_s = send_timeout_s
+        self._seq = 0
+        self._events: Deque[Dict[str, object]] = deque(maxlen=256)
+        self._clients: Dict[int, _Client] = {}
+        self._closed = threading.Event()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.path.unlink()  # a previous proxy that did not shut down cleanly
+        except FileNotFoundError:
+            pass
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._server.bind(str(self.path))
+            self._server.listen(max_clients)
+            self._server.setblocking(False)
+        except OSError:
+            self._server.close()
+            raise
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ, data="accept")
+        self._selector.register(self._wake_r, selectors.EVENT_READ, data="wake")
+        self._thread = threading.Thread(target=self._run, name="metrics-endpoint", daemon=True)
+        self._thread.start()
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def publish_event(self, payload: Mapping[str, object]) -> None:
+        """Queue an event for every ``events`` subscriber and wake the endpoint."""
+
+        if self._closed.is_set():
+            return
+        self._events.append({"topic": "events", "ts_ns": time.time_ns(), "data": dict(payload)})
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # already woken, or closing
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Flush queued events, disconnect clients and remove the socket path."""
+
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake()
+        self._thread.join(timeout=timeout)
+        self._wake_w.close()
+
+    # -- endpoint thread ---------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            while not self._closed.is_set():
+                for key, _mask in self._selector.select(timeout=self._next_timeout()):
+                    if key.data == "accept":
+                        self._accept()
+                    elif key.data == "wake":
+                        self._drain_wake()
+                    else:
+                        self._read_subscription(key.data)
+                self._flush_events()
+                self._send_due()
+            self._flush_events()  # the "stopped" event published just before close
+        finally:
+            for client in list(self._clients.values()):
+                self._drop(client)
+            self._selector.close()
+            self._server.close()
+            self._wake_r.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _next_timeout(self) -> float:
+        periodic = [client.next_due for client in self._clients.values() if client.topics & set(PERIODIC_TOPICS)]
+        if not periodic:
+            return 1.0
+        return max(0.0, min(periodic) - time.monotonic())
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(64):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _accept(self) -> None:
+        try:
+            conn, _addr = self._server.accept()
+        except (BlockingIOError, OSError):
+            return
+        if len(self._clients) >= self.max_clients:
+            conn.close()
+            return
+        conn.settimeout(self.send_timeout_s)
+        client = _Client(conn, self.interval_s)
+        self._clients[conn.fileno()] = client
+        self._selector.register(conn, selectors.EVENT_READ, data=client)
+
+    def _read_subscription(self, client: _Client) -> None:
+        # Never block here: a client that sends half a frame must not stall the
+        # endpoint thread, so whatever arrived is buffered until the frame completes.
+        try:
+            data = client.sock.recv(4096, socket.MSG_DONTWAIT)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._drop(client)
+            return
+        if not data:
+            self._drop(client)  # disconnected
+            return
+        client.frames.feed(data)
+        try:
+            while True:
+                body = client.frames.pop()
+                if body is None:
+                    return
+                self._apply_subscription(client, json.loads(body))
+        except ValueError:
+            self._drop(client)  # oversized or malformed
+
+    def _apply_subscription(self, client: _Client, request: object) -> None:
+        if not isinstance(request, dict):
+            return
+        topics = request.get("subscribe")
+        if isinstance(topics, (list, tuple)):
+            client.topics = {topic for topic in topics if topic in TOPICS}
+        interval = request.get("interval_s")
+        if isinstance(interval, (int, float)) and not isinstance(interval, bool) and interval > 0:
+            client.interval_s = max(float(interval), self.min_interval_s)
+        client.next_due = time.monotonic()
+
+    def _flush_events(self) -> None:
+        while self._events:
+            frame = _encode(self._events.popleft())
+            for client in list(self._clients.values()):
+                if "events" in client.topics:
+                    self._send(client, frame)
+
+    def _send_due(self) -> None:
+        now = time.monotonic()
+        due = [client for client in self._clients.values() if client.next_due <= now and client.topics & set(PERIODIC_TOPICS)]
+        if not due:
+            return
+        wanted: Set[str] = set()
+        for client in due:
+            wanted |= client.topics & set(PERIODIC_TOPICS)
+        try:
+            data = self.sample(wanted)
+        except Exception:
+            data = {}
+        self._seq += 1
+        ts_ns = time.time_ns()
+        frames = {
+            topic: _encode({"topic": topic, "seq": self._seq, "ts_ns": ts_ns, "data": data[topic]})
+            for topic in wanted
+            if topic in data
+        }
+        for client in due:
+            client.next_due = now + client.interval_s
+            for topic in PERIODIC_TOPICS:
+                if topic in client.topics and topic in frames:
+                    if not self._send(client, frames[topic]):
+                        break
+
+    def _send(self, client: _Client, frame: bytes) -> bool:
+        try:
+            client.io.send_frame(frame)
+        except OSError:  # includes socket.timeout: the subscriber stopped reading
+            self._drop(client)
+            return False
+        return True
+
+    def _drop(self, client: _Client) -> None:
+        fileno = client.sock.fileno()
+        if self._clients.get(fileno) is client:
+            del self._clients[fileno]
+            try:
+                self._selector.unregister(client.sock)
+            except (KeyError, ValueError):
+                pass
+        client.sock.close()
+
+
+class MetricsSubscriber:
+    """Client side of a ``MetricsEndpoint``: ``recv`` returns one message dict."""
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        topics: Optional[Iterable[str]] = None,
+        interval_s: Optional[float] = None,
+        timeout: float = 5.0,
+    ) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(str(path))
+        except OSError:
+            self.sock.close()
+            raise
+        self.io = FrameIO(self.sock)
+        self._frames = _FrameBuffer(MAX_FRAME_BYTES)
+        if topics is not None or interval_s is not None:
+            self.subscribe(topics=topics, interval_s=interval_s)
+
+    def subscribe(self, *, topics: Optional[Iterable[str]] = None, interval_s: Optional[float] = None) -> None:
+        request: Dict[str, object] = {}
+        if topics is not None:
+            request["subscribe"] = list(topics)
+        if interval_s is not None:
+            request["interval_s"] = interval_s
+        self.io.send_frame(_encode(request))
+
+    def recv(self, timeout: Optional[float] = None) -> Optional[Dict[str, object]]:
+        """Next message, or None if nothing arrived within ``timeout``.
+
+        A frame cut short by the timeout stays buffered and is completed by the
+        next call. Raises ``ConnectionError`` once the proxy closes the endpoint.
+        """
+
+        if timeout is not None:
+            self.sock.settimeout(timeout)
+        while True:
+            body = self._frames.pop()
+            if body is not None:
+                return json.loads(body)
+            try:
+                data = self.sock.recv(65536)
+            except socket.timeout:
+                return None
+            if not data:
+                raise ConnectionError("Connection closed reading metrics message")
+            self._frames.feed(data)
+
+    def __iter__(self) -> Iterator[Dict[str, object]]:
+        while True:
+            try:
+                message = self.recv()
+            except ConnectionError:
+                return
+            if message is not None:
+                yield message
+
+    def close(self) -> None:
+        self.sock.close()
+
+    def __enter__(self) -> "MetricsSubscriber":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
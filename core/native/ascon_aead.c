@@ -0,0 +1,175 @@
+/*
+ * Optional native backend for core/ascon_aead.py (loaded with ctypes).
+ *
+ * Implements the same two variants as the pure-Python engine:
+ *   variant 0: Ascon-128 v1.2     (8-byte rate, 6 rounds, big-endian words)
+ *   variant 1: Ascon-AEAD128      (NIST SP 800-232, 16-byte rate, 8 rounds,
+ *                                  little-endian words)
+ * Key, nonce and tag are 16 bytes. Build in place with:
+ *
+ *   cc -O3 -shared -fPIC -o core/native/libascon_aead.so core/native/ascon_aead.c
+ *
+ * or point ASCON_NATIVE_LIB at a library built elsewhere.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#define ROR(x, n) (((x) >> (n)) | ((x) << (64 - (n))))
+
+typedef struct {
+    uint64_t x[5];
+    int be;     /* big-endian word order (Ascon-128) */
+    int rate;   /* bytes absorbed per block */
+    int start;  /* first round index of the intermediate permutation */
+} ascon_state_t;
+
+static void permute(ascon_state_t *s, int start) {
+    uint64_t x0 = s->x[0], x1 = s->x[1], x2 = s->x[2], x3 = s->x[3], x4 = s->x[4];
+    uint64_t t0, t1, t2, t3, t4;
+    for (int r = start; r < 12; r++) {
+        x2 ^= ((uint64_t)(15 - r) << 4) | (uint64_t)r;
+        x0 ^= x4;
+        x4 ^= x3;
+        x2 ^= x1;
+        t0 = x0 ^ (~x1 & x2);
+        t1 = x1 ^ (~x2 & x3);
+        t2 = x2 ^ (~x3 & x4);
+        t3 = x3 ^ (~x4 & x0);
+        t4 = x4 ^ (~x0 & x1);
+        t1 ^= t0;
+        t0 ^= t4;
+        t3 ^= t2;
+        t2 = ~t2;
+        x0 = t0 ^ ROR(t0, 19) ^ ROR(t0, 28);
+        x1 = t1 ^ ROR(t1, 61) ^ ROR(t1, 39);
+        x2 = t2 ^ ROR(t2, 1) ^ ROR(t2, 6);
+        x3 = t3 ^ ROR(t3, 10) ^ ROR(t3, 17);
+        x4 = t4 ^ ROR(t4, 7) ^ ROR(t4, 41);
+    }
+    s->x[0] = x0; s->x[1] = x1; s->x[2] = x2; s->x[3] = x3; s->x[4] = x4;
+}
+
+/* Load n <= 8 bytes into the leading positions of a word, rest zero. */
+static uint64_t load(const uint8_t *p, size_t n, int be) {
+    uint64_t w = 0;
+    for (size_t i = 0; i < n; i++)
+        w |= (uint64_t)p[i] << (be ? 56 - 8 * i : 8 * i);
+    return w;
+}
+
+static void store(uint8_t *p, uint64_t w, size_t n, int be) {
+    for (size_t i = 0; i < n; i++)
+        p[i] = (uint8_t)(w >> (be ? 56 - 8 * i : 8 * i));
+}
+
+static uint64_t pad(size_t n, int be) {
+    return be ? 0x80ULL << (56 - 8 * n) : 0x01ULL << (8 * n);
+}
+
+static void init(ascon_state_t *s, int variant, const uint8_t *k, const uint8_t *npub,
+                 const uint8_t *ad, size_t adlen) {
+    s->be = variant == 0;
+    s->rate = variant == 0 ? 8 : 16;
+    s->start = variant == 0 ? 6 : 4;
+    int be = s->be;
+    uint64_t k0 = load(k, 8, be), k1 = load(k + 8, 8, be);
+    s->x[0] = variant == 0 ? 0x80400c0600000000ULL : 0x00001000808c0001ULL;
+    s->x[1] = k0;
+    s->x[2] = k1;
+    s->x[3] = load(npub, 8, be);
+    s->x[4] = load(npub + 8, 8, be);
+    permute(s, 0);
+    s->x[3] ^= k0;
+    s->x[4] ^= k1;
+
+    if (adlen) {
+        size_t rate = (size_t)s->rate;
+        for (; adlen >= rate; ad += rate, adlen -= rate) {
+            for (size_t w = 0; w < rate / 8; w++)
+                s->x[w] ^= load(ad + 8 * w, 8, be);
+            permute(s, s->start);
+        }
+        for (size_t w = 0; 8 * w < adlen; w++)
+            s->x[w] ^= load(ad + 8 * w, adlen - 8 * w < 8 ? adlen - 8 * w : 8, be);
+        s->x[adlen / 8] ^= pad(adlen % 8, be);
+        permute(s, s->start);
+    }
+    s->x[4] ^= be ? 1ULL : 1ULL << 63;
+}
+
+static void finalize(ascon_state_t *s, const uint8_t *k, uint8_t *tag) {
+    int be = s->be;
+    uint64_t k0 = load(k, 8, be), k1 = load(k + 8, 8, be);
+    size_t w = (size_t)s->rate / 8;
+    s->x[w] ^= k0;
+    s->x[w + 1] ^= k1;
+    permute(s, 0);
+    store(tag, s->x[3] ^ k0, 8, be);
+    store(tag + 8, s->x[4] ^ k1, 8, be);
+}
+
+int ascon_aead_encrypt(int variant, uint8_t *c, const uint8_t *m, size_t mlen,
+                       const uint8_t *ad, size_t adlen, const uint8_t *npub, const uint8_t *k) {
+    ascon_state_t s;
+    if (variant != 0 && variant != 1)
+        return -2;
+    init(&s, variant, k, npub, ad, adlen);
+    int be = s.be;
+    size_t rate = (size_t)s.rate;
+    for (; mlen >= rate; m += rate, c += rate, mlen -= rate) {
+        for (size_t w = 0; w < rate / 8; w++) {
+            s.x[w] ^= load(m + 8 * w, 8, be);
+            store(c + 8 * w, s.x[w], 8, be);
+        }
+        permute(&s, s.start);
+    }
+    for (size_t w = 0; 8 * w < mlen; w++) {
+        size_t n = mlen - 8 * w < 8 ? mlen - 8 * w : 8;
+        s.x[w] ^= load(m + 8 * w, n, be);
+        store(c + 8 * w, s.x[w], n, be);
+    }
+    s.x[mlen / 8] ^= pad(mlen % 8, be);
+    finalize(&s, k, c + mlen);
+    return 0;
+}
+
+int ascon_aead_decrypt(int variant, uint8_t *m, const uint8_t *c, size_t clen,
+                       const uint8_t *ad, size_t adlen, const uint8_t *npub, const uint8_t *k) {
+    ascon_state_t s;
+    uint8_t *out = m;
+    uint8_t tag[16];
+    if (variant != 0 && variant != 1)
+        return -2;
+    if (clen < 16)
+        return -1;
+    size_t mlen = clen - 16, total = mlen;
+    init(&s, variant, k, npub, ad, adlen);
+    int be = s.be;
+    size_t rate = (size_t)s.rate;
+    for (; mlen >= rate; m += rate, c += rate, mlen -= rate) {
+        for (size_t w = 0; w < rate / 8; w++) {
+            uint64_t cw = load(c + 8 * w, 8, be);
+            store(m + 8 * w, s.x[w] ^ cw, 8, be);
+            s.x[w] = cw;
+        }
+        permute(&s, s.start);
+    }
+    for (size_t w = 0; 8 * w < mlen; w++) {
+        size_t n = mlen - 8 * w < 8 ? mlen - 8 * w : 8;
+        store(m + 8 * w, s.x[w] ^ load(c + 8 * w, n, be), n, be);
+        s.x[w] ^= load(m + 8 * w, n, be);
+    }
+    s.x[mlen / 8] ^= pad(mlen % 8, be);
+    finalize(&s, k, tag);
+
+    uint8_t diff = 0;
+    for (int i = 0; i < 16; i++)
+        diff |= tag[i] ^ c[mlen + i];
+    if (diff) {
+        for (size_t i = 0; i < total; i++)
+            out[i] = 0;
+        return -1;
+    }
+    return 0;
+}
@@ -14,6 +14,8 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional, Tuple
 
+from core.suites import get_suite
+
 
 def _now_ms() -> int:
     """Return monotonic milliseconds for control timestamps."""
@@ -45,8 +47,19 @@ class ControlState:
         "prepare_received": 0,
         "rekeys_ok": 0,
         "rekeys_fail": 0,
+        "prefetch_sent": 0,
+        "prefetch_received": 0,
     })
     seen_rids: deque[str] = field(default_factory=lambda: deque(maxlen=256))
+    # Optional callback fired after each outbox put so an event loop can wake
+    # immediately instead of polling the queue (must be thread-safe).
+    wakeup: Optional[Callable[[], None]] = None
+    # Optional callback fired with the suite_id of each prefetch hint this side
+    # sends, so the sender warms its own handshake material as well.
+    on_prefetch: Optional[Callable[[str], None]] = None
+    # Optional callback fired with the status payload of every recorded rekey
+    # outcome (ok or fail), e.g. to push it to metrics subscribers.
+    on_rekey_result: Optional[Callable[[Dict[str, object]], None]] = None
 
 
 @dataclass
@@ -55,6 +68,7 @@ class ControlResult:
 
     send: List[dict] = field(default_factory=list)
     start_handshake: Optional[Tuple[str, str]] = None  # (suite_id, rid)
+    prefetch: Optional[str] = None  # suite_id announced by a prefetch_hint
     notes: List[str] = field(default_factory=list)
 
 
@@ -75,6 +89,9 @@ def enqueue_json(state: ControlState, payload: dict) -> None:
     """Place an outbound JSON payload onto the control outbox."""
 
     state.outbox.put(payload)
+    wakeup = state.wakeup
+    if wakeup is not None:
+        wakeup()
 
 
 def request_prepare(state: ControlState, suite_id: str) -> str:
@@ -101,6 +118,28 @@ def request_prepare(state: ControlState, suite_id: str) -> str:
     return rid
 
 
+def request_prefetch(state: ControlState, suite_id: str) -> None:
+    """Announce the likely next suite so both peers can precompute handshake material.
+
+    A hint is advisory: it does not touch the two-phase commit state and may be
+    sent in any state, including while a rekey is negotiating.
+    """
+
+    with state.lock:
+        state.stats["prefetch_sent"] += 1
+    on_prefetch = state.on_prefetch
+    if on_prefetch is not None:
+        on_prefetch(suite_id)
+    enqueue_json(
+        state,
+        {
+            "type": "prefetch_hint",
+            "suite": suite_id,
+            "t_ms": _now_ms(),
+        },
+    )
+
+
 def record_rekey_result(state: ControlState, rid: str, suite_id: str, *, success: bool) -> None:
     """Record outcome of a rekey attempt and enqueue status update."""
 
@@ -125,6 +164,9 @@ def record_rekey_result(state: ControlState, rid: str, suite_id: str, *, success
         state.active_rid = None
         state.state = "RUNNING"
     enqueue_json(state, status_payload)
+    on_rekey_result = state.on_rekey_result
+    if on_rekey_result is not None:
+        on_rekey_result(status_payload)
 
 
 def handle_control(msg: dict, role: str, state: ControlState) -> ControlResult:
@@ -139,6 +181,22 @@ def handle_control(msg: dict, role: str, state: ControlState) -> ControlResult:
     rid = msg.get("rid")
     now = _now_ms()
 
+    if msg_type == "prefetch_hint":
+        suite = msg.get("suite")
+        try:
+            # Advisory only: a suite this side does not know (e.g. a peer with a
+            # newer suite list) is noted and ignored, never raised.
+            suite_id = get_suite(suite)["suite_id"] if isinstance(suite, str) else None
+        except (NotImplementedError, KeyError):
+            suite_id = None
+        if suite_id is None:
+            result.notes.append("invalid_prefetch")
+            return result
+        with state.lock:
+            state.stats["prefetch_received"] += 1
+        result.prefetch = suite_id
+        return result
+
     if role == "gcs":
         if msg_type == "prepare_ok" and isinstance(rid, str):
             with state.lock:
@@ -17,11 +17,12 @@ import json
 import time
 import logging
 import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterable, Optional
 
 from core.config import CONFIG
-from core.suites import get_suite, build_suite_id
+from core.suites import get_suite, build_suite_id, list_suites
 from core.logging_utils import get_logger, configure_file_logger
 
 logger = get_logger("pqc")
@@ -180,6 +181,7 @@ def _pretty_print_counters(counters: Dict[str, object]) -> None:
     scalar_items = []
     handshake_payload: Optional[Dict[str, object]] = None
     primitive_payload: Optional[Dict[str, Dict[str, object]]] = None
+    histogram_payload: Optional[Dict[str, Dict[str, object]]] = None
 
     for key, value in counters.items():
         if key == "handshake_metrics" and isinstance(value, dict):
@@ -188,6 +190,9 @@ def _pretty_print_counters(counters: Dict[str, object]) -> None:
         if key == "primitive_metrics" and isinstance(value, dict):
             primitive_payload = value  # defer printing until after scalars
             continue
+        if key == "latency_histograms" and isinstance(value, dict):
+            histogram_payload = value  # buckets are too long to print; show percentiles
+            continue
         scalar_items.append((key, value))
 
     for key, value in sorted(scalar_items, key=lambda item: item[0]):
@@ -218,6 +223,20 @@ def _pretty_print_counters(counters: Dict[str, object]) -> None:
                 f"in_bytes={total_in}, out_bytes={total_out}"
             )
 
+    if histogram_payload:
+        print("  latency_percentiles:")
+        for name, stats in sorted(histogram_payload.items(), key=lambda item: item[0]):
+            if not isinstance(stats, dict) or not int(stats.get("count", 0) or 0):
+                continue
+            print(
+                "    "
+                f"{name}: count={int(stats.get('count', 0) or 0)}, "
+                f"p50={_format_duration_ns(int(stats.get('p50_ns', 0) or 0))}, "
+                f"p90={_format_duration_ns(int(stats.get('p90_ns', 0) or 0))}, "
+                f"p99={_format_duration_ns(int(stats.get('p99_ns', 0) or 0))}, "
+                f"p99.9={_format_duration_ns(int(stats.get('p999_ns', 0) or 0))}"
+            )
+
 def _require_signature_class():
     """Lazily import oqs Signature and provide a friendly error if missing."""
 
@@ -252,6 +271,178 @@ def _require_run_proxy():
     return _run_proxy
 
 
+class _SuiteKeyCache:
+    """LRU of per-suite key material, invalidated when the source file changes.
+
+    Entries remember the file they were read from; a hit re-stats that file at
+    most once per `revalidate_s` seconds (0 re-stats on every hit), so cycling
+    through cached suites does not touch the disk in between.
+    """
+
+    def __init__(self, max_entries: int = 64, revalidate_s: float = 30.0, *, clock=time.monotonic) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.revalidate_s = max(0.0, float(revalidate_s))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # suite_id -> [value, path, mtime_ns, last_checked]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _mtime_ns(path: Optional[Path]) -> Optional[int]:
+        if path is None:
+            return None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, suite_id: str, *, record: bool = True) -> Optional[object]:
+        with self._lock:
+            entry = self._entries.get(suite_id)
+            if entry is None:
+                self.misses += record
+                return None
+            value, path, mtime_ns, last_checked = entry
+            now = self._clock()
+            if path is not None and now - last_checked >= self.revalidate_s:
+                if self._mtime_ns(path) != mtime_ns:
+                    del self._entries[suite_id]
+                    self.invalidations += 1
+                    self.misses += record
+                    return None
+                entry[3] = now
+            self._entries.move_to_end(suite_id)
+            self.hits += record
+            return value
+
+    def put(self, suite_id: str, value: object, path: Optional[Path] = None) -> None:
+        with self._lock:
+            self._entries[suite_id] = [value, path, self._mtime_ns(path), self._clock()]
+            self._entries.move_to_end(suite_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+class _MatrixKeyLoader:
+    """Callable suite -> key material loader backed by a `_SuiteKeyCache`.
+
+    `read_key(path, suite)` turns one candidate file into the cached value.
+    Candidates are the primary path (initial suite only) followed by
+    `<matrix_dir>/<suite_id>/<filename>`.
+    """
+
+    def __init__(
+        self,
+        *,
+        kind: str,
+        filename: str,
+        read_key: Callable[[Path, Dict[str, object]], object],
+        suite_id: Optional[str],
+        default_path: Optional[Path],
+        matrix_dir: Path,
+        cache: _SuiteKeyCache,
+    ) -> None:
+        self.kind = kind
+        self.filename = filename
+        self.read_key = read_key
+        self.suite_id = suite_id
+        self.default_path = default_path
+        self.matrix_dir = matrix_dir
+        self.cache = cache
+        self._load_lock = threading.Lock()
+
+    def __call__(self, target_suite: Dict[str, object]):
+        target_suite_id = target_suite.get("suite_id") if isinstance(target_suite, dict) else None
+        if not target_suite_id:
+            raise RuntimeError("Suite dictionary missing suite_id")
+
+        cached = self.cache.get(target_suite_id)
+        if cached is not None:
+            return cached
+
+        # One disk load at a time, so a rekey racing the preload thread reuses its result.
+        with self._load_lock:
+            cached = self.cache.get(target_suite_id, record=False)
+            if cached is not None:
+                return cached
+
+            candidates = []
+            if self.default_path and self.suite_id and target_suite_id == self.suite_id:
+                candidates.append(self.default_path)
+            candidates.append(self.matrix_dir / target_suite_id / self.filename)
+
+            seen: Dict[str, None] = {}
+            for candidate in candidates:
+                candidate_path = candidate.expanduser()
+                key = str(candidate_path.resolve()) if candidate_path.exists() else str(candidate_path)
+                if key in seen:
+                    continue
+                seen[key] = None
+                if not candidate_path.exists():
+                    continue
+                value = self.read_key(candidate_path, target_suite)
+                self.cache.put(target_suite_id, value, candidate_path)
+                return value
+
+        raise FileNotFoundError(f"No GCS signing {self.kind} found for suite {target_suite_id}")
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
+
+    def preload(self, suite_ids: Optional[Iterable[str]] = None) -> threading.Thread:
+        """Load every matrix suite (or `suite_ids`) into the cache on a background thread."""
+
+        def run() -> None:
+            targets = list(suite_ids) if suite_ids is not None else _matrix_suite_ids(self.matrix_dir)
+            loaded = 0
+            for target_suite_id in targets:
+                try:
+                    self(get_suite(target_suite_id))
+                    loaded += 1
+                except Exception as exc:
+                    logger.debug(
+                        "Matrix key preload skipped suite",
+                        extra={"suite_id": target_suite_id, "kind": self.kind, "error": str(exc)},
+                    )
+            logger.info("Matrix key preload finished", extra={"kind": self.kind, "loaded": loaded})
+
+        thread = threading.Thread(target=run, name=f"pqc-key-preload-{self.kind}", daemon=True)
+        thread.start()
+        return thread
+
+
+def _matrix_suite_ids(matrix_dir: Path) -> list:
+    """Registered suite IDs that have a directory under `matrix_dir`."""
+
+    try:
+        present = {entry.name for entry in matrix_dir.expanduser().iterdir() if entry.is_dir()}
+    except OSError:
+        return []
+    return [sid for sid in list_suites() if sid in present]
+
+
+def _matrix_key_cache() -> _SuiteKeyCache:
+    return _SuiteKeyCache(
+        max_entries=CONFIG.get("MATRIX_KEY_CACHE_SIZE", 64),
+        revalidate_s=CONFIG.get("MATRIX_KEY_REVALIDATE_S", 30.0),
+    )
+
+
 def _build_matrix_secret_loader(
     *,
     suite_id: Optional[str],
@@ -259,21 +450,19 @@ def _build_matrix_secret_loader(
     initial_secret: Optional[object],
     signature_cls,
     matrix_dir: Optional[Path] = None,
-) -> Callable[[Dict[str, object]], object]:
+    cache: Optional[_SuiteKeyCache] = None,
+) -> _MatrixKeyLoader:
     """Return loader that fetches per-suite signing secrets from disk.
 
     The loader prefers a suite-specific directory under `secrets/matrix/` and falls
-    back to the primary secret path when targeting the initial suite. Results are
-    cached per suite and guarded with a lock because rekeys may run in background
-    threads.
+    back to the primary secret path when targeting the initial suite. Instantiated
+    signature objects are kept in an LRU `_SuiteKeyCache` shared safely with the
+    background rekey and preload threads.
     """
 
-    lock = threading.Lock()
-    cache: Dict[str, object] = {}
+    cache = cache if cache is not None else _SuiteKeyCache()
     if suite_id and initial_secret is not None and isinstance(initial_secret, signature_cls):
-        cache[suite_id] = initial_secret
-
-    matrix_secrets_dir = matrix_dir or Path("secrets/matrix")
+        cache.put(suite_id, initial_secret)
 
     def instantiate(secret_bytes: bytes, sig_name: str):
         errors = []
@@ -301,47 +490,27 @@ def _build_matrix_secret_loader(
         detail = "; ".join(errors) if errors else "unknown error"
         raise RuntimeError(f"Unable to load signature secret: {detail}")
 
-    def load_secret_for_suite(target_suite: Dict[str, object]):
-        target_suite_id = target_suite.get("suite_id") if isinstance(target_suite, dict) else None
-        if not target_suite_id:
-            raise RuntimeError("Suite dictionary missing suite_id")
-
-        with lock:
-            cached = cache.get(target_suite_id)
-            if cached is not None:
-                return cached
-
-        candidates = []
-        if default_secret_path and suite_id and target_suite_id == suite_id:
-            candidates.append(default_secret_path)
-        candidates.append(matrix_secrets_dir / target_suite_id / "gcs_signing.key")
-
-        seen: Dict[str, None] = {}
-        for candidate in candidates:
-            candidate_path = candidate.expanduser()
-            key = str(candidate_path.resolve()) if candidate_path.exists() else str(candidate_path)
-            if key in seen:
-                continue
-            seen[key] = None
-            if not candidate_path.exists():
-                continue
-            try:
-                secret_bytes = candidate_path.read_bytes()
-            except Exception as exc:
-                raise RuntimeError(f"Failed to read GCS secret key {candidate_path}: {exc}") from exc
-            try:
-                sig_obj = instantiate(secret_bytes, target_suite["sig_name"])  # type: ignore[index]
-            except Exception as exc:
-                raise RuntimeError(
-                    f"Failed to load GCS secret key {candidate_path} for suite {target_suite_id}: {exc}"
-                ) from exc
-            with lock:
-                cache[target_suite_id] = sig_obj
-            return sig_obj
-
-        raise FileNotFoundError(f"No GCS signing secret key found for suite {target_suite_id}")
-
-    return load_secret_for_suite
+    def read_secret(candidate_path: Path, target_suite: Dict[str, object]):
+        try:
+            secret_bytes = candidate_path.read_bytes()
+        except Exception as exc:
+            raise RuntimeError(f"Failed to read GCS secret key {candidate_path}: {exc}") from exc
+        try:
+            return instantiate(secret_bytes, target_suite["sig_name"])  # type: ignore[index]
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to load GCS secret key {candidate_path} for suite {target_suite['suite_id']}: {exc}"
+            ) from exc
+
+    return _MatrixKeyLoader(
+        kind="secret key",
+        filename="gcs_signing.key",
+        read_key=read_secret,
+        suite_id=suite_id,
+        default_path=default_secret_path,
+        matrix_dir=matrix_dir or Path("secrets/matrix"),
+        cache=cache,
+    )
 
 
 def _build_matrix_public_loader(
@@ -350,51 +519,29 @@ def _build_matrix_public_loader(
     default_public_path: Optional[Path],
     initial_public: Optional[bytes],
     matrix_dir: Optional[Path] = None,
-) -> Callable[[Dict[str, object]], bytes]:
+    cache: Optional[_SuiteKeyCache] = None,
+) -> _MatrixKeyLoader:
     """Return loader that fetches per-suite GCS signing public keys from disk."""
 
-    lock = threading.Lock()
-    cache: Dict[str, bytes] = {}
+    cache = cache if cache is not None else _SuiteKeyCache()
     if suite_id and initial_public is not None:
-        cache[suite_id] = initial_public
-
-    matrix_public_dir = matrix_dir or Path("secrets/matrix")
-
-    def load_public_for_suite(target_suite: Dict[str, object]) -> bytes:
-        target_suite_id = target_suite.get("suite_id") if isinstance(target_suite, dict) else None
-        if not target_suite_id:
-            raise RuntimeError("Suite dictionary missing suite_id")
-
-        with lock:
-            cached = cache.get(target_suite_id)
-            if cached is not None:
-                return cached
-
-        candidates = []
-        if default_public_path and suite_id and target_suite_id == suite_id:
-            candidates.append(default_public_path)
-        candidates.append(matrix_public_dir / target_suite_id / "gcs_signing.pub")
+        cache.put(suite_id, initial_public)
 
-        seen: Dict[str, None] = {}
-        for candidate in candidates:
-            candidate_path = candidate.expanduser()
-            key = str(candidate_path.resolve()) if candidate_path.exists() else str(candidate_path)
-            if key in seen:
-                continue
-            seen[key] = None
-            if not candidate_path.exists():
-                continue
-            try:
-                public_bytes = candidate_path.read_bytes()
-            except Exception as exc:
-                raise RuntimeError(f"Failed to read GCS public key {candidate_path}: {exc}") from exc
-            with lock:
-                cache[target_suite_id] = public_bytes
-            return public_bytes
-
-        raise FileNotFoundError(f"No GCS signing public key found for suite {target_suite_id}")
+    def read_public(candidate_path: Path, _target_suite: Dict[str, object]) -> bytes:
+        try:
+            return candidate_path.read_bytes()
+        except Exception as exc:
+            raise RuntimeError(f"Failed to read GCS public key {candidate_path}: {exc}") from exc
 
-    return load_public_for_suite
+    return _MatrixKeyLoader(
+        kind="public key",
+        filename="gcs_signing.pub",
+        read_key=read_public,
+        suite_id=suite_id,
+        default_path=default_public_path,
+        matrix_dir=matrix_dir or Path("secrets/matrix"),
+        cache=cache,
+    )
 
 
 def signal_handler(signum, frame):
@@ -642,7 +789,10 @@ def gcs_command(args):
         default_secret_path=primary_secret_path,
         initial_secret=gcs_sig_secret,
         signature_cls=Signature,
+        cache=_matrix_key_cache(),
     )
+    if CONFIG.get("MATRIX_KEY_PRELOAD", True):
+        load_secret_for_suite.preload()
 
     try:
         log_path = configure_file_logger("gcs", logger)
@@ -665,7 +815,9 @@ def gcs_command(args):
             manual_control=getattr(args, "control_manual", False),
             quiet=quiet,
             status_file=status_file,
+            metrics_socket=getattr(args, "metrics_socket", None),
             load_gcs_secret=load_secret_for_suite,
+            engine=getattr(args, "engine", None),
         )
 
         _augment_part_b_metrics(counters)
@@ -681,6 +833,7 @@ def gcs_command(args):
             "role": "gcs",
             "suite": suite_id,
             "counters": counters,
+            "key_cache": load_secret_for_suite.stats(),
             "ts_stop_ns": time.time_ns(),
         }
         write_json_report(json_out_path, payload, quiet=quiet)
@@ -749,7 +902,10 @@ def drone_command(args):
             suite_id=suite_id,
             default_public_path=primary_public_path,
             initial_public=gcs_sig_public,
+            cache=_matrix_key_cache(),
         )
+        if CONFIG.get("MATRIX_KEY_PRELOAD", True):
+            load_public_for_suite.preload()
         
         counters = proxy_runner(
             role="drone",
@@ -761,7 +917,9 @@ def drone_command(args):
             manual_control=False,
             quiet=quiet,
             status_file=status_file,
+            metrics_socket=getattr(args, "metrics_socket", None),
             load_gcs_public=load_public_for_suite,
+            engine=getattr(args, "engine", None),
         )
         
         _augment_part_b_metrics(counters)
@@ -777,6 +935,7 @@ def drone_command(args):
             "role": "drone",
             "suite": suite_id,
             "counters": counters,
+            "key_cache": load_public_for_suite.stats(),
             "ts_stop_ns": time.time_ns(),
         }
         write_json_report(json_out_path, payload, quiet=quiet)
@@ -831,6 +990,10 @@ def main():
                            help="Enable interactive manual in-band rekey control thread")
     gcs_parser.add_argument("--status-file",
                            help="Path to write proxy status JSON updates (handshake/rekey)")
+    gcs_parser.add_argument("--metrics-socket",
+                           help="Unix socket path streaming live counters/events (default: CONFIG METRICS_SOCKET)")
+    gcs_parser.add_argument("--engine", choices=("selectors", "asyncio"),
+                           help="Proxy engine (default: CONFIG PROXY_ENGINE, normally selectors)")
     
     # drone subcommand
     drone_parser = subparsers.add_parser('drone', help='Start drone proxy')
@@ -854,6 +1017,10 @@ def main():
                               help="Optional path to write counters JSON on shutdown")
     drone_parser.add_argument("--status-file",
                               help="Path to write proxy status JSON updates (handshake/rekey)")
+    drone_parser.add_argument("--metrics-socket",
+                              help="Unix socket path streaming live counters/events (default: CONFIG METRICS_SOCKET)")
+    drone_parser.add_argument("--engine", choices=("selectors", "asyncio"),
+                              help="Proxy engine (default: CONFIG PROXY_ENGINE, normally selectors)")
     
     args = parser.parse_args()
     
@@ -0,0 +1,262 @@
+"""
+Fixed-layout, mmap-backed live counter block for the proxy status file.
+
+The proxy used to rewrite the whole status JSON (``counters.to_dict()``, tmp
+file + rename) every second so schedulers could poll ``enc_out``/``rekeys_ok``.
+With a status block the proxy instead updates the scalar counters in place in
+``<status_file>.counters`` and readers map it read-only: a poll is one
+``stat`` plus a small copy, and nothing is created, renamed or re-parsed.
+
+The full JSON (primitive timings, histograms, handshake metrics) is written on
+demand: a reader calls ``request_json_export`` and the proxy writes a
+``"running"`` snapshot to the status file on its next status tick. Event
+records (``handshake_ok``, ``rekey_ok``, ``stopped``) are still written there.
+
+The block outlives the proxy so late readers can see the final values; the
+writer sets the ``stopped`` flag on close, and readers that want live counters
+(``read_live_counters``) skip a stopped block.
+
+Layout (little endian): magic ``PQCS``, u16 version, u16 counter count, u64
+sequence, i64 ``ts_ns``, u32 flags (bit 0: stopped) plus 4 pad bytes, the
+``COUNTER_FIELDS`` as i64, then the ``TEXT_FIELDS`` as NUL-padded UTF-8. The
+writer makes the sequence odd while updating and even afterwards; readers
+retry until they copy the block between two equal even sequence values.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+MAGIC = b"PQCS"
+VERSION = 3
+
+COUNTER_FIELDS = (
+    "ptx_out",
+    "ptx_in",
+    "enc_out",
+    "enc_in",
+    "drops",
+    "drop_replay",
+    "drop_auth",
+    "drop_header",
+    "drop_session_epoch",
+    "drop_other",
+    "drop_src_addr",
+    "shed_header",
+    "shed_auth",
+    "shed_session",
+    "shed_replay",
+    "shed_seq",
+    "enc_in_grace",
+    "rekeys_ok",
+    "rekeys_fail",
+    "last_rekey_ms",
+    "last_rekey_swap_ns",
+)
+TEXT_FIELDS = ("suite", "last_rekey_suite")
+_TEXT_BYTES = 96
+
+_HEADER = struct.Struct("<4sHHQqI4x")
+_SEQ_OFFSET = 8
+_FLAGS_OFFSET = 24
+FLAG_STOPPED = 1
+_COUNTERS = struct.Struct("<" + "q" * len(COUNTER_FIELDS))
+_COUNTERS_OFFSET = _HEADER.size
+_TEXT_OFFSET = _COUNTERS_OFFSET + _COUNTERS.size
+BLOCK_SIZE = _TEXT_OFFSET + _TEXT_BYTES * len(TEXT_FIELDS)
+
+_INT64_MAX = (1 << 63) - 1
+
+PathLike = Union[str, Path]
+
+
+def block_path(status_path: PathLike) -> Path:
+    path = Path(status_path)
+    return path.with_suffix(path.suffix + ".counters")
+
+
+def export_request_path(status_path: PathLike) -> Path:
+    path = Path(status_path)
+    return path.with_suffix(path.suffix + ".export")
+
+
+def request_json_export(status_path: PathLike) -> None:
+    """Ask the proxy to write a full ``"running"`` JSON snapshot on its next tick."""
+
+    export_request_path(status_path).touch()
+
+
+def take_export_request(status_path: PathLike) -> bool:
+    """Consume a pending export request; True if one was waiting."""
+
+    try:
+        export_request_path(status_path).unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+class StatusBlockWriter:
+    """Single-writer owner of a status block file."""
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Build the block beside the target and rename it into place, so a reader
+        # still mapping a previous proxy's block never sees it truncated.
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            handle.write(_HEADER.pack(MAGIC, VERSION, len(COUNTER_FIELDS), 0, 0, 0))
+            handle.write(bytes(BLOCK_SIZE - _HEADER.size))
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), BLOCK_SIZE)
+        self._seq = 0
+
+    def publish(self, counters: Mapping[str, object], *, suite: str = "") -> None:
+        """Write the scalar counters in ``counters`` (missing ones count as 0)."""
+
+        values = []
+        for name in COUNTER_FIELDS:
+            try:
+                value = int(counters.get(name) or 0)
+            except (TypeError, ValueError):
+                value = 0
+            values.append(max(-_INT64_MAX, min(_INT64_MAX, value)))
+        texts = (suite, counters.get("last_rekey_suite") or "")
+
+        mm = self._map
+        self._seq += 1
+        struct.pack_into("<Q", mm, _SEQ_OFFSET, self._seq)
+        struct.pack_into("<q", mm, _SEQ_OFFSET + 8, time.time_ns())
+        _COUNTERS.pack_into(mm, _COUNTERS_OFFSET, *values)
+        for index, text in enumerate(texts):
+            raw = str(text).encode("utf-8")[:_TEXT_BYTES]
+            start = _TEXT_OFFSET + index * _TEXT_BYTES
+            mm[start:start + _TEXT_BYTES] = raw.ljust(_TEXT_BYTES, b"\0")
+        self._seq += 1
+        struct.pack_into("<Q", mm, _SEQ_OFFSET, self._seq)
+
+    def close(self) -> None:
+        """Mark the block stopped; the file stays behind with the final values."""
+
+        mm = self._map
+        try:
+            self._seq += 1
+            struct.pack_into("<Q", mm, _SEQ_OFFSET, self._seq)
+            struct.pack_into("<I", mm, _FLAGS_OFFSET, FLAG_STOPPED)
+            self._seq += 1
+            struct.pack_into("<Q", mm, _SEQ_OFFSET, self._seq)
+            mm.close()
+        finally:
+            self._file.close()
+
+
+class StatusBlockReader:
+    """Read-only view of a status block that survives the proxy being restarted.
+
+    Each ``read`` stats the path and remaps when the file was replaced.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        self._map: Optional[mmap.mmap] = None
+        self._ino: Optional[int] = None
+
+    def _remap(self) -> Optional[mmap.mmap]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self.close()
+            return None
+        if self._map is not None and stat.st_ino == self._ino:
+            return self._map
+        self.close()
+        if stat.st_size < BLOCK_SIZE:
+            return None
+        try:
+            with open(self.path, "rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), BLOCK_SIZE, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        self._ino = stat.st_ino
+        return self._map
+
+    def read(self, *, attempts: int = 1000) -> Optional[Dict[str, object]]:
+        """Return the counters as a dict, or None if no valid block is present."""
+
+        mm = self._remap()
+        if mm is None:
+            return None
+        for _ in range(attempts):
+            (seq_before,) = struct.unpack_from("<Q", mm, _SEQ_OFFSET)
+            if seq_before & 1:
+                time.sleep(0)
+                continue
+            raw = mm[:BLOCK_SIZE]
+            (seq_after,) = struct.unpack_from("<Q", mm, _SEQ_OFFSET)
+            if seq_after == seq_before:
+                return _decode(raw)
+        return None
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._ino = None
+
+
+def _decode(raw: bytes) -> Optional[Dict[str, object]]:
+    magic, version, count, seq, ts_ns, flags = _HEADER.unpack_from(raw)
+    if magic != MAGIC or version != VERSION or count != len(COUNTER_FIELDS) or seq == 0:
+        return None
+    result: Dict[str, object] = dict(zip(COUNTER_FIELDS, _COUNTERS.unpack_from(raw, _COUNTERS_OFFSET)))
+    for index, name in enumerate(TEXT_FIELDS):
+        start = _TEXT_OFFSET + index * _TEXT_BYTES
+        result[name] = raw[start:start + _TEXT_BYTES].rstrip(b"\0").decode("utf-8", "replace")
+    result["ts_ns"] = ts_ns
+    result["stopped"] = bool(flags & FLAG_STOPPED)
+    return result
+
+
+def read_live_counters(reader: StatusBlockReader) -> Optional[Dict[str, object]]:
+    """``reader.read()`` while a proxy is publishing; None once the block is stopped."""
+
+    stats = reader.read()
+    if stats is None or stats["stopped"]:
+        return None
+    return stats
+
+
+def read_status_block(path: PathLike) -> Optional[Dict[str, object]]:
+    """One-shot read of a status block file."""
+
+    reader = StatusBlockReader(path)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: python -m core.status_block <status_file>", file=sys.stderr)
+        return 2
+    payload = read_status_block(block_path(args[0]))
+    if payload is None:
+        print(f"No status block for {args[0]}", file=sys.stderr)
+        return 1
+    print(json.dumps(payload, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
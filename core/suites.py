@@ -1,13 +1,19 @@
 """PQC cryptographic suite registry and algorithm ID mapping.
 
 Provides a composable {KEM × AEAD × SIG} registry with synonym resolution and
-helpers for querying oqs availability.
+helpers for querying oqs availability. The registry is built on first use, and
+capability probes are memoised per process and cached on disk per liboqs version
+(``PQC_CAPABILITY_CACHE`` sets the file, empty disables it).
 """
 
 from __future__ import annotations
 
+import json
+import os
+import threading
+from pathlib import Path
 from types import MappingProxyType
-from typing import Dict, Iterable, Tuple
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
 
 
 def _normalize_alias(value: str) -> str:
@@ -328,40 +334,34 @@ def _probe_aead_support() -> Tuple[Tuple[str, ...], Dict[str, str]]:
     else:
         available.append("chacha20poly1305")
 
-    # ASCON requires either pyascon or ascon modules. Attempt pyascon first.
-    ascon_errors: list[str] = []
-    try:  # pragma: no cover - optional dependency
-        import pyascon  # type: ignore  # noqa: F401
+    # ASCON runs on the in-tree engine (core.ascon_aead): the native backend when
+    # built, pure Python otherwise, so it needs no optional module.
+    available.append("ascon128")
 
-        available.append("ascon128")
-    except ImportError as exc_py:  # pragma: no cover - optional path
-        ascon_errors.append(f"pyascon missing: {exc_py}")
-
-    if "ascon128" not in available:
-        try:  # pragma: no cover - optional dependency
-            import ascon  # type: ignore  # noqa: F401
-
-            available.append("ascon128")
-        except ImportError as exc_ascon:  # pragma: no cover - optional path
-            ascon_errors.append(f"ascon missing: {exc_ascon}")
+    return tuple(available), missing
 
-    if "ascon128" not in available and ascon_errors:
-        missing["ascon128"] = "; ".join(ascon_errors)
 
-    return tuple(available), missing
+def _aead_support() -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    with _CAPABILITY_LOCK:
+        memo = _CAPABILITY_MEMO.get("aead")
+    if memo is None:
+        memo = _probe_aead_support()
+        with _CAPABILITY_LOCK:
+            _CAPABILITY_MEMO["aead"] = memo
+    return memo  # type: ignore[return-value]
 
 
 def available_aead_tokens() -> Tuple[str, ...]:
     """Return the AEAD tokens supported by this runtime."""
 
-    supported, _ = _probe_aead_support()
+    supported, _ = _aead_support()
     return supported
 
 
 def unavailable_aead_reasons() -> Dict[str, str]:
     """Return descriptive reasons for AEAD algorithms that are unavailable."""
 
-    _, missing = _probe_aead_support()
+    _, missing = _aead_support()
     return dict(missing)
 
 
@@ -513,24 +513,66 @@ def _generate_suite_registry() -> MappingProxyType:
     return MappingProxyType(suites)
 
 
-SUITES = _generate_suite_registry()
+# Built on first use rather than at import; `SUITES` resolves through the module
+# __getattr__ below and is then bound as a plain module global.
+_SUITES: Optional[MappingProxyType] = None
+# Reverse index: the items of each registry entry -> suite_id. Entries only hold
+# str/int values, so the frozenset is hashable and equality-compatible with dict ==.
+_SUITE_INDEX: Dict[FrozenSet[Tuple[str, object]], str] = {}
+
+
+def _registry() -> MappingProxyType:
+    global _SUITES, _SUITE_INDEX
+    if _SUITES is None:
+        suites = _generate_suite_registry()
+        _SUITE_INDEX = {frozenset(config.items()): suite_id for suite_id, config in suites.items()}
+        _SUITES = suites
+        globals()["SUITES"] = suites
+    return _SUITES
+
+
+def __getattr__(name: str):
+    if name == "SUITES":
+        return _registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def suite_id_for(suite: Mapping[str, object]) -> Optional[str]:
+    """Return the suite_id of the registry entry equal to `suite`, or None.
+
+    Constant-time replacement for scanning SUITES with `dict(s) == suite`. Dicts
+    from `get_suite` carry their `suite_id`, so they cost one comparison; other
+    mappings go through the reverse index.
+    """
+
+    try:
+        suite_id = suite.get("suite_id")
+        registry = _registry()
+        if isinstance(suite_id, str):
+            entry = registry.get(suite_id)
+            # Every entry holds its own suite_id, so no other entry can be equal.
+            return suite_id if entry is not None and entry == suite else None
+        return _SUITE_INDEX.get(frozenset(suite.items()))
+    except (AttributeError, TypeError):
+        return None
 
 
 def list_suites() -> Dict[str, Dict]:
     """Return all available suites as immutable mapping."""
 
-    return {suite_id: dict(config) for suite_id, config in SUITES.items()}
+    return {suite_id: dict(config) for suite_id, config in _registry().items()}
 
 
 def get_suite(suite_id: str) -> Dict:
     """Get suite configuration by ID, resolving legacy aliases and synonyms."""
 
     canonical_id = _canonicalize_suite_id(suite_id)
+    registry = _registry()
 
-    if canonical_id not in SUITES:
+    if canonical_id not in registry:
         raise NotImplementedError(f"unknown suite_id: {suite_id}")
 
-    suite = SUITES[canonical_id]
+    suite = registry[canonical_id]
 
     required_fields = {"kem_name", "sig_name", "aead", "kdf", "nist_level"}
     missing_fields = required_fields - set(suite.keys())
@@ -562,28 +604,96 @@ def _safe_get_enabled_sig_mechanisms() -> Iterable[str]:
     return sig_loader()
 
 
-def enabled_kems() -> Tuple[str, ...]:
-    """Return tuple of oqs KEM mechanism names supported by the runtime."""
+# Memoised capability probes: {"kem"/"sig": enabled oqs names, "aead": probe result}.
+_CAPABILITY_MEMO: Dict[str, object] = {}
+_CAPABILITY_LOCK = threading.Lock()
+_CAPABILITY_CACHE_ENV = "PQC_CAPABILITY_CACHE"
+_DEFAULT_CAPABILITY_CACHE = Path("~/.cache/pqc-proxy/oqs_capabilities.json")
 
-    mechanisms = {_normalize_alias(name) for name in _safe_get_enabled_kem_mechanisms()}
-    result = [
+
+def clear_capability_cache() -> None:
+    """Forget memoised oqs/AEAD probe results (the on-disk cache is left alone)."""
+
+    with _CAPABILITY_LOCK:
+        _CAPABILITY_MEMO.clear()
+
+
+def _capability_cache_path() -> Optional[Path]:
+    """On-disk probe cache location; PQC_CAPABILITY_CACHE overrides, "" disables."""
+
+    override = os.environ.get(_CAPABILITY_CACHE_ENV)
+    if override is not None:
+        return Path(override).expanduser() if override.strip() else None
+    return _DEFAULT_CAPABILITY_CACHE.expanduser()
+
+
+def _liboqs_version() -> Optional[str]:
+    try:
+        from oqs import oqs as oqs_mod  # type: ignore
+    except Exception:
+        return None
+    try:
+        return str(oqs_mod.oqs_version())
+    except Exception:
+        return None
+
+
+def _enabled_mechanisms(kind: str) -> FrozenSet[str]:
+    """Normalised oqs mechanism names of `kind` ("kem"/"sig"), cached on disk per liboqs version."""
+
+    loader = _safe_get_enabled_kem_mechanisms if kind == "kem" else _safe_get_enabled_sig_mechanisms
+    path = _capability_cache_path()
+    version = _liboqs_version() if path is not None else None
+    cached: Dict[str, object] = {}
+    if version is not None:
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+        if isinstance(cached, dict) and cached.get("liboqs_version") == version and isinstance(cached.get(kind), list):
+            return frozenset(cached[kind])
+
+    mechanisms = frozenset(_normalize_alias(name) for name in loader())
+    if version is not None:
+        if not isinstance(cached, dict) or cached.get("liboqs_version") != version:
+            cached = {"liboqs_version": version}
+        cached[kind] = sorted(mechanisms)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(cached), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError:
+            pass
+    return mechanisms
+
+
+def _enabled_names(kind: str, registry: Dict[str, Dict]) -> Tuple[str, ...]:
+    with _CAPABILITY_LOCK:
+        memo = _CAPABILITY_MEMO.get(kind)
+    if memo is not None:
+        return memo  # type: ignore[return-value]
+    mechanisms = _enabled_mechanisms(kind)
+    result = tuple(
         entry["oqs_name"]
-        for entry in _KEM_REGISTRY.values()
+        for entry in registry.values()
         if _normalize_alias(entry["oqs_name"]) in mechanisms
-    ]
-    return tuple(result)
+    )
+    with _CAPABILITY_LOCK:
+        _CAPABILITY_MEMO[kind] = result
+    return result
+
+
+def enabled_kems() -> Tuple[str, ...]:
+    """Return tuple of oqs KEM mechanism names supported by the runtime."""
+
+    return _enabled_names("kem", _KEM_REGISTRY)
 
 
 def enabled_sigs() -> Tuple[str, ...]:
     """Return tuple of oqs signature mechanism names supported by the runtime."""
 
-    mechanisms = {_normalize_alias(name) for name in _safe_get_enabled_sig_mechanisms()}
-    result = [
-        entry["oqs_name"]
-        for entry in _SIG_REGISTRY.values()
-        if _normalize_alias(entry["oqs_name"]) in mechanisms
-    ]
-    return tuple(result)
+    return _enabled_names("sig", _SIG_REGISTRY)
 
 
 def header_ids_for_suite(suite: Dict) -> Tuple[int, int, int, int]:
@@ -0,0 +1,274 @@
+"""
+Batched UDP receive/send helpers for the proxy data plane.
+
+On Linux (glibc/musl exposing ``recvmmsg``/``sendmmsg``) a burst of datagrams is
+moved with one syscall via ctypes. Elsewhere, or when the symbols are missing,
+the same API degrades to a non-blocking ``recvfrom_into``/``sendto`` loop so
+callers never need a second code path.
+
+Receive buffers are preallocated once per ``BatchReceiver``; returned
+memoryviews stay valid until the next ``recv`` call on the same receiver.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import socket
+import struct
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+Address = Tuple[str, int]
+
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0x40)
+_SOCKADDR_STORAGE_LEN = 128
+_FAMILY = struct.Struct("=H")
+_PORT = struct.Struct("!H")
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_mmsg():
+    if not sys.platform.startswith("linux"):
+        return None, None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        recvmmsg = libc.recvmmsg
+        sendmmsg = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None, None
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    sendmmsg.restype = ctypes.c_int
+    return recvmmsg, sendmmsg
+
+
+_recvmmsg, _sendmmsg = _load_mmsg()
+
+
+def mmsg_available() -> bool:
+    """Return True when the ctypes recvmmsg/sendmmsg backend can be used."""
+    return _recvmmsg is not None and _sendmmsg is not None
+
+
+def _resolve_backend(backend: str) -> str:
+    if backend == "auto":
+        return "mmsg" if mmsg_available() else "loop"
+    if backend == "mmsg" and not mmsg_available():
+        raise NotImplementedError("recvmmsg/sendmmsg not available on this platform")
+    if backend not in ("mmsg", "loop"):
+        raise NotImplementedError(f"unknown UDP batch backend: {backend}")
+    return backend
+
+
+def _decode_sockaddr(raw: ctypes.Array) -> Address:
+    family = _FAMILY.unpack_from(raw, 0)[0]
+    port = _PORT.unpack_from(raw, 2)[0]
+    if family == socket.AF_INET:
+        return socket.inet_ntop(socket.AF_INET, bytes(raw[4:8])), port
+    if family == socket.AF_INET6:
+        return socket.inet_ntop(socket.AF_INET6, bytes(raw[8:24])), port
+    raise OSError(errno.EAFNOSUPPORT, f"unsupported address family {family}")
+
+
+def _encode_sockaddr(addr: Address) -> Tuple[ctypes.Array, int]:
+    host, port = addr[0], addr[1]
+    raw = ctypes.create_string_buffer(_SOCKADDR_STORAGE_LEN)
+    try:
+        packed = socket.inet_pton(socket.AF_INET, host)
+        _FAMILY.pack_into(raw, 0, socket.AF_INET)
+        _PORT.pack_into(raw, 2, port)
+        raw[4:8] = packed
+        return raw, 16
+    except OSError:
+        pass
+    try:
+        packed = socket.inet_pton(socket.AF_INET6, host)
+    except OSError:
+        # Hostname (e.g. "localhost"): resolve once for the batch.
+        info = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0]
+        return _encode_sockaddr(info[4][:2])
+    _FAMILY.pack_into(raw, 0, socket.AF_INET6)
+    _PORT.pack_into(raw, 2, port)
+    raw[8:24] = packed
+    return raw, 28
+
+
+class BatchReceiver:
+    """Receive up to ``batch_size`` datagrams per call into preallocated slots.
+
+    With ``headroom`` > 0 each slot reserves leading bytes; passing ``prefix``
+    to ``recv`` writes it into the last headroom byte and includes it in the
+    returned view (used for the in-place packet-type byte).
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        size: int = 16384,
+        headroom: int = 0,
+        backend: str = "auto",
+    ) -> None:
+        if batch_size < 1:
+            raise NotImplementedError("batch_size must be >= 1")
+        self.backend = _resolve_backend(backend)
+        self.batch_size = batch_size
+        self._headroom = headroom
+        self._size = size
+        self._buffers = [bytearray(size + headroom) for _ in range(batch_size)]
+        self._slots = [memoryview(buf) for buf in self._buffers]
+        self._rx_views = [slot[headroom:] for slot in self._slots]
+
+        if self.backend == "mmsg":
+            self._iov = (_IoVec * batch_size)()
+            self._names = [ctypes.create_string_buffer(_SOCKADDR_STORAGE_LEN) for _ in range(batch_size)]
+            self._msgs = (_MMsgHdr * batch_size)()
+            for idx, buf in enumerate(self._buffers):
+                base = ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+                self._iov[idx].iov_base = base + headroom
+                self._iov[idx].iov_len = size
+                hdr = self._msgs[idx].msg_hdr
+                hdr.msg_name = ctypes.addressof(self._names[idx])
+                hdr.msg_iov = ctypes.pointer(self._iov[idx])
+                hdr.msg_iovlen = 1
+
+    def recv(self, sock: socket.socket, prefix: Optional[int] = None) -> List[Tuple[memoryview, Address]]:
+        """Drain up to ``batch_size`` queued datagrams without blocking.
+
+        Returns an empty list when nothing is queued. Socket errors other than
+        EAGAIN/EWOULDBLOCK propagate as ``OSError``.
+        """
+        if self.backend == "mmsg":
+            lengths_addrs = self._recv_mmsg(sock)
+        else:
+            lengths_addrs = self._recv_loop(sock)
+
+        packets: List[Tuple[memoryview, Address]] = []
+        headroom = self._headroom
+        for idx, (nbytes, addr) in enumerate(lengths_addrs):
+            if prefix is None:
+                packets.append((self._rx_views[idx][:nbytes], addr))
+            else:
+                slot = self._slots[idx]
+                slot[headroom - 1] = prefix
+                packets.append((slot[headroom - 1 : headroom + nbytes], addr))
+        return packets
+
+    def _recv_mmsg(self, sock: socket.socket) -> List[Tuple[int, Address]]:
+        msgs = self._msgs
+        for idx in range(self.batch_size):
+            msgs[idx].msg_hdr.msg_namelen = _SOCKADDR_STORAGE_LEN
+            msgs[idx].msg_hdr.msg_flags = 0
+        count = _recvmmsg(sock.fileno(), msgs, self.batch_size, _MSG_DONTWAIT, None)  # type: ignore[misc]
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, "recvmmsg failed")
+        return [(msgs[idx].msg_len, _decode_sockaddr(self._names[idx])) for idx in range(count)]
+
+    def _recv_loop(self, sock: socket.socket) -> List[Tuple[int, Address]]:
+        received: List[Tuple[int, Address]] = []
+        for idx in range(self.batch_size):
+            try:
+                nbytes, addr = sock.recvfrom_into(self._rx_views[idx], 0, _MSG_DONTWAIT)
+            except (BlockingIOError, InterruptedError):
+                break
+            received.append((nbytes, addr))
+        return received
+
+
+class BatchSender:
+    """Send a burst of datagrams to one peer with as few syscalls as possible."""
+
+    def __init__(self, batch_size: int, backend: str = "auto") -> None:
+        if batch_size < 1:
+            raise NotImplementedError("batch_size must be >= 1")
+        self.backend = _resolve_backend(backend)
+        self.batch_size = batch_size
+        self._peer: Optional[Address] = None
+        if self.backend == "mmsg":
+            self._iov = (_IoVec * batch_size)()
+            self._msgs = (_MMsgHdr * batch_size)()
+            for idx in range(batch_size):
+                self._msgs[idx].msg_hdr.msg_iov = ctypes.pointer(self._iov[idx])
+                self._msgs[idx].msg_hdr.msg_iovlen = 1
+
+    def _set_peer(self, peer: Address) -> None:
+        self._peer_raw, namelen = _encode_sockaddr(peer)
+        name = ctypes.addressof(self._peer_raw)
+        for idx in range(self.batch_size):
+            self._msgs[idx].msg_hdr.msg_name = name
+            self._msgs[idx].msg_hdr.msg_namelen = namelen
+        self._peer = peer
+
+    def send(self, sock: socket.socket, datagrams: Sequence[bytes], peer: Address, skip: int = 0) -> int:
+        """Send ``datagrams`` (each minus its first ``skip`` bytes) to ``peer``.
+
+        Returns the number of datagrams handed to the kernel; a short count
+        means the socket buffer filled (EAGAIN) and the rest were not sent.
+        Items must be ``bytes`` on the mmsg backend so their storage can be
+        referenced without copying.
+        """
+        if self.backend == "loop":
+            return self._send_loop(sock, datagrams, peer, skip)
+        if peer != self._peer:
+            self._set_peer(peer)
+
+        sent = 0
+        total = len(datagrams)
+        fd = sock.fileno()
+        while sent < total:
+            chunk = datagrams[sent : sent + self.batch_size]
+            # Keep references alive until the syscall returns.
+            pinned = [item if isinstance(item, bytes) else bytes(item) for item in chunk]
+            for idx, item in enumerate(pinned):
+                offset = min(skip, len(item))
+                self._iov[idx].iov_base = ctypes.cast(ctypes.c_char_p(item), ctypes.c_void_p).value + offset
+                self._iov[idx].iov_len = len(item) - offset
+            count = _sendmmsg(fd, self._msgs, len(pinned), 0)  # type: ignore[misc]
+            if count < 0:
+                err = ctypes.get_errno()
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                    break
+                raise OSError(err, "sendmmsg failed")
+            sent += count
+            if count < len(pinned):
+                break
+        return sent
+
+    @staticmethod
+    def _send_loop(sock: socket.socket, datagrams: Sequence[bytes], peer: Address, skip: int) -> int:
+        sent = 0
+        for item in datagrams:
+            payload = memoryview(item)[skip:] if skip else item
+            try:
+                sock.sendto(payload, peer)
+            except (BlockingIOError, InterruptedError):
+                break
+            sent += 1
+        return sent
+
+
+__all__ = ["BatchReceiver", "BatchSender", "mmsg_available"]
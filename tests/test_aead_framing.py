@@ -10,17 +10,12 @@ try:
 except ImportError:  # pragma: no cover - fallback when ChaCha is unavailable
     ChaCha20Poly1305 = None
 
-try:
-    import ascon  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    ascon = None
-
 # Skip tests if cryptography not available
 pytest.importorskip("cryptography.hazmat.primitives.ciphers.aead")
 
 from core.aead import (
     Sender, Receiver, AeadIds, HeaderMismatch, AeadAuthError, ReplayError,
-    HEADER_LEN, IV_LEN
+    SequenceOverflow, HEADER_LEN, IV_LEN
 )
 from core.config import CONFIG
 from core.suites import get_suite, header_ids_for_suite
@@ -82,10 +77,7 @@ def test_round_trip_three_payloads():
                 ChaCha20Poly1305 is None, reason="ChaCha20-Poly1305 unavailable"
             ),
         ),
-        pytest.param(
-            "cs-mlkem512-ascon128-mldsa44",
-            marks=pytest.mark.skipif(ascon is None, reason="ascon module not installed"),
-        ),
+        "cs-mlkem512-ascon128-mldsa44",
     ],
 )
 def test_round_trip_alternative_aeads(suite_id):
@@ -122,6 +114,26 @@ def test_round_trip_alternative_aeads(suite_id):
     assert receiver.decrypt(wire) == b"alt-aead"
 
 
+@pytest.mark.parametrize("aead_token", ["aesgcm", "ascon128"])
+def test_warm_up_leaves_sequence_and_replay_state_untouched(aead_token):
+    """Rekey warms new pairs before publishing them; that must not burn seq 0."""
+    key = os.urandom(32)
+    ids = AeadIds(*header_ids_for_suite(get_suite("cs-mlkem768-aesgcm-mldsa65")))
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, b"\xCD" * 8, 0, key, aead_token=aead_token)
+    receiver = Receiver(
+        CONFIG["WIRE_VERSION"], ids, b"\xCD" * 8, 0, key, CONFIG["REPLAY_WINDOW"], strict_mode=True, aead_token=aead_token
+    )
+
+    sender.warm_up()
+    receiver.warm_up()
+
+    assert sender.seq == 0
+    wire = sender.encrypt(b"first")
+    assert receiver.decrypt(wire) == b"first"
+    with pytest.raises(ReplayError):
+        receiver.decrypt(wire)
+
+
 def test_tamper_header_flip():
     """Test that flipping header bit raises HeaderMismatch without attempting AEAD."""
     # Setup
@@ -292,3 +304,265 @@ def test_epoch_bump():
     
     # Verify sequence started fresh
     assert sender._seq == 1
+
+
+def test_encrypt_many_decrypt_many_round_trip():
+    """Batched encrypt reserves a contiguous range and matches single-packet framing."""
+    key = os.urandom(32)
+    session_id = b"\xAA" * 8
+
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+
+    sender = Sender(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=session_id,
+        epoch=0,
+        key_send=key
+    )
+    receiver = Receiver(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=session_id,
+        epoch=0,
+        key_recv=key,
+        window=CONFIG["REPLAY_WINDOW"],
+    )
+
+    first = sender.encrypt(b"single")
+    payloads = [b"", b"A" * 64, "not-bytes", b"B" * 1024]
+    batch = sender.encrypt_many(payloads)
+
+    assert batch.first_seq == 1
+    assert sender.seq == 5  # failed packet still consumes its sequence number
+    assert batch.errors == [None, None, "type", None]
+    assert batch.ok_count == 3
+
+    wires = [first] + [wire for wire in batch.outputs if wire is not None]
+    decrypted = receiver.decrypt_many(wires)
+    assert decrypted.errors == [None, None, None, None]
+    assert decrypted.outputs == [b"single", b"", b"A" * 64, b"B" * 1024]
+
+    # Sequential decrypt of a batch-produced wire must also work
+    late = sender.encrypt_many([b"late"])
+    assert receiver.decrypt(late.outputs[0]) == b"late"
+
+
+def test_decrypt_many_reports_per_packet_reasons():
+    """decrypt_many never raises and classifies each rejected packet."""
+    key = os.urandom(32)
+    session_id = b"\xAA" * 8
+
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+
+    sender = Sender(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=session_id,
+        epoch=0,
+        key_send=key
+    )
+    other_session = Sender(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=b"\xBB" * 8,
+        epoch=0,
+        key_send=key
+    )
+    receiver = Receiver(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=session_id,
+        epoch=0,
+        key_recv=key,
+        window=CONFIG["REPLAY_WINDOW"],
+        strict_mode=True
+    )
+
+    good = sender.encrypt(b"ok")
+    tampered = bytearray(sender.encrypt(b"tampered"))
+    tampered[HEADER_LEN + 1] ^= 0x01
+    bad_header = bytearray(sender.encrypt(b"header"))
+    bad_header[1] ^= 0x01
+
+    result = receiver.decrypt_many(
+        [good, good, bytes(tampered), bytes(bad_header), other_session.encrypt(b"x"), b"short"]
+    )
+    assert result.outputs[0] == b"ok"
+    assert result.errors == [None, "replay", "auth", "header", "session", "header"]
+    assert receiver.last_error_reason() == "header"
+
+
+def test_try_decrypt_returns_status_codes_without_raising():
+    """try_decrypt classifies like decrypt_many and never raises, even in strict mode."""
+    from core.aead import (
+        DECRYPT_AUTH, DECRYPT_HEADER, DECRYPT_OK, DECRYPT_REASONS, DECRYPT_REPLAY, DECRYPT_SESSION,
+    )
+
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = b"\xAA" * 8
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key)
+    other_session = Sender(CONFIG["WIRE_VERSION"], ids, b"\xBB" * 8, 0, key)
+    other_epoch = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 1, key)
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64, strict_mode=True)
+
+    good = sender.encrypt(b"ok")
+    tampered = bytearray(sender.encrypt(b"tampered"))
+    tampered[HEADER_LEN + 1] ^= 0x01
+    bad_header = bytearray(sender.encrypt(b"header"))
+    bad_header[1] ^= 0x01
+    no_tag = sender.encrypt(b"")[:HEADER_LEN + 4]
+
+    assert receiver.try_decrypt(memoryview(good)) == (DECRYPT_OK, b"ok")
+    assert receiver.last_error_reason() is None
+    cases = [
+        (good, DECRYPT_REPLAY),
+        (bytes(tampered), DECRYPT_AUTH),
+        (bytes(bad_header), DECRYPT_HEADER),
+        (other_session.encrypt(b"x"), DECRYPT_SESSION),
+        (other_epoch.encrypt(b"x"), DECRYPT_SESSION),
+        (b"short", DECRYPT_HEADER),
+        (no_tag, DECRYPT_AUTH),
+    ]
+    for wire, expected in cases:
+        assert receiver.try_decrypt(wire) == (expected, None)
+        assert receiver.last_error_reason() == DECRYPT_REASONS[expected]
+
+    # A packet too short to carry a tag does not consume its sequence number.
+    seq = int.from_bytes(no_tag[13:21], "big")
+    assert receiver.check_replay_many([seq]) == [True]
+
+
+@pytest.mark.parametrize("entry", ["decrypt", "decrypt_many", "try_decrypt"])
+def test_forged_packet_does_not_burn_sequence(entry):
+    """Every decrypt entry point checks freshness, authenticates, then records seq."""
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = b"\xAA" * 8
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key)
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64)
+
+    genuine = sender.encrypt(b"genuine")
+    forged = bytearray(genuine)
+    forged[-1] ^= 0x01
+    decrypt = {
+        "decrypt": receiver.decrypt,
+        "decrypt_many": lambda wire: receiver.decrypt_many([wire]).outputs[0],
+        "try_decrypt": lambda wire: receiver.try_decrypt(wire)[1],
+    }[entry]
+
+    assert decrypt(bytes(forged)) is None
+    assert receiver.last_error_reason() == "auth"
+    assert decrypt(genuine) == b"genuine"
+    assert decrypt(genuine) is None
+    assert receiver.last_error_reason() == "replay"
+
+
+def test_screen_sheds_without_touching_state():
+    """screen classifies from the header alone; forged packets never move the replay window."""
+    from core.aead import (
+        DECRYPT_AUTH, DECRYPT_HEADER, DECRYPT_OK, DECRYPT_REPLAY, DECRYPT_SEQ, DECRYPT_SESSION,
+    )
+
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = b"\xAA" * 8
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key)
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64)
+
+    first = sender.encrypt(b"first")
+    assert receiver.screen(first, 100) == DECRYPT_OK
+    assert receiver.try_decrypt(first)[0] == DECRYPT_OK
+    assert receiver.screen(first, 100) == DECRYPT_REPLAY
+    assert receiver.screen(b"short", 100) == DECRYPT_HEADER
+    assert receiver.screen(Sender(CONFIG["WIRE_VERSION"], ids, b"\xBB" * 8, 0, key).encrypt(b"x"), 100) == DECRYPT_SESSION
+    assert receiver.screen(sender.encrypt(b"")[:HEADER_LEN + 4], 100) == DECRYPT_AUTH
+
+    sender._seq = 500
+    far = sender.encrypt(b"far")
+    assert receiver.screen(far, 100) == DECRYPT_SEQ
+    assert receiver.screen(far, 1000) == DECRYPT_OK
+
+    # A forged far-ahead packet fails authentication and leaves the window alone,
+    # so the genuine packet right after the last accepted one is still fresh.
+    forged = bytearray(far)
+    forged[-1] ^= 0x01
+    assert receiver.try_decrypt(bytes(forged)) == (DECRYPT_AUTH, None)
+    sender._seq = 1
+    assert receiver.try_decrypt(sender.encrypt(b"next")) == (DECRYPT_OK, b"next")
+
+
+def test_preauth_filter_probes_far_ahead_sender():
+    """Every probe_every-th far-ahead packet is passed on so a genuine jump can resync."""
+    from core.aead import DECRYPT_OK, DECRYPT_REPLAY, DECRYPT_SEQ, PreAuthFilter
+
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = b"\xAA" * 8
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key)
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64)
+    preauth = PreAuthFilter(max_seq_ahead=16, probe_every=4)
+
+    first = sender.encrypt(b"first")
+    assert preauth.check(receiver, first) == DECRYPT_OK
+    receiver.try_decrypt(first)
+
+    sender._seq = 10_000  # e.g. the sender kept counting through a long outage
+    burst = sender.encrypt_many([b"a", b"b", b"c", b"d", b"e"]).outputs
+    statuses = preauth.check_many(receiver, burst + [first])
+    assert statuses == [DECRYPT_SEQ] * 3 + [DECRYPT_OK, DECRYPT_SEQ, DECRYPT_REPLAY]
+
+    # The probe authenticates and moves the window; the rest of the burst is now plausible.
+    assert receiver.try_decrypt(burst[3]) == (DECRYPT_OK, b"d")
+    assert preauth.check(receiver, burst[4]) == DECRYPT_OK
+
+    with pytest.raises(NotImplementedError):
+        PreAuthFilter(probe_every=0)
+
+
+def test_encrypt_many_overflow_rejects_whole_batch():
+    """A batch that cannot fit in the remaining sequence space is refused."""
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    sender = Sender(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=b"\xAA" * 8,
+        epoch=0,
+        key_send=os.urandom(32),
+        _seq=2**64 - 2,
+    )
+
+    with pytest.raises(SequenceOverflow):
+        sender.encrypt_many([b"a", b"b", b"c"])
+    assert sender.seq == 2**64 - 2
+
+    batch = sender.encrypt_many([b"a", b"b"])
+    assert batch.errors == [None, None]
+
+
+def test_decrypt_accepts_memoryview_from_receive_buffer():
+    """Wire and plaintext may be memoryviews into a reused receive buffer."""
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = b"\xAB" * 8
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key)
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64)
+
+    slot = bytearray(2048)
+    slot[0] = 0x01
+    slot[1:6] = b"hello"
+    wire = sender.encrypt(memoryview(slot)[:6])
+
+    slot[: len(wire)] = wire
+    assert receiver.decrypt(memoryview(slot)[: len(wire)]) == b"\x01hello"
+    assert receiver.decrypt(memoryview(slot)[: len(wire)]) is None
+    assert receiver.last_error_reason() == "replay"
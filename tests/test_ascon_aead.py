@@ -0,0 +1,145 @@
+"""Known-answer and cross-check tests for the in-tree ASCON engine."""
+
+import os
+import random
+
+import pytest
+
+pytest.importorskip("cryptography.hazmat.primitives.ciphers.aead")
+
+from cryptography.exceptions import InvalidTag
+
+import pyascon
+from core.aead import AeadIds, Receiver, Sender
+from core.ascon_aead import (
+    ASCON_128,
+    ASCON_AEAD128,
+    ascon_cipher,
+    ascon_decrypt,
+    ascon_encrypt,
+    native_available,
+)
+from core.config import CONFIG
+from core.suites import get_suite, header_ids_for_suite
+
+BACKENDS = ["python"] + (["native"] if native_available() else [])
+
+# NIST LWC KAT layout: Key = Nonce = 00..0F, PT = 00 01 .. (n-1), AD = 00 01 .. (m-1);
+# Count = 1 + 33 * len(PT) + len(AD). "Ascon-128" entries come from the v1.2 KAT
+# (LWC_AEAD_KAT_128_128, ascon128v12); "Ascon-AEAD128" from the SP 800-232 KAT.
+KAT = [
+    (ASCON_128, 1, 0, 0, "E355159F292911F794CB1432A0103A8A"),
+    (ASCON_128, 2, 0, 1, "944DF887CD4901614C5DEDBC42FC0DA0"),
+    (ASCON_128, 17, 0, 16, "EF5763E75FE32F96D7863410FF0B4786"),
+    (ASCON_128, 34, 1, 0, "BC18C3F4E39ECA7222490D967C79BFFC92"),
+    (ASCON_128, 273, 8, 8, "69FFEE6F5505A489E897E5F141B2E4A2DAD326085A79408A"),
+    (
+        ASCON_128,
+        1089,
+        32,
+        32,
+        "B96C78651B6246B0C3B1A5D373B0D5168DCA4A96734CF0DDF5F92F8D15E30270279BF6A6CC3F2FC9350B915C292BDB8D",
+    ),
+    (ASCON_AEAD128, 1, 0, 0, "4427D64B8E1E1451FC445960F0839BB0"),
+    (ASCON_AEAD128, 2, 0, 1, "103AB79D913A0321287715A979BB8585"),
+    (ASCON_AEAD128, 17, 0, 16, "B747D3235E971C20D00DCF87406938FD"),
+    (ASCON_AEAD128, 34, 1, 0, "E79F58F1F541FC51B5D438F8E1DD03F147"),
+    (ASCON_AEAD128, 273, 8, 8, "108640BD71345C6E37294FAC4BDDCAD22EE5E7178D20132C"),
+    (
+        ASCON_AEAD128,
+        1089,
+        32,
+        32,
+        "4C086D27A3B51A2333CFC7F22172A9BCAD88B8D4D77E50622D788345FA7BEE4468915D3F9422289F2349D6A3B4160397",
+    ),
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(
+    "variant,count,pt_len,ad_len,expected",
+    KAT,
+    ids=[f"{variant}-count{count}" for variant, count, *_ in KAT],
+)
+def test_known_answer_vectors(backend, variant, count, pt_len, ad_len, expected):
+    key = nonce = bytes(range(16))
+    plaintext = bytes(range(pt_len))
+    aad = bytes(range(ad_len))
+
+    ciphertext = ascon_encrypt(key, nonce, aad, plaintext, variant, backend)
+
+    assert ciphertext.hex().upper() == expected
+    assert ascon_decrypt(key, nonce, aad, ciphertext, variant, backend) == plaintext
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_matches_reference_implementations(backend):
+    legacy = pytest.importorskip("ascon") if backend == "python" else None
+    rng = random.Random(0xA5C0)
+    for _ in range(60):
+        key, nonce = os.urandom(16), os.urandom(16)
+        aad = os.urandom(rng.randrange(0, 48))
+        plaintext = os.urandom(rng.randrange(0, 80))
+
+        expected = pyascon.ascon_encrypt(key, nonce, aad, plaintext)
+        assert ascon_encrypt(key, nonce, aad, plaintext, ASCON_AEAD128, backend) == expected
+        if legacy is not None:
+            expected_v12 = legacy.encrypt(key, nonce, aad, plaintext)
+            assert ascon_encrypt(key, nonce, aad, plaintext, ASCON_128, backend) == expected_v12
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("variant", [ASCON_128, ASCON_AEAD128])
+def test_tampering_and_buffer_inputs(backend, variant):
+    cipher = ascon_cipher(os.urandom(16), variant, backend)
+    nonce = bytearray(os.urandom(16))
+    aad = os.urandom(22)
+    plaintext = os.urandom(45)
+    ciphertext = cipher.encrypt(nonce, memoryview(plaintext), aad)
+
+    assert cipher.decrypt(nonce, memoryview(ciphertext), bytearray(aad)) == plaintext
+    for index in (0, len(plaintext) - 1, len(ciphertext) - 1):
+        forged = bytearray(ciphertext)
+        forged[index] ^= 0x01
+        with pytest.raises(InvalidTag):
+            cipher.decrypt(nonce, bytes(forged), aad)
+    with pytest.raises(InvalidTag):
+        cipher.decrypt(nonce, ciphertext, aad[:-1])
+    with pytest.raises(InvalidTag):
+        cipher.decrypt(nonce, ciphertext[:15], aad)
+
+
+def test_invalid_parameters_and_backends():
+    with pytest.raises(NotImplementedError):
+        ascon_cipher(b"\x00" * 15)
+    with pytest.raises(NotImplementedError):
+        ascon_cipher(b"\x00" * 16, "Ascon-80pq")
+    with pytest.raises(NotImplementedError):
+        ascon_cipher(b"\x00" * 16, backend="rust")
+    with pytest.raises(NotImplementedError):
+        ascon_cipher(b"\x00" * 16).encrypt(b"\x00" * 12, b"", b"")
+    if not native_available():
+        with pytest.raises(NotImplementedError):
+            ascon_cipher(b"\x00" * 16, backend="native")
+    assert ascon_cipher(b"\x00" * 16, backend="auto").backend == ("native" if native_available() else "python")
+
+
+@pytest.mark.parametrize("variant", [ASCON_128, ASCON_AEAD128])
+def test_ascon_suite_framing_follows_configured_variant(monkeypatch, variant):
+    suite = get_suite("cs-mlkem512-ascon128-mldsa44")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    key = os.urandom(32)
+    session_id = b"\xCC" * 8
+
+    monkeypatch.setitem(CONFIG, "ASCON_VARIANT", variant)
+    sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, aead_token="ascon128")
+    receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64, aead_token="ascon128")
+    wire = sender.encrypt(b"telemetry")
+    assert receiver.decrypt(wire) == b"telemetry"
+
+    # A peer configured for the other variant cannot authenticate the packet.
+    other = ASCON_AEAD128 if variant == ASCON_128 else ASCON_128
+    monkeypatch.setitem(CONFIG, "ASCON_VARIANT", other)
+    mismatched = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, 0, key, 64, aead_token="ascon128")
+    assert mismatched.decrypt(wire) is None
+    assert mismatched.last_error_reason() == "auth"
@@ -4,6 +4,7 @@ from core.policy_engine import (
     create_control_state,
     handle_control,
     record_rekey_result,
+    request_prefetch,
     request_prepare,
 )
 
@@ -73,3 +74,53 @@ def test_drone_prepare_fail_when_guard_blocks():
     result = handle_control(msg, "drone", state)
     assert result.send and result.send[0]["type"] == "prepare_fail"
     assert state.state == "RUNNING"
+
+
+def test_enqueue_fires_wakeup_hook():
+    state = create_control_state("gcs", "cs-kyber768-aesgcm-dilithium3")
+    wakeups = []
+    state.wakeup = lambda: wakeups.append(state.outbox.qsize())
+    request_prepare(state, "cs-kyber512-aesgcm-dilithium2")
+    # Hook runs after the payload is visible on the outbox.
+    assert wakeups == [1]
+
+
+def test_prefetch_hint_is_advisory_on_both_sides():
+    gcs = create_control_state("gcs", "cs-kyber768-aesgcm-dilithium3")
+    local = []
+    gcs.on_prefetch = local.append
+    rid = request_prepare(gcs, "cs-kyber512-aesgcm-dilithium2")
+    request_prefetch(gcs, "cs-kyber1024-aesgcm-dilithium5")
+    queued = _drain_outbox(gcs)
+    assert [msg["type"] for msg in queued] == ["prepare_rekey", "prefetch_hint"]
+    assert local == ["cs-kyber1024-aesgcm-dilithium5"]
+    assert gcs.state == "NEGOTIATING" and gcs.active_rid == rid
+
+    drone = create_control_state("drone", "cs-kyber768-aesgcm-dilithium3")
+    result = handle_control(queued[1], "drone", drone)
+    assert result.prefetch == "cs-mlkem1024-aesgcm-mldsa87"  # resolved to the canonical suite_id
+    assert not result.send and result.start_handshake is None
+    assert drone.state == "RUNNING"
+    assert drone.stats["prefetch_received"] == 1
+
+    bad = handle_control({"type": "prefetch_hint", "suite": 7}, "gcs", gcs)
+    assert bad.prefetch is None and bad.notes == ["invalid_prefetch"]
+
+
+def test_prefetch_hint_for_unknown_suite_is_ignored():
+    # A peer with a newer suite list may name a suite this side does not know.
+    gcs = create_control_state("gcs", "cs-kyber768-aesgcm-dilithium3")
+    result = handle_control({"type": "prefetch_hint", "suite": "cs-not-a-real-suite"}, "gcs", gcs)
+    assert result.prefetch is None and result.notes == ["invalid_prefetch"]
+    assert gcs.stats["prefetch_received"] == 0
+    assert gcs.state == "RUNNING"
+
+
+def test_rekey_result_hook_sees_every_outcome():
+    state = create_control_state("gcs", "cs-kyber768-aesgcm-dilithium3")
+    seen = []
+    state.on_rekey_result = seen.append
+    record_rekey_result(state, "aa", "cs-kyber512-aesgcm-dilithium2", success=True)
+    record_rekey_result(state, "bb", "cs-kyber512-aesgcm-dilithium2", success=False)
+    assert [(msg["rid"], msg["result"]) for msg in seen] == [("aa", "ok"), ("bb", "fail")]
+    assert seen == _drain_outbox(state)
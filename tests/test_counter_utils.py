@@ -25,6 +25,7 @@ def test_load_proxy_counters_success(tmp_path: Path) -> None:
             "rekeys_ok": 2,
             "rekeys_fail": 0,
             "last_rekey_suite": "cs-kyber1024-aesgcm-dilithium5",
+            "last_rekey_swap_ns": 1_250,
             "primitive_metrics": {
                 "aead_encrypt": {
                     "count": 4,
@@ -89,6 +90,7 @@ def test_load_proxy_counters_success(tmp_path: Path) -> None:
     assert result.rekeys_ok == 2
     assert result.rekeys_fail == 0
     assert result.last_rekey_suite == "cs-kyber1024-aesgcm-dilithium5"
+    assert result.last_rekey_swap_ns == 1_250
     assert result.ts_stop_ns == 42
     assert result.path == file_path
     assert result.handshake_metrics == {}
@@ -168,3 +170,29 @@ def test_missing_proxy_file_raises(tmp_path: Path) -> None:
     missing_path = tmp_path / "missing.json"
     with pytest.raises(FileNotFoundError):
         load_proxy_counters(missing_path)
+
+
+def test_proxy_counters_latency_percentiles(tmp_path: Path) -> None:
+    from core.latency_histogram import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1_000)
+    payload = {
+        "role": "drone",
+        "suite": "cs-mlkem768-aesgcm-mldsa65",
+        "counters": {"latency_histograms": {"aead_encrypt": histogram.to_dict(), "bogus": []}},
+    }
+    file_path = tmp_path / "proxy_hist.json"
+    _write_json(file_path, payload)
+
+    result = load_proxy_counters(file_path)
+    assert set(result.latency_histograms) == {"aead_encrypt"}
+    assert result.p50_ns("aead_encrypt") == histogram.p50
+    assert result.p90_ns("aead_encrypt") == histogram.p90
+    assert result.p99_ns("aead_encrypt") == histogram.p99
+    assert result.p999_ns("aead_encrypt") == histogram.p999
+    assert 500_000 <= result.p50_ns("aead_encrypt") <= 532_000
+    assert result.latency_percentiles("aead_encrypt")["p99_ns"] == histogram.p99
+    assert result.p99_ns("aead_decrypt_ok") is None
+    assert result.latency_percentiles("aead_decrypt_ok") == {}
@@ -47,7 +47,18 @@ class TestEndToEndProxy:
         # This matches our updated handshake security requirements
         return gcs_sig_public, sig
     
-    def test_bidirectional_plaintext_forwarding(self, suite, gcs_keypair):
+    @pytest.mark.parametrize(
+        "mode_overrides",
+        [
+            {},
+            {"UDP_BATCH_ENABLED": True},
+            {"SHARDED_DATA_PLANE": True},
+            {"PROXY_ENGINE": "asyncio"},
+            {"INSTRUMENTATION_LEVEL": "off"},
+        ],
+        ids=["single", "batched", "sharded", "asyncio", "untimed"],
+    )
+    def test_bidirectional_plaintext_forwarding(self, suite, gcs_keypair, mode_overrides):
         """Test happy path: bidirectional UDP forwarding through encrypted tunnel."""
         gcs_sig_public, gcs_sig_object = gcs_keypair
         
@@ -74,6 +85,7 @@ class TestEndToEndProxy:
             "DRONE_PLAINTEXT_HOST": "127.0.0.1",
             "GCS_PLAINTEXT_HOST": "127.0.0.1",
         })
+        test_config.update(mode_overrides)
         
         # Storage for proxy results
         gcs_counters = None
@@ -203,6 +215,12 @@ class TestEndToEndProxy:
         # Basic sanity on counters (at least one packet each direction was processed)
         assert gcs_counters["enc_in"] >= 1
         assert drone_counters["enc_in"] >= 1
+        if mode_overrides.get("INSTRUMENTATION_LEVEL") == "off":
+            assert drone_counters["instrumentation"] == "off"
+            assert drone_counters["primitive_metrics"]["aead_decrypt_ok"]["count"] == 0
+            assert drone_counters["latency_histograms"]["aead_encrypt"]["count"] == 0
+        else:
+            assert drone_counters["primitive_metrics"]["aead_decrypt_ok"]["count"] >= 1
     
     def test_tampered_packet_dropped(self, suite, gcs_keypair):
         """Test that tampered encrypted packets are dropped."""
@@ -305,4 +323,112 @@ class TestEndToEndProxy:
                 cfg=CONFIG,
                 gcs_sig_public=None,  # Missing public key
                 stop_after_seconds=0.1
-            )
\ No newline at end of file
+            )
+
+def test_recv_ring_reuses_buffers_and_frames_prefix():
+    """Receive ring hands out views over preallocated slots, with in-place prefix."""
+    from core.async_proxy import _RecvRing
+
+    ring = _RecvRing(2, size=64, headroom=1)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as rx, socket.socket(
+        socket.AF_INET, socket.SOCK_DGRAM
+    ) as tx:
+        rx.bind((DEFAULT_HOST, 0))
+        rx.settimeout(2.0)
+        for payload in (b"one", b"two", b"three"):
+            tx.sendto(payload, rx.getsockname())
+
+        first, addr = ring.recv(rx, 0x01)
+        assert bytes(first) == b"\x01one"
+        assert addr[0] == DEFAULT_HOST
+        second, _ = ring.recv(rx)
+        assert bytes(second) == b"two"
+        third, _ = ring.recv(rx, 0x01)
+        # Third receive wraps around and reuses the first slot.
+        assert bytes(third) == b"\x01three"
+        assert first.obj is third.obj
+
+
+def test_proxy_counters_merge_combines_worker_snapshots():
+    """Sharded workers report separate counters; merge must sum and combine stats."""
+    from core.async_proxy import ProxyCounters
+
+    parent = ProxyCounters()
+    parent.rekeys_ok = 1
+    parent.last_rekey_ms = 50
+    parent.last_rekey_suite = "cs-mlkem768-aesgcm-mldsa65"
+    parent.last_rekey_swap_ns = 900
+    parent.handshake_metrics = {"handshake_total_ns": 10}
+
+    uplink = ProxyCounters()
+    uplink.ptx_in = uplink.enc_out = 3
+    uplink.record_encrypt(400, 10, 48)
+    uplink.record_encrypt(200, 10, 48)
+
+    downlink = ProxyCounters()
+    downlink.enc_in = 4
+    downlink.ptx_out = 3
+    downlink.drops = downlink.drop_replay = 1
+    downlink.record_decrypt_ok(300, 48, 10)
+
+    total = ProxyCounters()
+    for snapshot in (parent, uplink, downlink):
+        total.merge(snapshot)
+    merged = total.to_dict()
+
+    assert (merged["ptx_in"], merged["enc_out"], merged["enc_in"], merged["ptx_out"]) == (3, 3, 4, 3)
+    assert merged["drops"] == merged["drop_replay"] == 1
+    assert merged["rekeys_ok"] == 1
+    assert merged["last_rekey_suite"] == "cs-mlkem768-aesgcm-mldsa65"
+    assert merged["last_rekey_swap_ns"] == 900
+    encrypt = merged["primitive_metrics"]["aead_encrypt"]
+    assert (encrypt["count"], encrypt["min_ns"], encrypt["max_ns"], encrypt["total_ns"]) == (2, 200, 400, 600)
+    assert merged["primitive_metrics"]["aead_decrypt_ok"]["count"] == 1
+    assert merged["latency_histograms"]["aead_encrypt"]["count"] == 2
+    assert merged["latency_histograms"]["aead_encrypt"]["p99_ns"] >= 400
+
+
+def test_proxy_counters_snapshot_is_consistent_under_concurrent_writer():
+    """The lock-free writer must never expose a half-applied drop to snapshot()."""
+    from core.async_proxy import ProxyCounters
+
+    counters = ProxyCounters()
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            counters.count("enc_in")
+            counters.record_decrypt_fail(100, 48, "drop_auth")
+            counters.drop("drop_replay", 2)
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        deadline = time.monotonic() + 0.5
+        snapshots = 0
+        while time.monotonic() < deadline:
+            snap = counters.snapshot()
+            assert snap.drops == snap.drop_auth + snap.drop_replay
+            assert snap.primitive_metrics["aead_decrypt_fail"]["count"] == snap.drop_auth
+            assert snap.latency_histograms["drop_auth"].total_count == snap.drop_auth
+            snapshots += 1
+    finally:
+        stop.set()
+        thread.join(timeout=1.0)
+
+    final = counters.snapshot().to_dict()
+    assert snapshots > 0
+    assert final["drops"] == final["drop_auth"] + final["drop_replay"] > 0
+
+
+def test_timing_sampler_levels():
+    from itertools import islice
+
+    from core.async_proxy import _timing_sampler
+
+    assert not any(islice(_timing_sampler("off"), 100))
+    assert all(islice(_timing_sampler("full"), 100))
+    sampled = list(islice(_timing_sampler("sampled", 8), 64))
+    assert sum(sampled) == 8
+    assert sampled[0] and sampled[8] and not any(sampled[1:8])
+    assert all(islice(_timing_sampler("sampled", 1), 10))
@@ -0,0 +1,60 @@
+"""Tests for the recv_into/sendmsg handshake framing helper."""
+
+import os
+import socket
+import threading
+
+import pytest
+
+from core.handshake_framing import FrameIO
+
+
+@pytest.fixture
+def sock_pair():
+    left, right = socket.socketpair()
+    left.settimeout(5.0)
+    right.settimeout(5.0)
+    yield left, right
+    left.close()
+    right.close()
+
+
+def test_frame_with_trailer_round_trip(sock_pair):
+    left, right = sock_pair
+    body = os.urandom(1_357_824)  # Classic-McEliece-8192128 public key size
+    tag = os.urandom(32)
+
+    # The body exceeds the socket buffers, so send from a thread while reading.
+    sender = FrameIO(left)
+    thread = threading.Thread(target=sender.send_frame, args=(body, tag))
+    thread.start()
+    receiver = FrameIO(right)
+    received = receiver.recv_frame("ciphertext", trailer=len(tag))
+    thread.join(timeout=5.0)
+
+    assert bytes(received[:-32]) == body
+    assert bytes(received[-32:]) == tag
+    assert sender.metrics()["bytes_sent"] == 4 + len(body) + len(tag)
+    assert receiver.metrics()["bytes_recv"] == 4 + len(body) + len(tag)
+    assert receiver.metrics()["recv_calls"] >= 2
+
+
+def test_send_parts_skips_empty_buffers(sock_pair):
+    left, right = sock_pair
+    FrameIO(left).send_frame(b"", b"tail")
+    assert bytes(FrameIO(right).recv_frame("hello", trailer=4)) == b"tail"
+
+
+def test_peer_close_raises_configured_error(sock_pair):
+    left, right = sock_pair
+    left.sendall(b"\x00")
+    left.close()
+    with pytest.raises(NotImplementedError, match="Connection closed reading hello length"):
+        FrameIO(right, error=NotImplementedError).recv_frame("hello")
+
+
+def test_oversized_frame_rejected(sock_pair):
+    left, right = sock_pair
+    left.sendall((1 << 30).to_bytes(4, "big"))
+    with pytest.raises(ConnectionError, match="exceeds"):
+        FrameIO(right).recv_frame("ciphertext")
@@ -0,0 +1,99 @@
+"""Tests for the persistent GCS handshake listener and drone connector."""
+
+import socket
+import time
+
+import pytest
+
+from core.handshake_listener import HandshakeConnector, HandshakeListener
+
+
+class _DenyAfter:
+    def __init__(self, allowed: int) -> None:
+        self.remaining = allowed
+
+    def allow(self, ip: str) -> bool:
+        self.remaining -= 1
+        return self.remaining >= 0
+
+
+@pytest.fixture
+def listener():
+    lst = HandshakeListener(("127.0.0.1", 0), ["127.0.0.1"])
+    yield lst
+    lst.close()
+
+
+def test_listener_queues_connections_across_handshakes(listener):
+    for _ in range(3):
+        with socket.create_connection(listener.address) as client:
+            conn, addr, queued_at = listener.accept(timeout=1.0)
+            try:
+                assert addr[0] == "127.0.0.1"
+                assert queued_at <= time.monotonic()
+                conn.sendall(b"hi")
+                assert client.recv(2) == b"hi"
+            finally:
+                conn.close()
+
+
+def test_listener_accept_times_out(listener):
+    with pytest.raises(socket.timeout):
+        listener.accept(timeout=0.05)
+
+
+def test_listener_drops_unlisted_ip_and_rate_limited_peers():
+    with HandshakeListener(("127.0.0.1", 0), ["127.0.0.2"]) as lst:
+        with socket.create_connection(lst.address) as client:
+            client.settimeout(1.0)
+            assert client.recv(1) == b""
+        with pytest.raises(socket.timeout):
+            lst.accept(timeout=0.1)
+
+    with HandshakeListener(("127.0.0.1", 0), ["127.0.0.1"], _DenyAfter(1)) as lst:
+        first = socket.create_connection(lst.address)
+        second = socket.create_connection(lst.address)
+        try:
+            second.settimeout(1.0)
+            assert second.recv(1) == b"\x00"
+            conn, _addr, _queued = lst.accept(timeout=1.0)
+            conn.close()
+        finally:
+            first.close()
+            second.close()
+
+
+def test_connector_reuses_preopened_connection(listener):
+    connector = HandshakeConnector(listener.address, preopen=True)
+    try:
+        connector.replenish()
+        spare_server, _addr, _queued = listener.accept(timeout=1.0)
+        deadline = time.monotonic() + 1.0
+        while connector._spare is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        client = connector.connect()
+        assert connector.reused == 1
+        spare_server.sendall(b"x")
+        assert client.recv(1) == b"x"
+        client.close()
+        spare_server.close()
+    finally:
+        connector.close()
+
+
+def test_connector_replaces_spare_closed_by_peer(listener):
+    connector = HandshakeConnector(listener.address, preopen=True)
+    try:
+        connector.replenish()
+        spare_server, _addr, _queued = listener.accept(timeout=1.0)
+        spare_server.close()
+        time.sleep(0.05)
+
+        client = connector.connect()
+        assert connector.reused == 0
+        fresh_server, _addr, _queued = listener.accept(timeout=1.0)
+        fresh_server.close()
+        client.close()
+    finally:
+        connector.close()
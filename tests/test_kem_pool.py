@@ -0,0 +1,127 @@
+import time
+
+import pytest
+pytest.importorskip("oqs.oqs")
+pytest.importorskip("cryptography.hazmat.primitives.kdf.hkdf")
+from core.config import CONFIG, validate_config
+from core.handshake import (
+    build_server_hello,
+    client_encapsulate,
+    parse_and_verify_server_hello,
+    server_decapsulate,
+)
+from core.kem_pool import EphemeralKeyPool
+from oqs.oqs import Signature
+
+SUITE_ID = "cs-mlkem768-aesgcm-mldsa65"
+OTHER_SUITES = ("cs-mlkem512-aesgcm-mldsa44", "cs-mlkem1024-aesgcm-mldsa87")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _wait_ready(pool, suite_id, count, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while pool.ready(suite_id) < count:
+        assert time.monotonic() < deadline, f"pool never reached {count} keypairs for {suite_id}"
+        time.sleep(0.01)
+
+
+def test_pooled_keypair_completes_handshake_and_is_single_use():
+    pool = EphemeralKeyPool({"size": 2})
+    try:
+        pool.prefetch(SUITE_ID)
+        _wait_ready(pool, SUITE_ID, 2)
+        sig = Signature("ML-DSA-65")
+        pub = sig.generate_keypair()
+
+        wire, eph = build_server_hello(SUITE_ID, sig, key_pool=pool)
+        assert eph.metrics["primitives"]["kem"]["keygen_source"] == "pool"
+        assert eph.metrics["primitives"]["kem"]["keygen_ns"] > 0
+        hello = parse_and_verify_server_hello(wire, CONFIG["WIRE_VERSION"], pub)
+        ct, ss_c = client_encapsulate(hello)
+        assert server_decapsulate(eph, ct) == ss_c
+
+        wire2, _eph2 = build_server_hello(SUITE_ID, sig, key_pool=pool)
+        hello2 = parse_and_verify_server_hello(wire2, CONFIG["WIRE_VERSION"], pub)
+        assert hello2.kem_pub != hello.kem_pub
+        assert pool.stats()["hits"] == 2
+    finally:
+        pool.close()
+
+
+def test_cold_pool_falls_back_to_inline_keygen():
+    pool = EphemeralKeyPool({"size": 0})
+    try:
+        sig = Signature("ML-DSA-65")
+        sig.generate_keypair()
+        _wire, eph = build_server_hello(SUITE_ID, sig, key_pool=pool)
+        assert eph.metrics["primitives"]["kem"]["keygen_source"] == "inline"
+        assert pool.stats()["misses"] == 1
+        assert pool.ready(SUITE_ID) == 0
+    finally:
+        pool.close()
+
+
+def test_unknown_suite_is_a_pool_miss():
+    pool = EphemeralKeyPool({"size": 2})
+    try:
+        pool.prefetch("cs-not-a-real-suite")  # e.g. a hint from a peer with a newer suite list
+        assert pool.take("cs-not-a-real-suite") is None
+        assert pool.ready("cs-not-a-real-suite") == 0
+    finally:
+        pool.close()
+
+
+def test_expired_keypairs_are_evicted_not_used():
+    clock = FakeClock()
+    pool = EphemeralKeyPool({"size": 1, "max_age_s": 10.0}, clock=clock)
+    try:
+        pool.prefetch(SUITE_ID)
+        _wait_ready(pool, SUITE_ID, 1)
+        clock.now += 11.0
+        assert pool.take(SUITE_ID) is None
+        assert pool.stats()["evicted"] == 1
+        _wait_ready(pool, SUITE_ID, 1)
+        assert pool.take(SUITE_ID) is not None
+    finally:
+        pool.close()
+
+
+def test_per_suite_size_and_lru_suite_cap():
+    pool = EphemeralKeyPool({"size": 1, "max_suites": 2, "per_suite": {SUITE_ID: {"size": 3}}})
+    try:
+        pool.prefetch(SUITE_ID)
+        _wait_ready(pool, SUITE_ID, 3)
+        for suite_id in OTHER_SUITES:
+            pool.prefetch(suite_id)
+            _wait_ready(pool, suite_id, 1)
+        ready = pool.stats()["ready"]
+        assert SUITE_ID not in ready
+        assert ready == {OTHER_SUITES[0]: 1, OTHER_SUITES[1]: 1}
+    finally:
+        pool.close()
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        [],
+        {"size": -1},
+        {"max_suites": 0},
+        {"enabled": "yes"},
+        {"per_suite": {SUITE_ID: {"size": 1, "max_suites": 2}}},
+        {"per_suite": {SUITE_ID: {"max_age_s": -5}}},
+        {"ttl": 3},
+    ],
+)
+def test_kem_pool_config_validation(bad):
+    cfg = dict(CONFIG)
+    cfg["KEM_POOL"] = bad
+    with pytest.raises(NotImplementedError):
+        validate_config(cfg)
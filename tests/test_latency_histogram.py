@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from core.latency_histogram import LatencyHistogram
+
+
+def test_percentiles_within_relative_error() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 10_001):
+        histogram.record(value * 100)
+
+    assert histogram.total_count == 10_000
+    for percentile, exact in ((50.0, 500_000), (90.0, 900_000), (99.0, 990_000), (99.9, 999_000)):
+        reported = histogram.value_at_percentile(percentile)
+        assert reported >= exact
+        assert reported <= exact * 1.0625
+    assert histogram.p50 == histogram.value_at_percentile(50.0)
+    assert histogram.p999 == histogram.value_at_percentile(99.9)
+
+
+def test_small_values_are_exact_and_empty_histogram_reports_zero() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.p99 == 0
+    for value in (0, 3, 3, 7, 15):
+        histogram.record(value)
+    assert histogram.value_at_percentile(0.0) == 0
+    assert histogram.p50 == 3
+    assert histogram.value_at_percentile(100.0) == 15
+
+
+def test_tail_sample_is_visible_at_p999() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(998):
+        histogram.record(1_000)
+    for _ in range(2):
+        histogram.record(5_000_000)
+    # 0.2% slow samples: hidden at p99, visible at p999 and the max.
+    assert histogram.p99 < 1_100
+    assert histogram.p999 >= 5_000_000
+    assert histogram.value_at_percentile(100.0) >= 5_000_000
+
+
+def test_single_outlier_in_a_thousand_only_shows_at_max() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(999):
+        histogram.record(1_000)
+    histogram.record(5_000_000)
+    assert histogram.p999 < 1_100
+    assert histogram.value_at_percentile(100.0) >= 5_000_000
+
+
+def test_merge_and_json_round_trip() -> None:
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in (1_000, 2_000, 3_000):
+        first.record(value)
+    second.record(1_000_000)
+    first.merge(second)
+
+    payload = json.loads(json.dumps(first.to_dict()))
+    assert payload["count"] == 4
+    assert payload["p50_ns"] == first.p50
+    restored = LatencyHistogram.from_dict(payload)
+    assert restored is not None
+    assert restored.total_count == 4
+    assert list(restored.counts) == list(first.counts)
+    assert LatencyHistogram.from_dict({"sub_bucket_bits": 7, "buckets": []}) is None
+
+
+@pytest.mark.parametrize("value", [16, 17, 1_023, 1_024, 123_456_789])
+def test_copy_is_independent(value: int) -> None:
+    histogram = LatencyHistogram()
+    histogram.record(value)
+    clone = histogram.copy()
+    histogram.record(value)
+    assert clone.total_count == 1
+    assert clone.p50 >= value
@@ -0,0 +1,71 @@
+"""Tests for the queue-backed JSON logging helpers."""
+
+import json
+import logging
+import queue
+
+from core import logging_utils
+from core.logging_utils import JsonFormatter, RateLimitFilter, configure_file_logger, flush_logs, get_logger
+
+
+def _record(msg="Decrypt failed (classified)", level=logging.WARNING, **extra):
+    record = logging.makeLogRecord({"name": "pqc.test", "msg": msg, "levelno": level,
+                                    "levelname": logging.getLevelName(level)})
+    record.__dict__.update(extra)
+    return record
+
+
+def test_formatter_keeps_extras_and_stringifies_unserialisable_values():
+    marker = object()
+    payload = json.loads(JsonFormatter().format(_record(role="gcs", wire_len=7, peer=("1.2.3.4", 5), obj=marker)))
+    assert payload["msg"] == "Decrypt failed (classified)"
+    assert payload["level"] == "WARNING"
+    assert payload["role"] == "gcs"
+    assert payload["wire_len"] == 7
+    assert payload["peer"] == ["1.2.3.4", 5]
+    assert payload["obj"] == str(marker)
+    # Standard LogRecord attributes are not repeated as extras.
+    assert not {"args", "lineno", "levelno", "thread", "processName"} & payload.keys()
+
+
+def test_rate_limit_reports_suppressed_count(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(logging_utils.time, "monotonic", lambda: now[0])
+    limiter = RateLimitFilter(burst=3, window_s=1.0)
+
+    passed = [limiter.filter(_record()) for _ in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+    # Other messages and errors have their own budget.
+    assert limiter.filter(_record("Decrypt failed (other)"))
+    assert limiter.filter(_record(level=logging.ERROR))
+
+    now[0] += 1.0
+    record = _record()
+    assert limiter.filter(record)
+    assert record.suppressed == 7
+
+
+def test_queue_handler_drops_instead_of_blocking():
+    handler = logging_utils._NonBlockingQueueHandler(queue.Queue(1))
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))  # queue full: dropped, caller not blocked
+    assert handler.dropped == 1
+    assert handler.queue.get_nowait().getMessage() == "first"
+
+    handler.handle(_record("third"))
+    record = handler.queue.get_nowait()
+    assert record.getMessage() == "third" and record.log_dropped == 1
+    assert handler.dropped == 0
+
+
+def test_file_logger_writes_through_listener(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = get_logger("pqc.test_file_logger")
+    path = configure_file_logger("gcs", logger)
+    replacement = configure_file_logger("gcs", logger)  # replaces, never duplicates
+    logger.info("PQC handshake completed successfully", extra={"suite_id": "cs-mlkem768-aesgcm-mldsa65"})
+    flush_logs()
+
+    lines = [json.loads(line) for line in replacement.read_text(encoding="utf-8").splitlines()]
+    assert [line["suite_id"] for line in lines] == ["cs-mlkem768-aesgcm-mldsa65"]
+    assert path == replacement or not path.read_text(encoding="utf-8")
@@ -0,0 +1,159 @@
+"""Tests for the Unix-socket live metrics endpoint."""
+
+import json
+import socket
+import struct
+import time
+
+import pytest
+
+from core import metrics_endpoint
+from core.metrics_endpoint import MetricsEndpoint, MetricsSubscriber
+
+pytestmark = pytest.mark.skipif(not metrics_endpoint.supported(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    # AF_UNIX paths are length-limited, so keep the name short.
+    return tmp_path / "m.sock"
+
+
+def _sampler(calls):
+    def sample(topics):
+        calls.append(set(topics))
+        data = {}
+        if "counters" in topics:
+            data["counters"] = {"enc_out": len(calls), "rekeys_ok": 0}
+        if "histograms" in topics:
+            data["histograms"] = {"decrypt": {"count": 3, "p50_ns": 1200}}
+        return data
+
+    return sample
+
+
+def test_default_subscription_streams_every_topic(sock_path):
+    calls = []
+    endpoint = MetricsEndpoint(sock_path, _sampler(calls), interval_s=0.02)
+    try:
+        with MetricsSubscriber(sock_path, timeout=2.0) as subscriber:
+            topics = set()
+            seqs = []
+            while len(seqs) < 2:
+                message = subscriber.recv()
+                topics.add(message["topic"])
+                if message["topic"] == "counters":
+                    seqs.append(message["seq"])
+            assert topics == {"counters", "histograms"}
+            assert seqs[1] > seqs[0]
+
+            endpoint.publish_event({"status": "rekey_ok", "suite": "cs-mlkem768-aesgcm-mldsa65"})
+            event = next(m for m in iter(subscriber.recv, None) if m["topic"] == "events")
+            assert event["data"]["status"] == "rekey_ok"
+    finally:
+        endpoint.close()
+    assert not sock_path.exists()
+
+
+def test_subscription_selects_topics_and_rate(sock_path):
+    calls = []
+    endpoint = MetricsEndpoint(sock_path, _sampler(calls), interval_s=60.0)
+    try:
+        with MetricsSubscriber(sock_path, topics=["counters"], interval_s=0.01, timeout=2.0) as subscriber:
+            # Only counters are sampled and sent, at the subscriber's rate.
+            messages = [subscriber.recv() for _ in range(3)]
+            assert [m["topic"] for m in messages] == ["counters"] * 3
+            assert all(topics == {"counters"} for topics in calls[1:])
+
+            subscriber.subscribe(topics=["events"])
+            endpoint.publish_event({"status": "stopped"})
+            message = subscriber.recv()
+            while message["topic"] == "counters":  # sent before the resubscription landed
+                message = subscriber.recv()
+            assert message["data"] == {"status": "stopped"}
+    finally:
+        endpoint.close()
+
+
+def test_close_flushes_final_event_and_disconnects(sock_path):
+    endpoint = MetricsEndpoint(sock_path, _sampler([]), interval_s=60.0)
+    subscriber = MetricsSubscriber(sock_path, topics=["events"], timeout=2.0)
+    try:
+        deadline = time.monotonic() + 2.0
+        while endpoint.client_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        endpoint.publish_event({"status": "stopped", "suite": "cs-mlkem512-aesgcm-mldsa44"})
+        endpoint.close()
+        assert [m["data"]["status"] for m in subscriber] == ["stopped"]
+    finally:
+        subscriber.close()
+
+
+def test_stalled_subscriber_is_dropped(sock_path):
+    endpoint = MetricsEndpoint(sock_path, lambda topics: {"counters": {"pad": "x" * 4096}}, interval_s=0.01,
+                               send_timeout_s=0.05)
+    stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    stalled.connect(str(sock_path))
+    try:
+        # Never read: once the buffers fill up the endpoint gives up on this client
+        # and keeps serving others.
+        with MetricsSubscriber(sock_path, topics=["counters"], timeout=2.0) as live:
+            for _ in range(200):
+                live.recv()
+                if endpoint.client_count == 1:
+                    break
+            assert endpoint.client_count == 1
+            assert live.recv()["topic"] == "counters"
+    finally:
+        stalled.close()
+        endpoint.close()
+
+
+def test_stale_socket_path_is_replaced(sock_path):
+    sock_path.write_bytes(b"")  # left behind by a proxy that crashed
+    endpoint = MetricsEndpoint(sock_path, _sampler([]), interval_s=0.01)
+    try:
+        with MetricsSubscriber(sock_path, timeout=2.0) as subscriber:
+            assert subscriber.recv()["topic"] in ("counters", "histograms")
+    finally:
+        endpoint.close()
+
+
+def test_recv_timeout_mid_frame_keeps_stream_in_sync(sock_path):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen(1)
+    try:
+        with MetricsSubscriber(sock_path, timeout=2.0) as subscriber:
+            conn, _addr = server.accept()
+            with conn:
+                body = json.dumps({"topic": "events", "data": {"status": "rekey_ok"}}).encode()
+                frame = struct.pack("!I", len(body)) + body
+                conn.sendall(frame[:7])
+                assert subscriber.recv(timeout=0.05) is None
+                conn.sendall(frame[7:] + frame)
+                assert subscriber.recv(timeout=2.0)["data"]["status"] == "rekey_ok"
+                assert subscriber.recv(timeout=2.0)["data"]["status"] == "rekey_ok"
+    finally:
+        server.close()
+
+
+def test_partial_subscription_does_not_stall_other_clients(sock_path):
+    endpoint = MetricsEndpoint(sock_path, _sampler([]), interval_s=60.0, send_timeout_s=5.0)
+    slow = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    slow.connect(str(sock_path))
+    try:
+        slow.sendall(b"\0\0")  # half a length prefix, then nothing
+        with MetricsSubscriber(sock_path, topics=["events"], timeout=2.0) as live:
+            deadline = time.monotonic() + 2.0
+            while endpoint.client_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            started = time.monotonic()
+            endpoint.publish_event({"status": "rekey_ok"})
+            assert live.recv()["data"]["status"] == "rekey_ok"
+            assert time.monotonic() - started < 1.0
+            assert endpoint.client_count == 2
+    finally:
+        slow.close()
+        endpoint.close()
@@ -279,4 +279,125 @@ class TestRekeyEpoch:
         fields1 = struct.unpack(HEADER_STRUCT, hdr1)
         
         assert fields0[7] == 0  # epoch 0
-        assert fields1[7] == 1  # epoch 1
\ No newline at end of file
+        assert fields1[7] == 1  # epoch 1
+
+class TestGraceReceiver:
+    """Make-before-break rekey: the previous session stays readable briefly."""
+
+    @staticmethod
+    def _session(suite_id, epoch=0, session_id=None):
+        from core.aead import AeadIds
+        from core.config import CONFIG
+        from core.suites import header_ids_for_suite
+
+        ids = AeadIds(*header_ids_for_suite(get_suite(suite_id)))
+        session_id = session_id or os.urandom(8)
+        key = os.urandom(32)
+        aead = get_suite(suite_id)["aead_token"]
+        sender = Sender(CONFIG["WIRE_VERSION"], ids, session_id, epoch, key, aead_token=aead)
+        receiver = Receiver(CONFIG["WIRE_VERSION"], ids, session_id, epoch, key, 64, aead_token=aead)
+        return sender, receiver
+
+    def test_routes_by_session_until_packet_budget_spent(self):
+        from core.aead import GraceReceiver, chain_receiver
+
+        old_tx, old_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        new_tx, new_rx = self._session("cs-mlkem768-chacha20poly1305-mldsa65")
+        receiver = chain_receiver(new_rx, old_rx, grace_seconds=60.0, grace_packets=2)
+        assert isinstance(receiver, GraceReceiver)
+        assert receiver.session_id == new_rx.session_id
+
+        in_flight = [old_tx.encrypt(b"old-%d" % i) for i in range(3)]
+        assert receiver.decrypt(new_tx.encrypt(b"new")) == b"new"
+        assert receiver.from_previous_session is False
+        assert receiver.decrypt(in_flight[0]) == b"old-0"
+        assert receiver.from_previous_session is True
+        # Replays of the old session are still rejected by its own window.
+        assert receiver.decrypt(in_flight[0]) is None
+        assert receiver.last_error_reason() == "replay"
+        assert receiver.decrypt(in_flight[1]) == b"old-1"
+        # Budget of two accepted packets is spent: the old session is released.
+        assert receiver.decrypt(in_flight[2]) is None
+        assert receiver.last_error_reason() == "session"
+        assert receiver.previous is None
+        assert receiver.previous_accepted == 2
+
+    def test_try_decrypt_routes_like_decrypt(self):
+        from core.aead import DECRYPT_OK, DECRYPT_REPLAY, DECRYPT_SESSION, chain_receiver
+
+        old_tx, old_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        new_tx, new_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        receiver = chain_receiver(new_rx, old_rx, grace_seconds=60.0, grace_packets=2)
+
+        in_flight = [old_tx.encrypt(b"old-%d" % i) for i in range(3)]
+        assert receiver.try_decrypt(new_tx.encrypt(b"new")) == (DECRYPT_OK, b"new")
+        assert receiver.from_previous_session is False
+        assert receiver.try_decrypt(in_flight[0]) == (DECRYPT_OK, b"old-0")
+        assert receiver.from_previous_session is True
+        assert receiver.try_decrypt(in_flight[0]) == (DECRYPT_REPLAY, None)
+        assert receiver.last_error_reason() == "replay"
+        assert receiver.try_decrypt(in_flight[1]) == (DECRYPT_OK, b"old-1")
+        assert receiver.try_decrypt(in_flight[2]) == (DECRYPT_SESSION, None)
+        assert receiver.previous is None and receiver.previous_accepted == 2
+
+    def test_grace_period_expires_and_epochs_are_distinguished(self):
+        from core.aead import GraceReceiver
+
+        session_id = os.urandom(8)
+        old_tx, old_rx = self._session("cs-mlkem768-aesgcm-mldsa65", 0, session_id)
+        new_tx, new_rx = self._session("cs-mlkem768-aesgcm-mldsa65", 1, session_id)
+        now = [100.0]
+        receiver = GraceReceiver(new_rx, old_rx, grace_seconds=1.5, grace_packets=100, clock=lambda: now[0])
+
+        assert receiver.decrypt(old_tx.encrypt(b"epoch0")) == b"epoch0"
+        assert receiver.decrypt(new_tx.encrypt(b"epoch1")) == b"epoch1"
+        now[0] = 101.5
+        assert receiver.decrypt(old_tx.encrypt(b"late")) is None
+        assert receiver.last_error_reason() == "session"
+
+    def test_decrypt_many_routes_like_decrypt(self):
+        from core.aead import chain_receiver
+
+        old_tx, old_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        new_tx, new_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        receiver = chain_receiver(new_rx, old_rx, grace_seconds=60.0, grace_packets=1)
+
+        burst = [new_tx.encrypt(b"new-0"), old_tx.encrypt(b"old-0"), old_tx.encrypt(b"old-1"), new_tx.encrypt(b"new-1")]
+        result = receiver.decrypt_many(burst)
+        assert result.outputs == [b"new-0", b"old-0", None, b"new-1"]
+        assert result.errors == [None, None, "session", None]
+        assert receiver.previous is None and receiver.previous_accepted == 1
+        # Without a previous session the whole burst is one batch call on current.
+        assert receiver.decrypt_many([new_tx.encrypt(b"new-2")]).outputs == [b"new-2"]
+
+    def test_screen_does_not_end_grace_period(self):
+        from core.aead import DECRYPT_OK, DECRYPT_SESSION, GraceReceiver
+
+        old_tx, old_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        new_tx, new_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        now = [100.0]
+        receiver = GraceReceiver(new_rx, old_rx, grace_seconds=1.5, grace_packets=100, clock=lambda: now[0])
+
+        late = old_tx.encrypt(b"late")
+        assert receiver.screen(late, 1024) == DECRYPT_OK
+        now[0] = 101.5
+        # Expired grace: screened against the current session, previous kept until a decrypt.
+        assert receiver.screen(late, 1024) == DECRYPT_SESSION
+        assert receiver.previous is old_rx
+        assert receiver.try_decrypt(late) == (DECRYPT_SESSION, None)
+        assert receiver.previous is None
+
+    def test_chaining_keeps_one_previous_session_and_can_be_disabled(self):
+        from core.aead import chain_receiver
+
+        first_tx, first_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        second_tx, second_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+        third_tx, third_rx = self._session("cs-mlkem768-aesgcm-mldsa65")
+
+        assert chain_receiver(second_rx, first_rx, grace_seconds=0, grace_packets=10) is second_rx
+        active = chain_receiver(second_rx, first_rx, grace_seconds=5, grace_packets=10)
+        active = chain_receiver(third_rx, active, grace_seconds=5, grace_packets=10)
+
+        assert active.previous is second_rx
+        assert active.decrypt(second_tx.encrypt(b"second")) == b"second"
+        assert active.decrypt(first_tx.encrypt(b"first")) is None
@@ -127,4 +127,74 @@ def test_reject_old_beyond_window():
     
     # But packet 37 should still be acceptable (within window)
     plaintext = receiver.decrypt(packets[37])
-    assert plaintext == b"packet37"
\ No newline at end of file
+    assert plaintext == b"packet37"
+
+class _BigIntWindow:
+    """Reference model of the original shift-and-mask replay window."""
+
+    def __init__(self, window):
+        self.window = window
+        self.high = -1
+        self.mask = 0
+
+    def accept(self, seq):
+        if seq > self.high:
+            shift = seq - self.high
+            self.mask = 1 if shift >= self.window else ((self.mask << shift) | 1) & ((1 << self.window) - 1)
+            self.high = seq
+            return True
+        if seq > self.high - self.window:
+            bit = 1 << (self.high - seq)
+            if self.mask & bit:
+                return False
+            self.mask |= bit
+            return True
+        return False
+
+
+def _bare_receiver(window):
+    suite = get_suite("cs-kyber768-aesgcm-dilithium3")
+    ids = AeadIds(*header_ids_for_suite(suite))
+    return Receiver(
+        version=CONFIG["WIRE_VERSION"],
+        ids=ids,
+        session_id=b"\xAA" * 8,
+        epoch=0,
+        key_recv=os.urandom(32),
+        window=window,
+        strict_mode=True,
+    )
+
+
+@pytest.mark.parametrize("window", [64, 100, 1024, 4096])
+def test_ring_window_matches_reference_semantics(window):
+    """Word-ring window must accept exactly what the original bigint window did."""
+    import random
+
+    rng = random.Random(window)
+    receiver = _bare_receiver(window)
+    reference = _BigIntWindow(window)
+    high = 0
+    for _ in range(20000):
+        roll = rng.random()
+        if roll < 0.6:
+            high += rng.randint(0, 3)
+            seq = high
+        elif roll < 0.62:
+            high += rng.randint(0, window * 3)
+            seq = high
+        else:
+            seq = max(0, high - rng.randint(0, window + 70))
+        assert receiver._replay_accept(seq) == reference.accept(seq)
+
+
+def test_check_replay_many_and_reset():
+    receiver = _bare_receiver(1024)
+    assert receiver.check_replay_many([5, 3, 5, 2000, 976, 977, 3]) == [True, True, False, True, False, True, False]
+    with pytest.raises(ReplayError, match="duplicate"):
+        receiver._check_replay(977)
+    with pytest.raises(ReplayError, match="too old"):
+        receiver._check_replay(10)
+
+    receiver.reset_replay()
+    assert receiver.check_replay_many([977, 10, 10]) == [True, True, False]
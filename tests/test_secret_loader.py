@@ -1,9 +1,11 @@
+import os
 from pathlib import Path
 from typing import Optional
 
 import pytest
 
-from core.run_proxy import _build_matrix_secret_loader
+from core.run_proxy import _SuiteKeyCache, _build_matrix_public_loader, _build_matrix_secret_loader
+from core.suites import list_suites
 
 
 class DummySignature:
@@ -81,3 +83,81 @@ def test_loader_raises_when_secret_missing(tmp_path: Path):
 
     with pytest.raises(FileNotFoundError):
         loader({"suite_id": "suite-missing", "sig_name": "sigX"})
+
+
+def _write_secret(root: Path, suite_id: str, secret: bytes) -> Path:
+    suite_dir = root / suite_id
+    suite_dir.mkdir(parents=True, exist_ok=True)
+    path = suite_dir / "gcs_signing.key"
+    path.write_bytes(secret)
+    return path
+
+
+def test_loader_counts_hits_and_evicts_least_recently_used(tmp_path: Path):
+    for name in ("suite-a", "suite-b", "suite-c"):
+        _write_secret(tmp_path, name, name.encode())
+    loader = _build_matrix_secret_loader(
+        suite_id=None,
+        default_secret_path=None,
+        initial_secret=None,
+        signature_cls=DummySignature,
+        matrix_dir=tmp_path,
+        cache=_SuiteKeyCache(max_entries=2),
+    )
+
+    first_a = loader({"suite_id": "suite-a", "sig_name": "sig"})
+    loader({"suite_id": "suite-b", "sig_name": "sig"})
+    assert loader({"suite_id": "suite-a", "sig_name": "sig"}) is first_a
+    loader({"suite_id": "suite-c", "sig_name": "sig"})  # evicts suite-b
+
+    assert loader({"suite_id": "suite-a", "sig_name": "sig"}) is first_a
+    loader({"suite_id": "suite-b", "sig_name": "sig"})
+    stats = loader.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 4
+    assert stats["evictions"] == 2
+    assert stats["entries"] == 2
+
+
+def test_loader_reloads_when_key_file_changes(tmp_path: Path):
+    path = _write_secret(tmp_path, "suite-a", b"old")
+    loader = _build_matrix_secret_loader(
+        suite_id=None,
+        default_secret_path=None,
+        initial_secret=None,
+        signature_cls=DummySignature,
+        matrix_dir=tmp_path,
+        cache=_SuiteKeyCache(revalidate_s=0.0),
+    )
+
+    first = loader({"suite_id": "suite-a", "sig_name": "sig"})
+    assert loader({"suite_id": "suite-a", "sig_name": "sig"}) is first
+
+    path.write_bytes(b"new")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = loader({"suite_id": "suite-a", "sig_name": "sig"})
+    assert reloaded is not first
+    assert reloaded.imported_key == b"new"
+    assert loader.stats()["invalidations"] == 1
+
+
+def test_public_loader_preloads_matrix_suites(tmp_path: Path):
+    suite_ids = list(list_suites())[:2]
+    for sid in suite_ids:
+        (tmp_path / sid).mkdir()
+        (tmp_path / sid / "gcs_signing.pub").write_bytes(sid.encode())
+    (tmp_path / "not-a-suite").mkdir()
+
+    loader = _build_matrix_public_loader(
+        suite_id=None,
+        default_public_path=None,
+        initial_public=None,
+        matrix_dir=tmp_path,
+    )
+    loader.preload().join(timeout=5.0)
+    assert loader.stats()["entries"] == 2
+
+    for sid in suite_ids:
+        assert loader({"suite_id": sid}) == sid.encode()
+    assert loader.stats()["hits"] == 2
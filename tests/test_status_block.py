@@ -0,0 +1,117 @@
+"""Tests for the mmap-backed proxy status block."""
+
+import json
+
+from core import status_block
+from core.status_block import (
+    StatusBlockReader,
+    StatusBlockWriter,
+    block_path,
+    read_live_counters,
+    read_status_block,
+    request_json_export,
+    take_export_request,
+)
+
+
+def test_publish_and_read_round_trip(tmp_path):
+    path = block_path(tmp_path / "gcs_status.json")
+    assert path.name == "gcs_status.json.counters"
+    writer = StatusBlockWriter(path)
+    try:
+        assert read_status_block(path) is None  # nothing published yet
+
+        writer.publish(
+            {"enc_out": 12, "enc_in": 7, "rekeys_ok": 1, "last_rekey_suite": "cs-mlkem512-aesgcm-mldsa44"},
+            suite="cs-mlkem768-aesgcm-mldsa65",
+        )
+        stats = read_status_block(path)
+        assert stats["enc_out"] == 12
+        assert stats["enc_in"] == 7
+        assert stats["drops"] == 0
+        assert stats["rekeys_ok"] == 1
+        assert stats["suite"] == "cs-mlkem768-aesgcm-mldsa65"
+        assert stats["last_rekey_suite"] == "cs-mlkem512-aesgcm-mldsa44"
+        assert stats["ts_ns"] > 0
+    finally:
+        writer.close()
+
+    # The final values stay readable after the proxy closes the block.
+    assert read_status_block(path)["enc_out"] == 12
+
+
+def test_reader_follows_replaced_block(tmp_path):
+    path = block_path(tmp_path / "status.json")
+    reader = StatusBlockReader(path)
+    assert reader.read() is None
+
+    first = StatusBlockWriter(path)
+    first.publish({"enc_out": 5})
+    assert reader.read()["enc_out"] == 5
+    first.publish({"enc_out": 6})
+    assert reader.read()["enc_out"] == 6
+    first.close()
+
+    second = StatusBlockWriter(path)  # a restarted proxy
+    second.publish({"enc_out": 1})
+    assert reader.read()["enc_out"] == 1
+    second.close()
+    reader.close()
+
+
+def test_closed_block_is_not_read_as_live(tmp_path):
+    path = block_path(tmp_path / "status.json")
+    reader = StatusBlockReader(path)
+    writer = StatusBlockWriter(path)
+    writer.publish({"enc_out": 4})
+    assert read_live_counters(reader)["enc_out"] == 4
+    writer.close()
+
+    # A scheduler polling before the next proxy starts must not see the old run as live.
+    assert read_live_counters(reader) is None
+    stats = reader.read()
+    assert stats["stopped"] and stats["enc_out"] == 4
+
+    restarted = StatusBlockWriter(path)
+    restarted.publish({"enc_out": 1})
+    assert read_live_counters(reader)["enc_out"] == 1
+    restarted.close()
+    reader.close()
+
+
+def test_reader_retries_while_write_in_progress(tmp_path, monkeypatch):
+    path = block_path(tmp_path / "status.json")
+    writer = StatusBlockWriter(path)
+    writer.publish({"enc_in": 3})
+    reader = StatusBlockReader(path)
+    assert reader.read()["enc_in"] == 3
+
+    # Freeze the writer mid-update: the sequence is odd, so readers give up.
+    writer._seq += 1
+    status_block.struct.pack_into("<Q", writer._map, 8, writer._seq)
+    assert reader.read(attempts=3) is None
+
+    writer._seq += 1
+    status_block.struct.pack_into("<Q", writer._map, 8, writer._seq)
+    assert reader.read()["enc_in"] == 3
+    reader.close()
+    writer.close()
+
+
+def test_export_request_is_consumed_once(tmp_path):
+    status_path = tmp_path / "status.json"
+    assert not take_export_request(status_path)
+    request_json_export(status_path)
+    assert take_export_request(status_path)
+    assert not take_export_request(status_path)
+
+
+def test_cli_prints_block_as_json(tmp_path, capsys):
+    status_path = tmp_path / "status.json"
+    writer = StatusBlockWriter(block_path(status_path))
+    writer.publish({"ptx_in": 9}, suite="cs-mlkem768-aesgcm-mldsa65")
+    writer.close()
+
+    assert status_block.main([str(status_path)]) == 0
+    assert json.loads(capsys.readouterr().out)["ptx_in"] == 9
+    assert status_block.main([str(tmp_path / "missing.json")]) == 1
@@ -5,6 +5,8 @@ Tests CONFIG completeness, types, and suite metadata without requiring crypto li
 """
 
 import struct
+import subprocess
+import sys
 from unittest.mock import patch
 import os
 
@@ -14,12 +16,14 @@ from core.config import CONFIG, validate_config, _REQUIRED_KEYS
 from core.suites import (
     SUITES,
     build_suite_id,
+    clear_capability_cache,
     enabled_kems,
     enabled_sigs,
     get_suite,
     header_ids_for_suite,
     list_suites,
     suite_bytes_for_hkdf,
+    suite_id_for,
 )
 from tools.auto import gcs_scheduler as scheduler
 
@@ -252,6 +256,20 @@ class TestSuites:
         with pytest.raises(NotImplementedError, match="unknown suite_id: fake-suite"):
             get_suite("fake-suite")
 
+    def test_suite_id_for_matches_linear_scan(self):
+        """suite_id_for should agree with the exhaustive registry scan it replaces."""
+
+        for suite_id in list_suites():
+            suite = get_suite(suite_id)
+            scanned = next(sid for sid, s in SUITES.items() if dict(s) == suite)
+            assert suite_id_for(suite) == scanned == suite_id
+
+        tampered = get_suite("cs-mlkem768-aesgcm-mldsa65")
+        tampered["kem_name"] = "ML-KEM-512"
+        assert suite_id_for(tampered) is None
+        assert suite_id_for({"suite_id": "cs-mlkem768-aesgcm-mldsa65"}) is None
+        assert suite_id_for({"suite_id": ["unhashable"]}) is None
+
     def test_build_suite_id_synonyms(self):
         """build_suite_id should accept synonym inputs."""
 
@@ -274,6 +292,8 @@ class TestSuites:
     def test_enabled_helper_functions(self, monkeypatch):
         """enabled_kems/sigs should surface oqs capability lists."""
 
+        monkeypatch.setenv("PQC_CAPABILITY_CACHE", "")
+        clear_capability_cache()
         monkeypatch.setattr(
             "core.suites._safe_get_enabled_kem_mechanisms",
             lambda: ["ML-KEM-512", "ML-KEM-768"],
@@ -285,6 +305,62 @@ class TestSuites:
 
         assert enabled_kems() == ("ML-KEM-512", "ML-KEM-768")
         assert enabled_sigs() == ("ML-DSA-44", "Falcon-512")
+        clear_capability_cache()
+
+    def test_capability_probes_are_memoised_and_cached_on_disk(self, monkeypatch, tmp_path):
+        """Probes run once per process, and once per liboqs version across processes."""
+
+        import core.suites as suites_mod
+
+        cache_path = tmp_path / "caps.json"
+        calls = []
+
+        def fake_kems():
+            calls.append("kem")
+            return ["ML-KEM-768", "FrodoKEM-640-AES"]
+
+        monkeypatch.setenv("PQC_CAPABILITY_CACHE", str(cache_path))
+        monkeypatch.setattr(suites_mod, "_liboqs_version", lambda: "0.10.0")
+        monkeypatch.setattr(suites_mod, "_safe_get_enabled_kem_mechanisms", fake_kems)
+        clear_capability_cache()
+        try:
+            expected = ("ML-KEM-768", "FrodoKEM-640-AES")
+            assert enabled_kems() == expected
+            assert enabled_kems() == expected
+            assert calls == ["kem"]
+
+            clear_capability_cache()  # as in a fresh process: served from disk
+            assert enabled_kems() == expected
+            assert calls == ["kem"]
+
+            monkeypatch.setattr(suites_mod, "_liboqs_version", lambda: "0.11.0")
+            clear_capability_cache()
+            assert enabled_kems() == expected
+            assert calls == ["kem", "kem"]
+        finally:
+            clear_capability_cache()
+
+    def test_import_is_lazy_and_within_budget(self):
+        """Importing core.suites must not build the registry or probe capabilities."""
+
+        expected = len(list_suites())  # eager build in this process
+        script = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import core.suites as s\n"
+            "elapsed = time.perf_counter() - start\n"
+            "assert 'SUITES' not in vars(s) and s._SUITES is None\n"
+            "assert not s._CAPABILITY_MEMO\n"
+            "assert 'oqs' not in sys.modules and 'cryptography' not in sys.modules\n"
+            f"assert len(s.SUITES) == {expected} and 'SUITES' in vars(s)\n"
+            "print(elapsed)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=root, capture_output=True, text=True, timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+        assert float(result.stdout.strip()) < 0.25
     
     def test_header_version_stability(self):
         """Test header packing stability across all suites."""
@@ -32,6 +32,7 @@ if str(ROOT) not in sys.path:
 from core import suites as suites_mod
 from core.aead import is_aead_available
 from core.config import CONFIG
+from core.status_block import StatusBlockReader, read_live_counters, block_path as status_block_path
 
 
 DRONE_HOST = CONFIG["DRONE_HOST"]
@@ -791,7 +792,15 @@ def read_local_proxy_status() -> dict:
     return read_json(PROXY_SUMMARY_PATH)
 
 
+_PROXY_STATUS_BLOCK = StatusBlockReader(status_block_path(PROXY_STATUS_PATH))
+
+
 def read_local_proxy_counters() -> dict:
+    # Live counters come from the running proxy's status block; the status JSON
+    # only carries counters as of the last handshake/rekey/stop event.
+    live = read_live_counters(_PROXY_STATUS_BLOCK)
+    if live:
+        return live
     status = read_local_proxy_status()
     if isinstance(status, dict):
         counters = status.get("counters")
@@ -24,6 +24,7 @@ if str(ROOT) not in sys.path:
 from core import suites as suites_mod
 from core.aead import is_aead_available
 from core.config import CONFIG
+from core.status_block import StatusBlockReader, read_live_counters, block_path as status_block_path
 
 
 DRONE_HOST = CONFIG["DRONE_HOST"]
@@ -217,7 +218,15 @@ def read_json(path: Path) -> dict:
         return {}
 
 
+_PROXY_STATUS_BLOCK = StatusBlockReader(status_block_path(PROXY_STATUS_PATH))
+
+
 def read_proxy_counters() -> dict:
+    # Live counters come from the running proxy's status block; the status JSON
+    # only carries counters as of the last handshake/rekey/stop event.
+    live = read_live_counters(_PROXY_STATUS_BLOCK)
+    if live:
+        return live
     data = read_json(PROXY_STATUS_PATH)
     counters = data.get("counters") if isinstance(data, dict) else None
     if isinstance(counters, dict) and counters:
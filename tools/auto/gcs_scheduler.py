@@ -95,6 +95,13 @@ ROOT = _ensure_core_importable()
 
 from core import suites as suites_mod
 from core.config import CONFIG
+from core.metrics_endpoint import MetricsSubscriber, supported as metrics_endpoint_supported
+from core.status_block import (
+    StatusBlockReader,
+    read_live_counters,
+    request_json_export,
+    block_path as status_block_path,
+)
 from tools.blackout_metrics import compute_blackout
 from tools.merge_power import extract_power_fields
 from tools.power_utils import PowerSample, align_gcs_to_drone, integrate_energy_mj, load_power_trace
@@ -139,6 +146,11 @@ TELEMETRY_PORT = int(
 
 PROXY_STATUS_PATH = OUTDIR / "gcs_status.json"
 PROXY_SUMMARY_PATH = OUTDIR / "gcs_summary.json"
+# Live counters/events socket of the GCS proxy (core.metrics_endpoint); Unix socket
+# paths are limited to ~108 bytes, so deep output directories fall back to polling.
+PROXY_METRICS_SOCKET: Optional[Path] = OUTDIR / "gcs_metrics.sock"
+if not metrics_endpoint_supported() or len(str(PROXY_METRICS_SOCKET.resolve())) >= 100:
+    PROXY_METRICS_SOCKET = None
 SUMMARY_CSV = OUTDIR / "summary.csv"
 EVENTS_FILENAME = "blaster_events.jsonl"
 BLACKOUT_CSV = OUTDIR / "gcs_blackouts.csv"
@@ -2111,7 +2123,8 @@ def start_gcs_proxy(initial_suite: str) -> tuple[subprocess.Popen, IO[str], Path
             str(PROXY_STATUS_PATH),
             "--json-out",
             str(PROXY_SUMMARY_PATH),
-        ],
+        ]
+        + (["--metrics-socket", str(PROXY_METRICS_SOCKET)] if PROXY_METRICS_SOCKET is not None else []),
         stdin=subprocess.PIPE,
         stdout=log_handle,
         stderr=subprocess.STDOUT,
@@ -2123,12 +2136,47 @@ def start_gcs_proxy(initial_suite: str) -> tuple[subprocess.Popen, IO[str], Path
     return proc, log_handle, log_path
 
 
-def read_proxy_stats_live() -> dict:
+_PROXY_STATUS_BLOCK = StatusBlockReader(status_block_path(PROXY_STATUS_PATH))
+
+
+def read_proxy_stats_live(full: bool = False) -> dict:
+    """Return the running proxy's counters.
+
+    Scalar counters come from the proxy's status block while it is running. With
+    `full`, the proxy is asked for a complete JSON export (primitive timings,
+    handshake and Part B metrics) and this waits briefly for it.
+    """
+
+    if not full:
+        live = read_live_counters(_PROXY_STATUS_BLOCK)
+        if live:
+            return live
+    elif read_live_counters(_PROXY_STATUS_BLOCK) and _read_proxy_status_json().get("status") != "stopped":
+        requested_ns = time.time_ns()
+        try:
+            request_json_export(PROXY_STATUS_PATH)
+        except OSError:
+            pass
+        else:
+            deadline = time.time() + 2.5
+            while time.time() < deadline:
+                js = _read_proxy_status_json()
+                if int(js.get("ts_ns", 0) or 0) >= requested_ns and isinstance(js.get("counters"), dict):
+                    return js["counters"]
+                time.sleep(0.1)
+    return _counters_from_status(_read_proxy_status_json())
+
+
+def _read_proxy_status_json() -> dict:
     try:
         with open(PROXY_STATUS_PATH, encoding="utf-8") as handle:
             js = json.load(handle)
     except Exception:
         return {}
+    return js if isinstance(js, dict) else {}
+
+
+def _counters_from_status(js: dict) -> dict:
     if isinstance(js, dict):
         counters = js.get("counters")
         if isinstance(counters, dict):
@@ -2229,6 +2277,52 @@ def dump_failure_diagnostics(
 
 
 
+def _wait_proxy_rekey_streamed(
+    target_suite: str,
+    baseline_ok: int,
+    baseline_fail: int,
+    *,
+    timeout: float,
+    proc: subprocess.Popen,
+) -> Optional[str]:
+    """Follow the rekey on the proxy's metrics socket; None if it is not reachable.
+
+    The first counters message arrives right after subscribing, so a rekey that
+    finished before the subscription is still seen; events report it immediately.
+    """
+
+    if PROXY_METRICS_SOCKET is None:
+        return None
+    try:
+        subscriber = MetricsSubscriber(PROXY_METRICS_SOCKET, topics=("counters", "events"), interval_s=0.05, timeout=1.0)
+    except OSError:
+        return None
+    deadline = time.time() + timeout
+    with subscriber:
+        while time.time() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError("GCS proxy exited during rekey")
+            try:
+                message = subscriber.recv(timeout=max(0.05, min(0.5, deadline - time.time())))
+            except (ConnectionError, OSError, ValueError):
+                return None  # proxy closed the endpoint; let the caller poll
+            if not message:
+                continue
+            data = message.get("data") or {}
+            if message.get("topic") == "events":
+                if data.get("status") == "rekey_fail":
+                    return "fail"
+                if data.get("status") == "rekey_ok" and data.get("suite") == target_suite:
+                    return "ok"
+            elif message.get("topic") == "counters":
+                if int(data.get("rekeys_fail", 0) or 0) > baseline_fail:
+                    return "fail"
+                last_suite = data.get("last_rekey_suite") or ""
+                if int(data.get("rekeys_ok", 0) or 0) > baseline_ok and (not last_suite or last_suite == target_suite):
+                    return "ok"
+    return "timeout"
+
+
 def wait_proxy_rekey(
     target_suite: str,
     baseline: Dict[str, object],
@@ -2242,6 +2336,10 @@ def wait_proxy_rekey(
     baseline_ok = int(baseline.get("rekeys_ok", 0) or 0)
     baseline_fail = int(baseline.get("rekeys_fail", 0) or 0)
 
+    streamed = _wait_proxy_rekey_streamed(target_suite, baseline_ok, baseline_fail, timeout=timeout, proc=proc)
+    if streamed is not None:
+        return streamed
+
     while time.time() - start < timeout:
         if proc.poll() is not None:
             raise RuntimeError("GCS proxy exited during rekey")
@@ -2509,6 +2607,26 @@ def activate_suite(
     return elapsed_ms, mark_ns, rekey_complete_ns
 
 
+def hint_next_suite(gcs: subprocess.Popen, suite: Optional[str]) -> None:
+    """Send a prefetch hint so both proxies preload handshake material for `suite`."""
+
+    if not suite or gcs.poll() is not None or gcs.stdin is None:
+        return
+    try:
+        gcs.stdin.write(f"prefetch {suite}\n")
+        gcs.stdin.flush()
+    except (BrokenPipeError, OSError) as exc:
+        print(f"[WARN] prefetch hint for {suite} failed: {exc}", file=sys.stderr)
+
+
+def _next_scheduled_suite(suites: List[str], idx: int, pass_index: int, passes: int) -> Optional[str]:
+    if idx + 1 < len(suites):
+        return suites[idx + 1]
+    if pass_index + 1 < passes and suites:
+        return suites[0]
+    return None
+
+
 
 
 def run_suite(
@@ -2533,6 +2651,7 @@ def run_suite(
     telemetry_collector: Optional["TelemetryCollector"] = None,
     gcs_log_handle: Optional[IO[str]] = None,
     gcs_log_path: Optional[Path] = None,
+    next_suite: Optional[str] = None,
 ) -> dict:
     rekey_duration_ms, rekey_mark_ns, rekey_complete_ns = activate_suite(
         gcs,
@@ -2541,6 +2660,9 @@ def run_suite(
         gcs_log_handle=gcs_log_handle,
         gcs_log_path=gcs_log_path,
     )
+    # The next switch is known now; let both proxies prepare it during this run.
+    if next_suite != suite:
+        hint_next_suite(gcs, next_suite)
 
     effective_sample_every, effective_min_delay = _compute_sampling_params(
         duration_s,
@@ -2720,7 +2842,7 @@ def run_suite(
         print(f"[{ts()}] ===== TRAFFIC: STOP | suite={suite} =====")
 
     snapshot_proxy_artifacts(suite)
-    proxy_stats = read_proxy_stats_live() or read_proxy_summary()
+    proxy_stats = read_proxy_stats_live(full=True) or read_proxy_summary()
     if not isinstance(proxy_stats, dict):
         proxy_stats = {}
     handshake_metrics_payload: Dict[str, object] = {}
@@ -4923,6 +5045,7 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
                         gcs_log_handle=log_handle,
                         gcs_log_path=gcs_log_path,
                     )
+                    hint_next_suite(gcs_proc, _next_scheduled_suite(suites, idx, 0, 1))
                 except SuiteSkipped as exc:
                     print(f"[WARN] skipping suite {suite}: {exc}", file=sys.stderr)
                     if inter_gap > 0 and idx < len(suites) - 1:
@@ -4989,6 +5112,7 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
                             telemetry_collector=telemetry_collector,
                             gcs_log_handle=log_handle,
                             gcs_log_path=gcs_log_path,
+                            next_suite=_next_scheduled_suite(suites, idx, pass_index, passes),
                         )
                     except SuiteSkipped as exc:
                         print(f"[WARN] skipping suite {suite}: {exc}", file=sys.stderr)
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from core.latency_histogram import STANDARD_PERCENTILES, LatencyHistogram
+
 
 @dataclass(frozen=True)
 class ProxyCounters:
@@ -55,6 +57,12 @@ class ProxyCounters:
             return last_suite
         return None
 
+    @property
+    def last_rekey_swap_ns(self) -> int:
+        """Return how long the last rekey blocked the data plane while swapping sessions."""
+
+        return int(self.counters.get("last_rekey_swap_ns", 0) or 0)
+
     def ensure_rekey(self, expected_suite: str) -> None:
         """Validate that at least one rekey succeeded to ``expected_suite``.
 
@@ -112,6 +120,14 @@ class ProxyCounters:
             "aead_decrypt_avg_ms",
             "aead_encrypt_ms",
             "aead_decrypt_ms",
+            "aead_encrypt_p50_ms",
+            "aead_encrypt_p90_ms",
+            "aead_encrypt_p99_ms",
+            "aead_encrypt_p999_ms",
+            "aead_decrypt_p50_ms",
+            "aead_decrypt_p90_ms",
+            "aead_decrypt_p99_ms",
+            "aead_decrypt_p999_ms",
             "pub_key_size_bytes",
             "ciphertext_size_bytes",
             "sig_size_bytes",
@@ -174,6 +190,62 @@ class ProxyCounters:
         total_ns = stats.get("total_ns", 0)
         return int(total_ns) // int(count)
 
+    @property
+    def latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """Return per-primitive / per-drop-reason latency histograms recorded by the proxy."""
+
+        payload = self.counters.get("latency_histograms")
+        if not isinstance(payload, dict):
+            return {}
+
+        histograms: Dict[str, LatencyHistogram] = {}
+        for name, stats in payload.items():
+            if not isinstance(name, str) or not isinstance(stats, dict):
+                continue
+            histogram = LatencyHistogram.from_dict(stats)
+            if histogram is not None:
+                histograms[name] = histogram
+        return histograms
+
+    def latency_percentile_ns(self, name: str, percentile: float) -> Optional[int]:
+        """Return the ``percentile`` (0-100) duration in nanoseconds for histogram ``name``.
+
+        Returns ``None`` when the histogram is missing or empty.
+        """
+
+        histogram = self.latency_histograms.get(name)
+        if histogram is None or histogram.total_count <= 0:
+            return None
+        return histogram.value_at_percentile(percentile)
+
+    def latency_percentiles(self, name: str) -> Dict[str, int]:
+        """Return ``p50_ns``/``p90_ns``/``p99_ns``/``p999_ns`` for histogram ``name`` (empty if absent)."""
+
+        histogram = self.latency_histograms.get(name)
+        if histogram is None or histogram.total_count <= 0:
+            return {}
+        return histogram.percentiles(STANDARD_PERCENTILES)
+
+    def p50_ns(self, name: str) -> Optional[int]:
+        """Return the 50th percentile duration (ns) for histogram ``name``."""
+
+        return self.latency_percentile_ns(name, 50.0)
+
+    def p90_ns(self, name: str) -> Optional[int]:
+        """Return the 90th percentile duration (ns) for histogram ``name``."""
+
+        return self.latency_percentile_ns(name, 90.0)
+
+    def p99_ns(self, name: str) -> Optional[int]:
+        """Return the 99th percentile duration (ns) for histogram ``name``."""
+
+        return self.latency_percentile_ns(name, 99.0)
+
+    def p999_ns(self, name: str) -> Optional[int]:
+        """Return the 99.9th percentile duration (ns) for histogram ``name``."""
+
+        return self.latency_percentile_ns(name, 99.9)
+
     def get_part_b_metric(self, key: str, default: Optional[float] = None) -> Optional[float]:
         """Convenience accessor for flattened Part B metrics as floats."""
 